@@ -1,15 +1,50 @@
+from typing import get_args
+
 from fastapi import APIRouter
 
+from app.core.config import Settings
+
 from .dashboard import router as dashboard_router
 from .feedback import router as feedback_router
+from .maintenance import inference_router as maintenance_inference_router
+from .maintenance import router as maintenance_router
+from .script import inference_router as script_inference_router
 from .script import router as script_router
+from .submit import inference_router as submit_inference_router
 from .submit import router as submit_router
 
-api_router = APIRouter()
+SERVER_ROLES = get_args(Settings.model_fields["server_role"].annotation)
+
+
+def build_api_router(role: str = "all") -> APIRouter:
+    """
+    서버 역할에 맞는 라우터만 포함한 API 라우터를 만듭니다.
+
+    - api: 스크립트/피드백 조회, 제출 작업 상태, 대시보드, 재채점
+    - inference: 스크립트 등록(임베딩), 음성 제출(STT), 인덱스 관리와
+      비동기 제출의 Location이 가리키는 작업 상태 조회
+    - all: 전체
+    """
+    if role not in SERVER_ROLES:
+        raise ValueError(f"Unknown server role: {role}")
+
+    api_router = APIRouter()
+
+    if role in ("api", "all"):
+        api_router.include_router(script_router)
+        api_router.include_router(feedback_router)
+        api_router.include_router(dashboard_router)
+        api_router.include_router(maintenance_router)
+
+    # 작업 상태 조회는 모든 역할에서 제공
+    api_router.include_router(submit_router)
+
+    if role in ("inference", "all"):
+        api_router.include_router(script_inference_router)
+        api_router.include_router(submit_inference_router)
+        api_router.include_router(maintenance_inference_router)
+
+    return api_router
 
-api_router.include_router(script_router)
-api_router.include_router(submit_router)
-api_router.include_router(feedback_router)
-api_router.include_router(dashboard_router)
 
-__all__ = ["api_router"]
+__all__ = ["SERVER_ROLES", "build_api_router"]
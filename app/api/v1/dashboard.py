@@ -1,18 +1,27 @@
-from collections import Counter
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
+from app.models.word_error import WordErrorType
 from app.repositories.feedback_repository import FeedbackRepository
-from app.schemas.dashboard import DashboardStats
+from app.schemas.dashboard import (
+    DashboardStats,
+    SilenceTrimStats,
+    TranscriptionCacheStats,
+    WordErrorCount,
+)
+from app.services.silence_trimmer import silence_trimmer
+from app.services.transcription_cache import transcription_cache
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get("/dashboard", response_model=DashboardStats)
 async def get_dashboard(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     관리자 대시보드용 전체 통계를 가져옵니다.
@@ -28,22 +37,49 @@ async def get_dashboard(
     total_submissions = await repo.get_total_submissions()
     average_score = await repo.get_average_score()
 
-    # 누락된 단어 분석을 위해 모든 피드백 가져오기
-    all_feedbacks = await repo.get_all()
-
-    # 누락된 단어 카운트
-    all_missing_words = []
-    for feedback in all_feedbacks:
-        if feedback.missing_words:
-            words = [word.strip() for word in feedback.missing_words.split(",")]
-            all_missing_words.extend(words)
-
-    # 가장 많이 누락된 단어 상위 10개 가져오기
-    word_counter = Counter(all_missing_words)
-    top_mistakes = [word for word, count in word_counter.most_common(10)]
+    # 가장 많이 누락된 단어 상위 10개 가져오기 (제출 시 갱신되는 집계 테이블)
+    top_mistakes = await repo.get_top_mistakes(10)
 
     return DashboardStats(
         total_submissions=total_submissions,
         average_score=average_score,
         top_mistakes=top_mistakes,
     )
+
+
+@router.get("/word-errors", response_model=List[WordErrorCount])
+async def get_word_errors(
+    script_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    error_type: Optional[WordErrorType] = None,
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    단어별 오류 횟수를 많은 순으로 가져옵니다.
+
+    예: `?script_id=3&since=2024-01-01T00:00:00&error_type=missing`
+    """
+    rows = await FeedbackRepository(db).get_top_error_words(
+        script_id=script_id,
+        since=since,
+        error_type=error_type.value if error_type else None,
+        limit=limit,
+    )
+    return [WordErrorCount(word=word, count=count) for word, count in rows]
+
+
+@router.get("/cache/transcriptions", response_model=TranscriptionCacheStats)
+async def get_transcription_cache_stats():
+    """
+    STT 결과 캐시의 적중/실패 통계를 가져옵니다. (현재 워커 프로세스 기준)
+    """
+    return transcription_cache.stats()
+
+
+@router.get("/vad", response_model=SilenceTrimStats)
+async def get_silence_trim_stats():
+    """
+    STT 전 무음 제거로 줄어든 오디오 길이를 가져옵니다. (현재 워커 프로세스 기준)
+    """
+    return silence_trimmer.stats()
@@ -1,17 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.api.v1.pagination import ndjson_response, page_size, split_page, wants_ndjson
+from app.core.database import get_read_db
 from app.repositories.feedback_repository import FeedbackRepository
-from app.schemas.feedback import FeedbackResponse
+from app.schemas.feedback import FeedbackPage, FeedbackResponse
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
 
+@router.get("", response_model=FeedbackPage)
+async def get_feedbacks(
+    request: Request,
+    script_id: Optional[int] = None,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    피드백 목록을 ID(제출 순서) 기준 키셋 페이지네이션으로 가져옵니다.
+
+    - `script_id`: 특정 스크립트의 피드백만 조회
+    - `cursor`: 이전 응답의 `next_cursor` (첫 페이지는 생략)
+    - `limit`: 페이지 크기 (기본 PAGE_SIZE, 최대 MAX_PAGE_SIZE)
+    - `Accept: application/x-ndjson`: cursor 이후 전체를 한 줄에 하나씩 스트리밍
+    """
+    if wants_ndjson(request):
+        return ndjson_response(
+            lambda session: FeedbackRepository(session).stream(script_id, cursor),
+            FeedbackResponse,
+        )
+
+    limit = page_size(limit)
+    feedbacks = await FeedbackRepository(db).get_page(script_id, cursor, limit + 1)
+    items, next_cursor = split_page(feedbacks, limit)
+    return FeedbackPage(items=items, next_cursor=next_cursor)
+
+
 @router.get("/{feedback_id}", response_model=FeedbackResponse)
 async def get_feedback(
     feedback_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     특정 제출에 대한 상세 피드백을 가져옵니다.
@@ -0,0 +1,108 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db, get_read_db
+from app.models.rescore_run import RescoreRun, RescoreStatus
+from app.repositories.rescore_run_repository import RescoreRunRepository
+from app.repositories.script_repository import ScriptRepository
+from app.schemas.maintenance import IndexRebuildResult, IndexReport, RescoreRunResponse
+from app.services.embedding_service import embedding_service
+from app.services.rescoring_service import (
+    RescoreInProgressError,
+    create_rescore_run,
+    start_rescore,
+)
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+# 모델/인덱스가 필요한 엔드포인트 (server_role이 inference 또는 all일 때만 등록)
+inference_router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@inference_router.post("/index/rebuild", response_model=IndexRebuildResult)
+async def rebuild_index(
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    저장된 모든 임베딩으로 FAISS 인덱스를 다시 구축합니다. (유지보수용)
+    """
+    repo = ScriptRepository(db)
+    indexed = await embedding_service.rebuild_index(repo)
+    return IndexRebuildResult(indexed_scripts=indexed)
+
+
+@inference_router.get("/index/report", response_model=IndexReport)
+async def get_index_report(
+    k: int = Query(10, ge=1, le=100),
+    queries: int = Query(200, ge=1, le=10_000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    현재 FAISS 인덱스의 recall@k와 검색 지연을 정확한 flat 인덱스와 비교합니다.
+    """
+    repo = ScriptRepository(db)
+    try:
+        return await embedding_service.index_report(repo, k=k, num_queries=queries)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def _accepted(request: Request, run: RescoreRun) -> JSONResponse:
+    return JSONResponse(
+        status_code=202,
+        content=RescoreRunResponse.model_validate(run).model_dump(mode="json"),
+        headers={"Location": str(request.url_for("get_rescore_run", run_id=run.id))},
+    )
+
+
+@router.post("/rescore", status_code=202, response_model=RescoreRunResponse)
+async def start_rescore_run(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    저장된 모든 피드백을 현재 평가 규칙으로 다시 채점합니다. (STT는 다시 실행하지 않음)
+
+    즉시 202와 실행 ID를 반환하고 백그라운드에서 처리합니다.
+    """
+    run = await create_rescore_run(db)
+    start_rescore(run.id)
+    return _accepted(request, run)
+
+
+@router.post(
+    "/rescore/{run_id}/resume", status_code=202, response_model=RescoreRunResponse
+)
+async def resume_rescore_run(
+    run_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    중단되거나 실패한 재채점을 마지막 체크포인트부터 이어서 실행합니다.
+    """
+    run = await RescoreRunRepository(db).get_by_id(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Rescore run not found")
+    if run.status == RescoreStatus.DONE.value:
+        raise HTTPException(status_code=409, detail="Rescore run already finished")
+
+    try:
+        start_rescore(run.id)
+    except RescoreInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _accepted(request, run)
+
+
+@router.get("/rescore/{run_id}", response_model=RescoreRunResponse)
+async def get_rescore_run(
+    run_id: str,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    재채점 진행 상황(처리 수/전체 수, 초당 처리 수)을 가져옵니다.
+    """
+    run = await RescoreRunRepository(db).get_by_id(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Rescore run not found")
+    return run
@@ -0,0 +1,63 @@
+from typing import AsyncIterator, Callable, List, Optional, Tuple, Type
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import ReadSessionLocal
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Accept 헤더로 NDJSON 스트리밍 응답을 요청했는지 확인합니다."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def page_size(limit: Optional[int]) -> int:
+    """요청한 페이지 크기를 설정된 기본값/최대값에 맞춥니다."""
+    return min(limit or settings.page_size, settings.max_page_size)
+
+
+def split_page(rows: List, limit: int) -> Tuple[List, Optional[int]]:
+    """
+    limit + 1개를 조회한 결과를 현재 페이지와 다음 커서로 나눕니다.
+
+    Returns:
+        (페이지 항목, 다음 페이지 커서 또는 None)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, rows[-1].id
+
+
+def ndjson_response(
+    open_stream: Callable[[AsyncSession], AsyncIterator],
+    schema: Type[BaseModel],
+) -> StreamingResponse:
+    """
+    DB에서 청크 단위로 읽은 행을 한 줄에 하나씩 JSON으로 스트리밍합니다.
+
+    요청 의존성의 세션은 응답 전송 전에 닫히므로 스트림 전용 세션을 엽니다.
+    stream_chunk_size개 단위로 모아 전송하여 행마다 소켓 쓰기를 하지 않습니다.
+
+    Args:
+        open_stream: 세션을 받아 행을 비동기로 반환하는 함수
+        schema: 각 행을 직렬화할 응답 스키마
+    """
+
+    async def body():
+        async with ReadSessionLocal() as db:
+            lines = []
+            async for row in open_stream(db):
+                lines.append(schema.model_validate(row).model_dump_json())
+                if len(lines) >= settings.stream_chunk_size:
+                    yield "\n".join(lines) + "\n"
+                    lines = []
+            if lines:
+                yield "\n".join(lines) + "\n"
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
@@ -1,18 +1,29 @@
-from typing import List
+import json
+from typing import Any, AsyncIterator, List, Optional
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.api.v1.pagination import ndjson_response, page_size, split_page, wants_ndjson
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
 from app.repositories.script_repository import ScriptRepository
-from app.schemas.script import ScriptCreate, ScriptResponse
+from app.schemas.script import (
+    ScriptBulkResult,
+    ScriptCreate,
+    ScriptPage,
+    ScriptResponse,
+)
 from app.services.embedding_service import embedding_service
 
 router = APIRouter(prefix="/script", tags=["script"])
+# 모델/인덱스가 필요한 엔드포인트 (server_role이 inference 또는 all일 때만 등록)
+inference_router = APIRouter(prefix="/script", tags=["script"])
 
 
-@router.post("", response_model=ScriptResponse, status_code=201)
+@inference_router.post("", response_model=ScriptResponse, status_code=201)
 async def create_script(
     script_data: ScriptCreate,
     db: AsyncSession = Depends(get_db),
@@ -29,28 +40,140 @@ async def create_script(
     # 임베딩과 함께 스크립트 생성
     script = await repo.create(text=script_data.text, embedding=embedding_bytes)
 
-    # 새 스크립트로 FAISS 인덱스 재구축
-    await rebuild_faiss_index(db)
+    # 새 스크립트만 FAISS 인덱스에 추가 (디스크 저장은 지연 후 일괄 처리)
+    await embedding_service.add([embedding_vector], [script.id])
 
     return script
 
 
-@router.get("", response_model=List[ScriptResponse])
-async def get_scripts(
+@inference_router.post("/bulk", response_model=ScriptBulkResult, status_code=201)
+async def create_scripts_bulk(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    등록된 모든 스크립트를 가져옵니다.
+    여러 문장을 한 번에 등록합니다.
+
+    - JSON 배열: `["문장", ...]` 또는 `[{"text": "문장"}, ...]`
+    - NDJSON 스트림 (`Content-Type: application/x-ndjson`): 한 줄에 하나의 항목
+
+    청크 단위로 임베딩을 일괄 생성하고 INSERT한 뒤, FAISS 인덱스는 마지막에
+    한 번만 갱신합니다.
     """
     repo = ScriptRepository(db)
-    scripts = await repo.get_all()
-    return scripts
+    script_ids: List[int] = []
+    embeddings: List[np.ndarray] = []
+
+    try:
+        async for texts in _iter_bulk_texts(request):
+            chunk_embeddings = await embedding_service.generate_embeddings(texts)
+            chunk_ids = await repo.bulk_create(
+                texts, [embedding.tobytes() for embedding in chunk_embeddings]
+            )
+            script_ids.extend(chunk_ids)
+            embeddings.append(chunk_embeddings)
+    finally:
+        # 실패하더라도 이미 커밋된 청크는 인덱스에 반영
+        if script_ids:
+            await embedding_service.add(np.concatenate(embeddings), script_ids)
+
+    return ScriptBulkResult(created=len(script_ids))
+
+
+def _parse_bulk_item(item: Any) -> str:
+    """대량 등록 항목 하나를 검증하고 문장을 반환합니다."""
+    try:
+        if isinstance(item, str):
+            return ScriptCreate(text=item).text
+        return ScriptCreate.model_validate(item).text
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+
+
+async def _iter_bulk_texts(request: Request) -> AsyncIterator[List[str]]:
+    """요청 본문에서 문장을 읽어 bulk_import_chunk_size 단위로 반환합니다."""
+    chunk_size = settings.bulk_import_chunk_size
+    texts: List[str] = []
+
+    if "ndjson" in request.headers.get("content-type", ""):
+        buffer = b""
+        async for data in request.stream():
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    texts.append(_parse_bulk_item(json.loads(line)))
+                except json.JSONDecodeError as e:
+                    raise HTTPException(status_code=422, detail=f"Invalid NDJSON: {e}")
+                if len(texts) >= chunk_size:
+                    yield texts
+                    texts = []
+
+        if buffer.strip():
+            try:
+                texts.append(_parse_bulk_item(json.loads(buffer)))
+            except json.JSONDecodeError as e:
+                raise HTTPException(status_code=422, detail=f"Invalid NDJSON: {e}")
+    else:
+        try:
+            items = await request.json()
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=422, detail=f"Invalid JSON: {e}")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=422, detail="Expected a JSON array")
+
+        # 배열은 이미 메모리에 있으므로 저장 전에 전체를 검증
+        parsed = [_parse_bulk_item(item) for item in items]
+        for start in range(0, len(parsed), chunk_size):
+            yield parsed[start : start + chunk_size]
+
+    if texts:
+        yield texts
+
+
+@router.get("", response_model=List[ScriptResponse])
+async def get_scripts(
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    등록된 모든 스크립트를 ID(등록 순서)대로 가져옵니다.
+
+    - `Accept: application/x-ndjson`: 한 번에 모으지 않고 한 줄에 하나씩 스트리밍
+    - 페이지 단위 조회는 `GET /script/page`
+    """
+    if wants_ndjson(request):
+        return ndjson_response(
+            lambda session: ScriptRepository(session).stream(), ScriptResponse
+        )
+
+    return await ScriptRepository(db).get_all()
+
+
+@router.get("/page", response_model=ScriptPage)
+async def get_script_page(
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    등록된 스크립트를 ID(등록 순서) 기준 키셋 페이지네이션으로 가져옵니다.
+
+    - `cursor`: 이전 응답의 `next_cursor` (첫 페이지는 생략)
+    - `limit`: 페이지 크기 (기본 PAGE_SIZE, 최대 MAX_PAGE_SIZE)
+    """
+    limit = page_size(limit)
+    scripts = await ScriptRepository(db).get_page(cursor, limit + 1)
+    items, next_cursor = split_page(scripts, limit)
+    return ScriptPage(items=items, next_cursor=next_cursor)
 
 
 @router.get("/{script_id}", response_model=ScriptResponse)
 async def get_script(
     script_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     ID로 특정 스크립트를 가져옵니다.
@@ -62,27 +185,3 @@ async def get_script(
         raise HTTPException(status_code=404, detail="Script not found")
 
     return script
-
-
-async def rebuild_faiss_index(db: AsyncSession):
-    """
-    임베딩이 있는 모든 스크립트로부터 FAISS 인덱스를 재구축합니다.
-    """
-    repo = ScriptRepository(db)
-    scripts = await repo.get_all_with_embeddings()
-
-    if not scripts:
-        return
-
-    embeddings = []
-    script_ids = []
-
-    for script in scripts:
-        if script.embedding:
-            embedding_array = np.frombuffer(script.embedding, dtype=np.float32)
-            embeddings.append(embedding_array)
-            script_ids.append(script.id)
-
-    if embeddings:
-        embedding_service.build_index(embeddings, script_ids)
-        embedding_service.save_index()
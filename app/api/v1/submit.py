@@ -1,19 +1,57 @@
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+import asyncio
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import (
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    get_db,
+    get_read_db,
+)
 from app.repositories.feedback_repository import FeedbackRepository
 from app.repositories.script_repository import ScriptRepository
-from app.schemas.feedback import SubmitResponse
-from app.services.feedback_service import FeedbackService
+from app.repositories.submission_job_repository import SubmissionJobRepository
+from app.schemas.feedback import StreamPartialResponse, SubmitResponse
+from app.schemas.job import SubmissionJobResponse
+from app.services.feedback_service import FeedbackService, FileTooLargeError
+from app.services.speech_recognizer import STTBusyError, STTTimeoutError
+from app.services.streaming_service import RecordingTooLongError, StreamingEvaluation
+from app.services.submission_job_service import (
+    SubmissionJobService,
+    run_submission_job,
+    stream_job_events,
+)
 
 router = APIRouter(prefix="/submit", tags=["submit"])
+# 모델/인덱스가 필요한 엔드포인트 (server_role이 inference 또는 all일 때만 등록)
+inference_router = APIRouter(prefix="/submit", tags=["submit"])
 
 
-@router.post("", response_model=SubmitResponse)
+@inference_router.post(
+    "",
+    response_model=SubmitResponse,
+    responses={202: {"model": SubmissionJobResponse}},
+)
 async def submit_audio(
+    request: Request,
+    background_tasks: BackgroundTasks,
     script_id: int = Form(...),
     audio: UploadFile = File(...),
+    async_mode: bool = Form(False),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -21,6 +59,7 @@ async def submit_audio(
 
     - **script_id**: 평가할 스크립트 ID
     - **audio**: 오디오 파일 (WAV, MP3 등)
+    - **async_mode**: true이면 즉시 202와 작업 ID를 반환하고 백그라운드에서 처리
 
     반환:
     - STT로부터 인식된 텍스트
@@ -33,10 +72,153 @@ async def submit_audio(
     feedback_repo = FeedbackRepository(db)
     feedback_service = FeedbackService(script_repo, feedback_repo)
 
+    if async_mode:
+        job_service = SubmissionJobService(
+            SubmissionJobRepository(db), feedback_service
+        )
+        try:
+            job = await job_service.create_job(script_id, audio)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except FileTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+
+        background_tasks.add_task(run_submission_job, job.id)
+        return JSONResponse(
+            status_code=202,
+            content=SubmissionJobResponse.model_validate(job).model_dump(mode="json"),
+            headers={
+                "Location": str(request.url_for("get_submission_job", job_id=job.id))
+            },
+        )
+
     try:
         result = await feedback_service.process_submission(script_id, audio)
         return SubmitResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except STTBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except STTTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing audio: {str(e)}")
+
+
+@inference_router.websocket("/stream")
+async def stream_audio(
+    websocket: WebSocket,
+    script_id: int,
+    sample_rate: int = 16000,
+    encoding: str = "s16le",
+):
+    """
+    말하는 동안 오디오를 받아 부분 인식 결과와 중간 평가를 보내는 WebSocket입니다.
+
+    - 바이너리 메시지: 헤더 없는 모노 PCM 조각 (`encoding`: s16le 또는 f32le)
+    - 텍스트 메시지 `end`: 녹음 종료
+
+    stream_partial_interval마다 `{"type": "partial", ...}`를 보내고, 종료하면
+    녹음을 저장해 /submit과 같은 방식으로 평가한 뒤 `{"type": "final", ...}`를
+    보냅니다. 종료 전에 연결이 끊기면 저장하지 않습니다.
+
+    스트림이 열려 있는 동안 단일 쓰기 연결을 점유하지 않도록, 스크립트는 읽기
+    세션으로 가져오고 쓰기 세션은 최종 평가를 저장할 때만 엽니다.
+    """
+    await websocket.accept()
+
+    try:
+        async with ReadSessionLocal() as db:
+            feedback_service = FeedbackService(
+                ScriptRepository(db), FeedbackRepository(db)
+            )
+            script = await feedback_service.get_script(script_id)
+        session = StreamingEvaluation(
+            script, feedback_service.recognizer, sample_rate, encoding
+        )
+    except ValueError as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1008)
+        return
+
+    async def receive():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes") is not None:
+                session.add_chunk(message["bytes"])
+            elif (message.get("text") or "").strip() == "end":
+                return
+
+    receiver = asyncio.create_task(receive())
+    try:
+        # 받는 동안 일정 간격으로 부분 결과 전송
+        while not receiver.done():
+            await asyncio.wait({receiver}, timeout=settings.stream_partial_interval)
+            if session.has_new_audio():
+                partial = await session.partial()
+                if partial is not None:
+                    await websocket.send_json(
+                        {
+                            "type": "partial",
+                            **StreamPartialResponse(**partial).model_dump(),
+                        }
+                    )
+        await receiver
+
+        audio_path = await feedback_service.save_recording(session.finish())
+        async with AsyncSessionLocal() as db:
+            result = await FeedbackService(
+                ScriptRepository(db), FeedbackRepository(db)
+            ).evaluate_submission(script, audio_path)
+        await websocket.send_json(
+            {"type": "final", **SubmitResponse(**result).model_dump(mode="json")}
+        )
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    except RecordingTooLongError as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1009)
+    except STTBusyError as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1013)
+    except Exception as e:
+        await websocket.send_json(
+            {"type": "error", "detail": f"Error processing audio: {str(e)}"}
+        )
+        await websocket.close(code=1011)
+    finally:
+        receiver.cancel()
+
+
+@router.get("/jobs/{job_id}", response_model=SubmissionJobResponse)
+async def get_submission_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    비동기 제출 작업의 상태와 결과를 가져옵니다.
+    """
+    repo = SubmissionJobRepository(db)
+    job = await repo.get_by_id(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_submission_job(job_id: str):
+    """
+    비동기 제출 작업의 상태 변화를 Server-Sent-Events로 전달합니다.
+    """
+    return StreamingResponse(
+        stream_job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,275 @@
+"""
+관리용 명령어 모음입니다.
+
+사용법:
+    python -m app.cli rebuild-index
+    python -m app.cli index-report --k 10 --queries 200
+    python -m app.cli quantization-report --k 10 --queries 200
+    python -m app.cli backfill-word-counts
+    python -m app.cli migrate-word-errors
+    python -m app.cli rescore [--resume RUN_ID] [--workers 4] [--chunk-size 500]
+    python -m app.cli import-benchmark [--repeat 3] [--max-seconds 2.5]
+    python -m app.cli prompt-report --limit 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, init_db
+
+
+async def rebuild_index(args: argparse.Namespace):
+    """저장된 모든 임베딩으로 FAISS 인덱스를 다시 구축합니다."""
+    from app.repositories.script_repository import ScriptRepository
+    from app.services.embedding_service import embedding_service
+
+    async with AsyncSessionLocal() as db:
+        indexed = await embedding_service.rebuild_index(ScriptRepository(db))
+    print(f"Indexed {indexed} scripts")
+
+
+async def index_report(args: argparse.Namespace):
+    """현재 인덱스의 recall/지연을 정확한 flat 인덱스와 비교해 출력합니다."""
+    from app.repositories.script_repository import ScriptRepository
+    from app.services.embedding_service import embedding_service
+
+    embedding_service.load_index()
+    async with AsyncSessionLocal() as db:
+        report = await embedding_service.index_report(
+            ScriptRepository(db), k=args.k, num_queries=args.queries
+        )
+    for key, value in report.items():
+        print(f"{key}: {value}")
+
+
+async def quantization_report(args: argparse.Namespace):
+    """int8 양자화 임베딩 모델의 속도/이웃 겹침을 fp32 모델과 비교해 출력합니다."""
+    from app.repositories.script_repository import ScriptRepository
+    from app.services.embedding_service import embedding_service
+
+    async with AsyncSessionLocal() as db:
+        report = await embedding_service.quantization_report(
+            ScriptRepository(db), k=args.k, num_queries=args.queries
+        )
+    for key, value in report.items():
+        print(f"{key}: {value}")
+
+
+async def backfill_word_counts(args: argparse.Namespace):
+    """기존 피드백으로부터 누락 단어 집계 테이블을 다시 계산합니다."""
+    from app.services.rescoring_service import rebuild_mistake_counts
+
+    words = await rebuild_mistake_counts()
+    print(f"Counted {words} distinct missing words")
+
+
+async def migrate_word_errors(args: argparse.Namespace):
+    """기존 피드백을 단어별 오류 테이블로 옮깁니다."""
+    from app.repositories.feedback_repository import FeedbackRepository
+
+    async with AsyncSessionLocal() as db:
+        rows = await FeedbackRepository(db).migrate_word_errors()
+    print(f"Created {rows} word error rows")
+
+
+async def rescore(args: argparse.Namespace):
+    """저장된 피드백을 현재 평가 규칙으로 다시 채점합니다."""
+    from app.services.rescoring_service import create_rescore_run, run_rescore
+
+    if args.resume:
+        run_id = args.resume
+    else:
+        async with AsyncSessionLocal() as db:
+            run_id = (await create_rescore_run(db)).id
+    print(f"Rescore run {run_id}")
+
+    def on_progress(processed: int, total: int, rate: float):
+        print(f"{processed}/{total} feedbacks ({rate:.1f} rows/s)")
+
+    run = await run_rescore(
+        run_id,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        on_progress=on_progress,
+    )
+    if run is None:
+        print(f"Rescore run {run_id} not found")
+    elif run.error:
+        print(f"Rescore run {run_id} {run.status}: {run.error}")
+    else:
+        print(f"Rescore run {run_id} {run.status}")
+
+
+async def prompt_report(args: argparse.Namespace):
+    """스크립트 조건부 디코딩과 기본 디코딩의 점수/지연을 최근 녹음으로 비교합니다."""
+    from app.repositories.feedback_repository import FeedbackRepository
+    from app.services.stt_service import STTService
+
+    async with AsyncSessionLocal() as db:
+        recordings = await FeedbackRepository(db).get_recent_recordings(args.limit)
+    samples = [(path, text) for path, text in recordings if os.path.exists(path)]
+    print(f"Comparing {len(samples)} of {len(recordings)} recordings")
+
+    # 워커 풀 없이 현재 프로세스에서 모델을 로드해 두 모드를 같은 모델로 비교
+    stt = STTService(quantize=settings.stt_engine == "whisper_int8")
+    report = await stt.script_prompt_report(samples)
+    for key, value in report.items():
+        print(f"{key}: {value}")
+
+
+# api 역할에서 로드되면 안 되는 무거운 의존성
+HEAVY_MODULES = ("torch", "transformers", "whisper", "faiss")
+
+# api 역할 import 시간 기준 (초). 2 vCPU 컨테이너에서 api 역할은 1.1~1.6초였고,
+# 그중 fastapi/sqlalchemy/pydantic-settings/numpy import만 약 1.2초였음
+# (출력되는 framework 기준 시간과 함께 비교)
+API_IMPORT_BUDGET = 2.5
+
+# 앱 없이 프레임워크만 import하는 시간 (환경별 기준선)
+_FRAMEWORK_PROBE = """
+import json, time
+start = time.perf_counter()
+import fastapi, numpy, pydantic_settings, sqlalchemy.ext.asyncio
+print(json.dumps({"seconds": time.perf_counter() - start}))
+"""
+
+# 새 인터프리터에서 app.main을 import하고 시간/최대 RSS/무거운 모듈 로드 여부를 출력
+_IMPORT_PROBE = f"""
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+seconds = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(json.dumps({{"seconds": seconds, "max_rss_kib": rss, "heavy_modules": heavy}}))
+"""
+
+
+async def import_benchmark(args: argparse.Namespace):
+    """
+    서버 역할별로 app.main import 시간과 최대 RSS를 측정합니다.
+
+    api 역할이 무거운 의존성을 로드하거나 --max-seconds를 넘으면 0이 아닌
+    종료 코드로 끝나므로 CI에서 회귀 검사로 사용할 수 있습니다. 시간은 반복 중
+    최솟값이며, 같은 환경에서 프레임워크만 import한 시간을 기준선으로 함께
+    출력합니다.
+    """
+
+    def probe(code: str, env: dict) -> list:
+        runs = []
+        for _ in range(args.repeat):
+            out = subprocess.run(
+                [sys.executable, "-c", code], env=env, capture_output=True, text=True
+            )
+            if out.returncode != 0:
+                raise RuntimeError(out.stderr)
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        return runs
+
+    framework = min(run["seconds"] for run in probe(_FRAMEWORK_PROBE, dict(os.environ)))
+    print(f"framework baseline: {framework:.3f}s")
+
+    failed = False
+    for role in args.roles:
+        try:
+            runs = probe(_IMPORT_PROBE, dict(os.environ, SERVER_ROLE=role))
+        except RuntimeError as e:
+            print(f"{role}: import failed\n{e}")
+            failed = True
+            continue
+
+        seconds = min(run["seconds"] for run in runs)
+        rss_mib = max(run["max_rss_kib"] for run in runs) / 1024
+        heavy = runs[-1]["heavy_modules"]
+        print(
+            f"{role}: {seconds:.3f}s, max RSS {rss_mib:.1f} MiB, "
+            f"heavy modules: {', '.join(heavy) or '-'}"
+        )
+
+        if role == "api":
+            if heavy:
+                print(f"api role imported heavy modules: {', '.join(heavy)}")
+                failed = True
+            if seconds > args.max_seconds:
+                print(f"api role import exceeded {args.max_seconds}s")
+                failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+COMMANDS = {
+    "rebuild-index": rebuild_index,
+    "index-report": index_report,
+    "quantization-report": quantization_report,
+    "backfill-word-counts": backfill_word_counts,
+    "migrate-word-errors": migrate_word_errors,
+    "rescore": rescore,
+    "import-benchmark": import_benchmark,
+    "prompt-report": prompt_report,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("rebuild-index", help="FAISS 인덱스 전체 재구축")
+
+    report = subparsers.add_parser("index-report", help="인덱스 recall/지연 비교")
+    report.add_argument("--k", type=int, default=10)
+    report.add_argument("--queries", type=int, default=200)
+
+    quantization = subparsers.add_parser(
+        "quantization-report", help="int8 임베딩 모델과 fp32 비교"
+    )
+    quantization.add_argument("--k", type=int, default=10)
+    quantization.add_argument("--queries", type=int, default=200)
+
+    subparsers.add_parser("backfill-word-counts", help="누락 단어 집계 백필")
+    subparsers.add_parser("migrate-word-errors", help="기존 피드백의 단어별 오류 생성")
+
+    rescore_parser = subparsers.add_parser("rescore", help="저장된 피드백 재채점")
+    rescore_parser.add_argument("--resume", metavar="RUN_ID", help="중단된 실행 재개")
+    rescore_parser.add_argument("--workers", type=int, default=None)
+    rescore_parser.add_argument("--chunk-size", type=int, default=None)
+
+    benchmark = subparsers.add_parser(
+        "import-benchmark", help="서버 역할별 import 시간/메모리 측정"
+    )
+    benchmark.add_argument(
+        "--roles", nargs="+", default=["api", "inference", "all"], metavar="ROLE"
+    )
+    benchmark.add_argument("--repeat", type=int, default=3)
+    benchmark.add_argument("--max-seconds", type=float, default=API_IMPORT_BUDGET)
+
+    prompt = subparsers.add_parser(
+        "prompt-report", help="스크립트 조건부 디코딩과 기본 디코딩 비교"
+    )
+    prompt.add_argument("--limit", type=int, default=50)
+
+    return parser
+
+
+# DB를 사용하지 않는 명령어
+_NO_DB_COMMANDS = {"import-benchmark"}
+
+
+async def run(args: argparse.Namespace):
+    if args.command not in _NO_DB_COMMANDS:
+        await init_db()
+    await COMMANDS[args.command](args)
+
+
+def main():
+    args = build_parser().parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from .config import settings
-from .database import get_db, init_db
+from .database import get_db, get_read_db, init_db
 from .evaluator import PronunciationEvaluator
 
-__all__ = ["settings", "get_db", "init_db", "PronunciationEvaluator"]
+__all__ = ["settings", "get_db", "get_read_db", "init_db", "PronunciationEvaluator"]
@@ -0,0 +1,243 @@
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+EQUAL = "equal"
+SUBSTITUTE = "substitute"
+DELETE = "delete"
+INSERT = "insert"
+
+
+class AlignmentOp(NamedTuple):
+    op: str
+    # 원본 위치 (insert는 삽입되는 위치)
+    ref_index: int
+    # 인식 결과 위치 (delete는 None)
+    hyp_index: Optional[int]
+
+
+def levenshtein(reference: Sequence[Hashable], hypothesis: Sequence[Hashable]) -> int:
+    """
+    비트 병렬(Myers/Hyyrö) 알고리즘으로 편집 거리를 계산합니다.
+
+    원본의 각 위치를 Python 정수의 비트로 표현하므로 길이 제한 없이
+    O(len(hypothesis) * ceil(len(reference) / 워드 크기))에 계산됩니다.
+
+    Args:
+        reference: 원본 문자열 또는 토큰 시퀀스
+        hypothesis: 인식된 문자열 또는 토큰 시퀀스
+
+    Returns:
+        삽입/삭제/대체 비용이 1인 Levenshtein 거리
+    """
+    if len(reference) < len(hypothesis):
+        # 거리는 대칭이므로 짧은 쪽을 비트 벡터로 사용
+        reference, hypothesis = hypothesis, reference
+
+    m = len(hypothesis)
+    if m == 0:
+        return len(reference)
+
+    peq: Dict[Hashable, int] = {}
+    for i, symbol in enumerate(hypothesis):
+        peq[symbol] = peq.get(symbol, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+
+    for symbol in reference:
+        eq = peq.get(symbol, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
+
+
+def similarity(reference: str, hypothesis: str) -> float:
+    """
+    문자 단위 Levenshtein 거리를 0.0~1.0 유사도로 변환합니다.
+
+    1 - 거리 / 긴 쪽 길이이며, 둘 다 비어 있으면 1.0입니다.
+    """
+    longest = max(len(reference), len(hypothesis))
+    if longest == 0:
+        return 1.0
+    return 1.0 - levenshtein(reference, hypothesis) / longest
+
+
+def _encode(words: Sequence[str], vocab: Dict[str, int]) -> np.ndarray:
+    return np.array([vocab.setdefault(word, len(vocab)) for word in words], np.int64)
+
+
+def _distance_matrix(ref: np.ndarray, hyp: np.ndarray) -> np.ndarray:
+    """
+    편집 거리 DP 행렬 전체를 행 단위 NumPy 연산으로 채웁니다.
+
+    같은 행 안의 삽입 의존성 D[i][j] = min(D[i][j-1] + 1, ...)은
+    D[i][j] - j = min_{k<=j}(T[k] - k)이므로 minimum.accumulate로 한 번에 풉니다.
+    """
+    n, m = len(ref), len(hyp)
+    columns = np.arange(m + 1)
+    dist = np.empty((n + 1, m + 1), dtype=np.int32)
+    dist[0] = columns
+
+    for i in range(1, n + 1):
+        prev = dist[i - 1]
+        row = np.empty(m + 1, dtype=np.int32)
+        row[0] = i
+        # 대체(또는 일치)와 삭제
+        row[1:] = np.minimum(prev[:-1] + (hyp != ref[i - 1]), prev[1:] + 1)
+        # 삽입
+        dist[i] = np.minimum.accumulate(row - columns) + columns
+
+    return dist
+
+
+def align_words(
+    reference: Sequence[str], hypothesis: Sequence[str]
+) -> List[AlignmentOp]:
+    """
+    단어 시퀀스의 최소 편집 정렬을 구합니다.
+
+    DP 행렬을 한 번 채운 뒤 역추적하여 일치/대체/삭제/삽입 연산을 원본 순서대로
+    반환합니다. 반복 단어와 대체된 단어도 위치별로 구분됩니다.
+
+    Args:
+        reference: 원본 단어 리스트
+        hypothesis: 인식된 단어 리스트
+
+    Returns:
+        정렬 연산 리스트
+    """
+    vocab: Dict[str, int] = {}
+    ref = _encode(reference, vocab)
+    hyp = _encode(hypothesis, vocab)
+    dist = _distance_matrix(ref, hyp)
+
+    ops = []
+    i, j = len(ref), len(hyp)
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            same = ref[i - 1] == hyp[j - 1]
+            if dist[i, j] == dist[i - 1, j - 1] + (0 if same else 1):
+                ops.append(AlignmentOp(EQUAL if same else SUBSTITUTE, i - 1, j - 1))
+                i -= 1
+                j -= 1
+                continue
+        if i > 0 and dist[i, j] == dist[i - 1, j] + 1:
+            ops.append(AlignmentOp(DELETE, i - 1, None))
+            i -= 1
+        else:
+            ops.append(AlignmentOp(INSERT, i, j - 1))
+            j -= 1
+
+    ops.reverse()
+    return ops
+
+
+def batch_levenshtein(
+    references: Sequence[str], hypotheses: Sequence[str], chunk_size: int = 512
+) -> np.ndarray:
+    """
+    여러 (원본, 인식 결과) 쌍의 문자 단위 편집 거리를 한 번에 계산합니다.
+
+    원본 길이순으로 정렬한 뒤 chunk_size개씩 코드 포인트 배열로 패딩하고,
+    DP의 각 행을 청크 전체에 대해 벡터 연산으로 계산합니다. 각 쌍의 거리는
+    원본 길이에 해당하는 행에서 읽으며, 패딩 열은 앞쪽 열에 영향을 주지 않습니다.
+
+    Args:
+        references: 원본 문자열 리스트
+        hypotheses: 같은 길이의 인식 결과 문자열 리스트
+        chunk_size: 한 번에 계산할 쌍의 수
+
+    Returns:
+        입력 순서와 같은 (배치 크기,) int 배열
+    """
+    if len(references) != len(hypotheses):
+        raise ValueError("references and hypotheses must have the same length")
+
+    ref_lens = np.array([len(text) for text in references], dtype=np.int64)
+    hyp_lens = np.array([len(text) for text in hypotheses], dtype=np.int64)
+    result = np.zeros(len(references), dtype=np.int64)
+
+    # 길이가 비슷한 쌍끼리 묶어 패딩을 줄임
+    order = np.argsort(ref_lens, kind="stable")
+    for start in range(0, len(order), chunk_size):
+        chunk = order[start : start + chunk_size]
+        result[chunk] = _levenshtein_chunk(
+            [references[k] for k in chunk],
+            [hypotheses[k] for k in chunk],
+            ref_lens[chunk],
+            hyp_lens[chunk],
+        )
+
+    return result
+
+
+def _codepoints(texts: List[str], length: int, pad: int) -> np.ndarray:
+    """문자열들을 (length, 개수) 코드 포인트 배열로 변환합니다."""
+    codes = np.full((length, len(texts)), pad, dtype=np.int32)
+    for b, text in enumerate(texts):
+        if text:
+            codes[: len(text), b] = np.frombuffer(
+                text.encode("utf-32-le"), dtype=np.int32
+            )
+    return codes
+
+
+def _levenshtein_chunk(
+    references: List[str],
+    hypotheses: List[str],
+    ref_lens: np.ndarray,
+    hyp_lens: np.ndarray,
+) -> np.ndarray:
+    n, m = int(ref_lens.max()), int(hyp_lens.max())
+    batch = len(references)
+
+    # 쌍 축을 마지막에 두어 각 연산이 연속된 메모리에서 배치 전체로 벡터화되도록 함
+    # 패딩 값은 서로 다르게 하여 실제 문자와 일치하지 않게 함
+    ref = _codepoints(references, n, -1)
+    hyp = _codepoints(hypotheses, m, -2)
+
+    columns = np.arange(m + 1, dtype=np.int32)[:, None]
+    pairs = np.arange(batch)
+    prev = np.repeat(columns, batch, axis=1)
+    result = prev[hyp_lens, pairs].astype(np.int64)
+
+    row = np.empty_like(prev)
+    for i in range(1, n + 1):
+        row[0] = i
+        np.minimum(prev[:-1] + (hyp != ref[i - 1]), prev[1:] + 1, out=row[1:])
+        row -= columns
+        prev = np.minimum.accumulate(row, axis=0)
+        prev += columns
+
+        done = ref_lens == i
+        if done.any():
+            result[done] = prev[hyp_lens[done], pairs[done]]
+
+    return result
+
+
+def batch_similarity(
+    references: Sequence[str], hypotheses: Sequence[str]
+) -> np.ndarray:
+    """batch_levenshtein 결과를 similarity와 같은 0.0~1.0 유사도로 변환합니다."""
+    distances = batch_levenshtein(references, hypotheses)
+    longest = np.maximum(
+        [len(text) for text in references], [len(text) for text in hypotheses]
+    )
+    return np.where(longest > 0, 1.0 - distances / np.maximum(longest, 1), 1.0)
@@ -0,0 +1,235 @@
+import io
+import struct
+import subprocess
+import wave
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+# Whisper가 기대하는 샘플링 레이트
+SAMPLE_RATE = 16000
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# 다운샘플링 전 저역 통과 필터의 탭 수 (홀수)
+_RESAMPLE_TAPS = 63
+
+
+# 스트리밍으로 받는 원시 PCM 형식
+PCM_ENCODINGS = {"s16le": ("<i2", 32768.0), "f32le": ("<f4", 1.0)}
+
+
+class AudioDecodeError(Exception):
+    """오디오를 디코딩할 수 없을 때 발생합니다."""
+
+
+def _parse_wav(data: bytes) -> Optional[np.ndarray]:
+    """
+    RIFF/WAVE 바이트에서 PCM 샘플을 읽어 16kHz 모노 float32 배열로 변환합니다.
+
+    지원하지 않는 형식이면 None을 반환하여 ffmpeg로 넘기도록 합니다.
+
+    Raises:
+        AudioDecodeError: fmt 청크가 잘려 헤더를 읽을 수 없을 때
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+
+    fmt = None
+    pcm = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            try:
+                fmt = struct.unpack_from("<HHIIHH", data, body)
+                if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                    # 서브포맷 GUID의 앞 2바이트가 실제 포맷 코드
+                    (sub_format,) = struct.unpack_from("<H", data, body + 24)
+                    fmt = (sub_format,) + fmt[1:]
+            except struct.error as e:
+                raise AudioDecodeError(f"Truncated WAV fmt chunk: {e}") from e
+        elif chunk_id == b"data":
+            # 스트리밍 녹음은 data 크기가 0 또는 최대값으로 기록되기도 함
+            pcm = data[body : body + chunk_size] if chunk_size else data[body:]
+            break
+
+        offset = body + chunk_size + (chunk_size & 1)
+
+    if fmt is None or pcm is None:
+        return None
+
+    format_code, channels, sample_rate, _, _, bits = fmt
+    if channels < 1 or sample_rate < 1:
+        return None
+
+    if format_code == _WAVE_FORMAT_PCM and bits == 16:
+        samples = np.frombuffer(pcm[: len(pcm) // 2 * 2], dtype="<i2")
+        audio = samples.astype(np.float32) / 32768.0
+    elif format_code == _WAVE_FORMAT_PCM and bits == 32:
+        samples = np.frombuffer(pcm[: len(pcm) // 4 * 4], dtype="<i4")
+        audio = samples.astype(np.float32) / 2147483648.0
+    elif format_code == _WAVE_FORMAT_PCM and bits == 8:
+        samples = np.frombuffer(pcm, dtype=np.uint8)
+        audio = (samples.astype(np.float32) - 128.0) / 128.0
+    elif format_code == _WAVE_FORMAT_PCM and bits == 24:
+        raw = np.frombuffer(pcm[: len(pcm) // 3 * 3], dtype=np.uint8).reshape(-1, 3)
+        samples = (
+            raw[:, 0].astype(np.int32)
+            | (raw[:, 1].astype(np.int32) << 8)
+            | (raw[:, 2].astype(np.int8).astype(np.int32) << 16)
+        )
+        audio = samples.astype(np.float32) / 8388608.0
+    elif format_code == _WAVE_FORMAT_IEEE_FLOAT and bits in (32, 64):
+        dtype = "<f4" if bits == 32 else "<f8"
+        width = bits // 8
+        samples = np.frombuffer(pcm[: len(pcm) // width * width], dtype=dtype)
+        audio = samples.astype(np.float32)
+    else:
+        return None
+
+    if channels > 1:
+        frames = len(audio) // channels
+        audio = audio[: frames * channels].reshape(frames, channels).mean(axis=1)
+
+    return resample(audio, sample_rate, SAMPLE_RATE)
+
+
+def resample(
+    audio: np.ndarray, orig_sr: int, target_sr: int = SAMPLE_RATE
+) -> np.ndarray:
+    """
+    오디오를 목표 샘플링 레이트로 변환합니다.
+
+    다운샘플링 시에는 앨리어싱을 막기 위해 윈도우드 싱크 저역 통과 필터를 먼저
+    적용한 뒤 선형 보간합니다. 모든 연산은 NumPy 벡터 연산으로 수행됩니다.
+
+    Args:
+        audio: 1차원 float32 오디오
+        orig_sr: 원본 샘플링 레이트
+        target_sr: 목표 샘플링 레이트
+
+    Returns:
+        목표 샘플링 레이트의 float32 오디오
+    """
+    if orig_sr == target_sr or len(audio) == 0:
+        return np.ascontiguousarray(audio, dtype=np.float32)
+
+    if target_sr < orig_sr:
+        cutoff = target_sr / orig_sr / 2
+        n = np.arange(_RESAMPLE_TAPS) - (_RESAMPLE_TAPS - 1) / 2
+        taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(_RESAMPLE_TAPS)
+        taps /= taps.sum()
+        audio = np.convolve(audio, taps, mode="same")
+
+    # 정수 배율이면 보간 없이 간격 추출
+    if orig_sr % target_sr == 0:
+        return np.ascontiguousarray(audio[:: orig_sr // target_sr], dtype=np.float32)
+
+    duration = len(audio) / orig_sr
+    target_len = int(round(duration * target_sr))
+    positions = np.arange(target_len) * (orig_sr / target_sr)
+    resampled = np.interp(positions, np.arange(len(audio)), audio)
+    return resampled.astype(np.float32)
+
+
+def _decode_with_ffmpeg(source: Union[str, bytes]) -> np.ndarray:
+    """
+    WAV 이외의 코덱(webm/opus, mp3 등)을 ffmpeg로 디코딩합니다.
+
+    파일 경로는 ffmpeg가 직접 읽고(탐색이 필요한 mp4 등), 바이트는 임시 파일 없이
+    표준 입력 파이프로 전달합니다.
+    """
+    from_pipe = isinstance(source, bytes)
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads",
+        "0",
+        "-i",
+        "pipe:0" if from_pipe else source,
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-",
+    ]
+    try:
+        out = subprocess.run(
+            cmd, input=source if from_pipe else None, capture_output=True, check=True
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise AudioDecodeError(f"Failed to decode audio: {e.stderr.decode()}") from e
+
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def decode_audio(data: bytes) -> np.ndarray:
+    """
+    오디오 바이트를 16kHz 모노 float32 배열로 디코딩합니다.
+
+    WAV/PCM은 프로세스 내에서 바로 디코딩하고, 그 외 형식만 ffmpeg를 사용합니다.
+
+    Args:
+        data: 오디오 파일 내용
+
+    Returns:
+        16kHz 모노 float32 오디오
+    """
+    audio = _parse_wav(data)
+    if audio is not None:
+        return audio
+    return _decode_with_ffmpeg(data)
+
+
+def load_audio(source: Union[str, Path, bytes, np.ndarray]) -> np.ndarray:
+    """
+    파일 경로, 바이트 또는 이미 디코딩된 배열을 16kHz 모노 float32 배열로 반환합니다.
+    """
+    if isinstance(source, np.ndarray):
+        return source.astype(np.float32, copy=False)
+    if isinstance(source, bytes):
+        return decode_audio(source)
+
+    audio = _parse_wav(Path(source).read_bytes())
+    if audio is not None:
+        return audio
+    return _decode_with_ffmpeg(str(source))
+
+
+def decode_pcm(data: bytes, encoding: str = "s16le") -> np.ndarray:
+    """
+    헤더 없는 모노 PCM 바이트를 float32 배열로 변환합니다.
+
+    Args:
+        data: 샘플 단위로 나누어떨어지는 PCM 바이트
+        encoding: s16le 또는 f32le
+
+    Returns:
+        원본 샘플링 레이트의 float32 오디오
+    """
+    dtype, scale = PCM_ENCODINGS[encoding]
+    samples = np.frombuffer(data, dtype=dtype).astype(np.float32)
+    return samples / scale if scale != 1.0 else samples
+
+
+def encode_wav(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """float32 모노 오디오를 16비트 PCM WAV 바이트로 변환합니다."""
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.tobytes())
+    return buffer.getvalue()
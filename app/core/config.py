@@ -1,18 +1,109 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
+    # 서버 역할: api | inference | all
+    # api는 조회/관리 엔드포인트만 등록하고 STT/임베딩 모델과 FAISS를 로드하지 않음
+    server_role: Literal["all", "api", "inference"] = "all"
+
     # 데이터베이스
     database_url: str = "sqlite+aiosqlite:///./data/speechlab.db"
+    db_echo: bool = False
+    db_read_pool_size: int = 4
+    # 단일 쓰기 연결을 기다리는 최대 시간 (초)
+    db_write_pool_timeout: float = 30.0
+
+    # SQLite 연결 PRAGMA
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size: int = 268_435_456
 
     # Whisper 설정
     whisper_model: str = "turbo"
 
+    # STT 엔진: whisper | whisper_int8 (CPU int8 양자화) | fake (부하 테스트/CI용)
+    stt_engine: Literal["whisper", "whisper_int8", "fake"] = "whisper"
+    stt_fake_text: str = "hello world"
+    stt_fake_delay: float = 0.0
+
+    # STT 워커 풀 설정 (0이면 이벤트 루프 밖의 스레드에서 처리)
+    stt_workers: int = 1
+    stt_queue_size: int = 8
+    stt_job_timeout: float = 120.0
+    stt_worker_threads: int = 0
+
+    # STT 마이크로 배칭 (최대 배치 크기가 1이면 배칭하지 않음)
+    stt_max_batch_size: int = 8
+    stt_max_batch_wait_ms: int = 50
+
+    # 긴 녹음은 무음 위치에서 최대 길이 이하 구간으로 나눠 워커들이 동시에 변환
+    # (기본 stt_workers=1에서는 구간들을 한 워커가 배치로 변환하며, 병렬 변환에는
+    # 워커를 늘려야 함. 워커마다 모델을 따로 로드하므로 메모리가 워커 수에 비례)
+    stt_split_long_audio: bool = True
+    stt_segment_max_seconds: float = 30.0
+
+    # 스크립트 조건부 디코딩: 기대 문장을 프롬프트로 주고 온도 fallback 없이 greedy 디코딩,
+    # 생성 토큰 수를 스크립트 토큰 수 + 여유분으로 제한
+    stt_script_prompt: bool = False
+    stt_prompt_token_margin: int = 10
+
+    # 채점 방식: transcription (받아쓰기 후 비교) | forced_alignment (원본을 디코더에 강제
+    # 입력해 단어별 로그 우도로 채점, 30초 초과 녹음은 transcription으로 처리)
+    scoring_mode: Literal["transcription", "forced_alignment"] = "transcription"
+    # 단어의 평균 토큰 로그 우도가 이보다 낮으면 약한 단어로 표시
+    forced_alignment_weak_log_prob: float = -1.0
+
+    # STT 전 무음 제거 (프레임 에너지/영교차율 VAD)
+    vad_enabled: bool = True
+    vad_frame_ms: int = 30
+    vad_energy_threshold_db: float = -40.0
+    vad_zcr_threshold: float = 0.3
+    # 음성 앞뒤로 남길 길이와 발화 사이 무음의 최대 길이
+    vad_padding_ms: int = 200
+    vad_max_pause_ms: int = 700
+
+    # 시작 시 모델 미리 로드 (background이면 로드 중에도 요청을 받고 /ready는 503)
+    warmup_on_startup: bool = True
+    warmup_in_background: bool = True
+    warmup_timeout: float = 600.0
+
+    # STT 결과 캐시 (TTL 0이면 만료 없음)
+    transcription_cache_enabled: bool = True
+    transcription_cache_path: str = "./data/cache/transcriptions.db"
+    transcription_cache_memory_size: int = 1024
+    transcription_cache_max_entries: int = 100_000
+    transcription_cache_ttl: float = 0
+
+    # WebSocket 스트리밍 평가: 부분 결과 주기, 다시 인식할 창의 최대 길이, 최대 녹음 길이 (초)
+    stream_partial_interval: float = 1.0
+    stream_window_seconds: float = 20.0
+    stream_max_seconds: float = 300.0
+
+    # 비동기 제출 작업 상태 조회 주기 (초)
+    job_poll_interval: float = 0.5
+
+    # 피드백 재채점 (0이면 CPU 코어 수만큼 워커 사용)
+    rescore_workers: int = 0
+    rescore_chunk_size: int = 500
+
+    # 목록 조회 (키셋 페이지네이션 / NDJSON 스트리밍)
+    page_size: int = 50
+    max_page_size: int = 500
+    stream_chunk_size: int = 1000
+
     # 임베딩 설정
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     embedding_dim: int = 2048
+    embedding_batch_size: int = 64
+    # CPU 추론: none | int8 (Linear 레이어 동적 양자화), 스레드 0이면 torch 기본값
+    embedding_quantization: Literal["none", "int8"] = "none"
+    embedding_threads: int = 0
+    bulk_import_chunk_size: int = 1000
 
     # 파일 업로드
     upload_dir: str = "./data/uploads"
@@ -21,10 +112,32 @@ class Settings(BaseSettings):
     # FAISS 설정
     faiss_index_path: str = "./data/faiss_index.bin"
     similar_scripts_count: int = 3
+    # 유사 스크립트 조회용 script id → text 캐시 크기
+    script_text_cache_size: int = 10_000
+    faiss_save_delay: float = 2.0
+
+    # FAISS 인덱스 타입: flat | ivf_flat | ivf_pq | hnsw | auto
+    # auto는 faiss_ann_threshold 개 이상에서 faiss_ann_index_type으로 전환
+    faiss_index_type: Literal["auto", "flat", "ivf_flat", "ivf_pq", "hnsw"] = "auto"
+    faiss_ann_index_type: Literal["ivf_flat", "ivf_pq", "hnsw"] = "ivf_flat"
+    faiss_ann_threshold: int = 50_000
+    faiss_train_sample_size: int = 50_000
+    faiss_nlist: int = 0  # 0이면 벡터 수로 자동 결정
+    faiss_pq_m: int = 16
+    faiss_pq_nbits: int = 8
+    faiss_hnsw_m: int = 32
+    faiss_hnsw_ef_construction: int = 40
+    faiss_nprobe: int = 16
+    faiss_ef_search: int = 64
 
     # 캐시 설정
     whisper_cache_dir: str = "./data/cache/whisper"
     huggingface_cache_dir: str = "./data/cache/huggingface"
 
+    @property
+    def serves_inference(self) -> bool:
+        """STT/임베딩 모델이 필요한 엔드포인트를 이 서버가 처리하는지 여부"""
+        return self.server_role != "api"
+
 
 settings = Settings()
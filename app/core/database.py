@@ -1,20 +1,142 @@
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.schema import CreateColumn
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.database_url, echo=True)
+
+def _is_sqlite_file(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _sqlite_pragmas(read_only: bool):
+    """
+    연결마다 적용할 SQLite PRAGMA 핸들러를 만듭니다.
+
+    WAL 모드에서는 읽기가 쓰기를 막지 않으며, busy_timeout 동안 잠금을 기다리므로
+    동시 제출 시 "database is locked" 오류가 나지 않습니다.
+    """
+
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if not read_only:
+            # WAL은 DB 파일에 기록되는 설정이므로 쓰기 연결에서만 지정
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        # 음수는 KiB 단위
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.close()
+
+    return on_connect
+
+
+def _create_engines():
+    """
+    쓰기 엔진과 읽기 전용 엔진을 만듭니다.
+
+    SQLite 파일 DB이면 쓰기는 하나의 연결로 직렬화하고, 대시보드/목록 조회는
+    mode=ro로 연 별도 연결 풀에서 처리합니다. 그 외 DB는 하나의 엔진을 공유합니다.
+    """
+    url = make_url(settings.database_url)
+    if not _is_sqlite_file(url):
+        write_engine = create_async_engine(url, echo=settings.db_echo)
+        return write_engine, write_engine
+
+    # 쓰기 트랜잭션은 SQLite에서 어차피 하나씩만 실행되므로 연결 하나로 대기열화
+    # (aiosqlite 기본값인 NullPool 대신 연결을 유지하는 풀 사용)
+    write_engine = create_async_engine(
+        url,
+        echo=settings.db_echo,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.db_write_pool_timeout,
+    )
+    event.listen(write_engine.sync_engine, "connect", _sqlite_pragmas(False))
+
+    read_url = url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"},
+    )
+    read_engine = create_async_engine(
+        read_url,
+        echo=settings.db_echo,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_read_pool_size,
+        max_overflow=0,
+    )
+    event.listen(read_engine.sync_engine, "connect", _sqlite_pragmas(True))
+
+    return write_engine, read_engine
+
+
+engine, read_engine = _create_engines()
 
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+ReadSessionLocal = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
 
+async def get_read_db():
+    """조회 전용 엔드포인트용 읽기 전용 세션입니다."""
+    async with ReadSessionLocal() as session:
+        yield session
+
+
 async def init_db():
     from app.models import Base
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all은 기존 테이블에 새로 추가된 컬럼/인덱스를 만들지 않음
+        await conn.run_sync(_add_missing_columns, Base.metadata)
+        await conn.run_sync(_create_missing_indexes, Base.metadata)
+
+
+def _add_missing_columns(conn, metadata):
+    """
+    기존 테이블에 모델에 새로 추가된 컬럼을 ALTER TABLE ADD COLUMN으로 추가합니다.
+
+    기존 행은 컬럼의 server_default(없으면 NULL)로 채워지므로, 새 컬럼은
+    nullable이거나 server_default가 있어야 합니다.
+    """
+    inspector = inspect(conn)
+    tables = set(inspector.get_table_names())
+    preparer = conn.dialect.identifier_preparer
+
+    for table in metadata.sorted_tables:
+        if table.name not in tables:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            definition = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(
+                text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {definition}"
+                )
+            )
+
+
+def _create_missing_indexes(conn, metadata):
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
@@ -1,6 +1,40 @@
-import difflib
+import math
 import re
-from typing import List, Tuple
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from app.core import alignment
+
+
+class WordError(NamedTuple):
+    # missing/substituted는 원본 단어, extra는 인식된 단어
+    word: str
+    error_type: str
+    recognized_word: Optional[str]
+    position: int
+
+
+class PartialEvaluation(NamedTuple):
+    # 읽은 부분에 대한 정확도
+    accuracy_score: float
+    words_read: int
+    total_words: int
+    # 읽은 부분에서 누락/대체된 원본 단어 (원본 순서)
+    missing_words: List[str]
+
+
+class WordScore(NamedTuple):
+    word: str
+    # 단어를 이루는 토큰들의 평균 로그 우도
+    log_prob: float
+
+
+class AlignmentEvaluation(NamedTuple):
+    accuracy_score: float
+    # 로그 우도가 임계값보다 낮은 원본 단어 (원본 순서)
+    weak_words: List[str]
+    feedback_text: str
+    word_errors: List[WordError]
+    word_scores: List[WordScore]
 
 
 class PronunciationEvaluator:
@@ -18,26 +52,119 @@ class PronunciationEvaluator:
     @staticmethod
     def calculate_accuracy(original: str, recognized: str) -> float:
         """
-        Levenshtein 기반 유사도를 사용하여 발음 정확도를 계산합니다.
+        문자 단위 Levenshtein 거리를 사용하여 발음 정확도를 계산합니다.
         0.0에서 100.0 사이의 점수를 반환합니다.
         """
         original_clean = PronunciationEvaluator._clean_text(original)
         recognized_clean = PronunciationEvaluator._clean_text(recognized)
-        similarity = difflib.SequenceMatcher(None, original_clean, recognized_clean)
-        return round(similarity.ratio() * 100, 2)
+        similarity = alignment.similarity(original_clean, recognized_clean)
+        return round(similarity * 100, 2)
+
+    @staticmethod
+    def calculate_accuracy_batch(
+        originals: Sequence[str], recognized: Sequence[str]
+    ) -> List[float]:
+        """
+        여러 (원본, 인식 결과) 쌍의 정확도를 벡터 연산으로 한 번에 계산합니다.
+
+        calculate_accuracy와 같은 점수를 반환합니다. (재채점 등 대량 처리용)
+        """
+        similarities = alignment.batch_similarity(
+            [PronunciationEvaluator._clean_text(text) for text in originals],
+            [PronunciationEvaluator._clean_text(text) for text in recognized],
+        )
+        return [round(float(similarity) * 100, 2) for similarity in similarities]
 
     @staticmethod
     def find_missing_words(original: str, recognized: str) -> List[str]:
         """
-        원본 텍스트에는 있지만 인식된 텍스트에서 누락된 단어를 찾습니다.
+        원본 텍스트에는 있지만 인식된 텍스트에서 누락되거나 다르게 인식된 단어를
+        원본 순서대로 찾습니다. (반복 단어는 위치마다 포함)
         """
-        original_clean = PronunciationEvaluator._clean_text(original)
-        recognized_clean = PronunciationEvaluator._clean_text(recognized)
+        return PronunciationEvaluator._missing_words(
+            PronunciationEvaluator.find_word_errors(original, recognized)
+        )
+
+    @staticmethod
+    def _missing_words(word_errors: List[WordError]) -> List[str]:
+        return [error.word for error in word_errors if error.error_type != "extra"]
+
+    @staticmethod
+    def find_word_errors(original: str, recognized: str) -> List[WordError]:
+        """
+        단어 단위 정렬로 누락/추가/대체된 단어를 모두 찾습니다.
+
+        반복되는 단어도 위치별로 구분하여 반환합니다.
+        """
+        original_words = PronunciationEvaluator._clean_text(original).split()
+        recognized_words = PronunciationEvaluator._clean_text(recognized).split()
+
+        errors = []
+        for op in alignment.align_words(original_words, recognized_words):
+            if op.op == alignment.SUBSTITUTE:
+                errors.append(
+                    WordError(
+                        original_words[op.ref_index],
+                        "substituted",
+                        recognized_words[op.hyp_index],
+                        op.ref_index,
+                    )
+                )
+            elif op.op == alignment.DELETE:
+                errors.append(
+                    WordError(
+                        original_words[op.ref_index], "missing", None, op.ref_index
+                    )
+                )
+            elif op.op == alignment.INSERT:
+                errors.append(
+                    WordError(
+                        recognized_words[op.hyp_index], "extra", None, op.ref_index
+                    )
+                )
+
+        return errors
+
+    @staticmethod
+    def evaluate_partial(original: str, recognized: str) -> PartialEvaluation:
+        """
+        말하는 도중의 인식 결과를 원본의 앞부분과 비교합니다.
+
+        단어 정렬에서 인식된 단어와 짝지어진 마지막 원본 단어까지를 읽은 부분으로
+        보고, 그 부분에 대해서만 정확도와 단어 오류를 계산합니다. 아직 읽지 않은
+        뒷부분은 누락으로 세지 않습니다.
+
+        Returns:
+            읽은 부분의 정확도, 읽은 단어 수, 전체 단어 수, 누락 단어
+        """
+        original_words = PronunciationEvaluator._clean_text(original).split()
+        recognized_words = PronunciationEvaluator._clean_text(recognized).split()
+
+        words_read = 0
+        for op in alignment.align_words(original_words, recognized_words):
+            if op.op in (alignment.EQUAL, alignment.SUBSTITUTE):
+                words_read = op.ref_index + 1
+
+        if words_read == 0:
+            return PartialEvaluation(0.0, 0, len(original_words), [])
+
+        read_part = " ".join(original_words[:words_read])
+        return PartialEvaluation(
+            PronunciationEvaluator.calculate_accuracy(read_part, recognized),
+            words_read,
+            len(original_words),
+            PronunciationEvaluator.find_missing_words(read_part, recognized),
+        )
 
-        original_words = set(original_clean.split())
-        recognized_words = set(recognized_clean.split())
-        missing = original_words - recognized_words
-        return sorted(list(missing))
+    @staticmethod
+    def _score_message(accuracy_score: float) -> str:
+        if accuracy_score >= 90:
+            return "훌륭합니다! 발음이 매우 정확합니다."
+        if accuracy_score >= 70:
+            return "좋습니다! 조금만 더 연습하면 완벽해질 것 같아요."
+        if accuracy_score >= 50:
+            return "괜찮습니다. 더 연습이 필요합니다."
+        return "많은 연습이 필요합니다. 천천히 따라 읽어보세요."
 
     @staticmethod
     def generate_feedback(
@@ -46,20 +173,13 @@ class PronunciationEvaluator:
         """
         정확도 점수와 누락된 단어를 기반으로 상세한 피드백을 생성합니다.
         """
-        feedback_parts = []
-
-        if accuracy_score >= 90:
-            feedback_parts.append("훌륭합니다! 발음이 매우 정확합니다.")
-        elif accuracy_score >= 70:
-            feedback_parts.append("좋습니다! 조금만 더 연습하면 완벽해질 것 같아요.")
-        elif accuracy_score >= 50:
-            feedback_parts.append("괜찮습니다. 더 연습이 필요합니다.")
-        else:
-            feedback_parts.append("많은 연습이 필요합니다. 천천히 따라 읽어보세요.")
+        feedback_parts = [PronunciationEvaluator._score_message(accuracy_score)]
 
         if missing_words:
+            # 반복해서 틀린 단어는 한 번만 표시
+            unique_words = list(dict.fromkeys(missing_words))
             feedback_parts.append(
-                f"누락된 단어: {', '.join(missing_words)}. 이 단어들을 신경써서 발음해보세요."
+                f"누락된 단어: {', '.join(unique_words)}. 이 단어들을 신경써서 발음해보세요."
             )
 
         # 추가 구체적인 피드백
@@ -70,14 +190,108 @@ class PronunciationEvaluator:
 
         return " ".join(feedback_parts)
 
+    @staticmethod
+    def script_words(original: str) -> List[Tuple[str, str]]:
+        """
+        원본을 공백 기준 조각으로 나눠 (원본 조각, 평가용 단어)를 반환합니다.
+
+        모델에는 대소문자/구두점이 있는 원본 조각을 그대로 입력하고, 결과는
+        다른 평가와 같은 정리된 단어로 보고할 때 사용합니다. 구두점만 있는
+        조각의 평가용 단어는 빈 문자열입니다.
+        """
+        return [
+            (piece, PronunciationEvaluator._clean_text(piece))
+            for piece in original.split()
+        ]
+
+    @staticmethod
+    def evaluate_alignment(
+        word_scores: Sequence[WordScore], weak_log_prob: float
+    ) -> AlignmentEvaluation:
+        """
+        원본 단어별 로그 우도로 forced alignment 채점을 수행합니다.
+
+        단어 점수는 평균 토큰 로그 우도를 확률(exp)로 바꾼 값이고, 정확도는 단어
+        점수의 평균(0.0~100.0)입니다. 로그 우도가 weak_log_prob보다 낮은 단어를
+        약한 단어로 보고 단어별 오류(weak)로 기록합니다.
+
+        Args:
+            word_scores: 원본 순서의 평가용 단어별 로그 우도 (빈 단어 제외)
+            weak_log_prob: 약한 단어로 볼 로그 우도 임계값
+        """
+        word_scores = list(word_scores)
+        if not word_scores:
+            return AlignmentEvaluation(0.0, [], "", [], [])
+
+        accuracy = round(
+            100
+            * sum(math.exp(score.log_prob) for score in word_scores)
+            / len(word_scores),
+            2,
+        )
+        word_errors = [
+            WordError(score.word, "weak", None, position)
+            for position, score in enumerate(word_scores)
+            if score.log_prob < weak_log_prob
+        ]
+        weak_words = [error.word for error in word_errors]
+
+        feedback_parts = [PronunciationEvaluator._score_message(accuracy)]
+        if weak_words:
+            unique_words = list(dict.fromkeys(weak_words))
+            feedback_parts.append(
+                f"불분명한 단어: {', '.join(unique_words)}. 이 단어들을 또렷하게 발음해보세요."
+            )
+
+        return AlignmentEvaluation(
+            accuracy, weak_words, " ".join(feedback_parts), word_errors, word_scores
+        )
+
     @staticmethod
     def evaluate(original: str, recognized: str) -> Tuple[float, List[str], str]:
         """
         전체 평가를 수행합니다: (정확도 점수, 누락된 단어, 피드백 텍스트)를 반환합니다.
         """
+        accuracy, missing, feedback, _ = PronunciationEvaluator.evaluate_detailed(
+            original, recognized
+        )
+        return accuracy, missing, feedback
+
+    @staticmethod
+    def evaluate_detailed(
+        original: str, recognized: str
+    ) -> Tuple[float, List[str], str, List[WordError]]:
+        """
+        evaluate와 같지만 단어별 오류도 함께 반환합니다.
+
+        단어 정렬은 한 번만 수행하여 누락 단어와 단어별 오류에 함께 사용합니다.
+        """
         accuracy = PronunciationEvaluator.calculate_accuracy(original, recognized)
-        missing = PronunciationEvaluator.find_missing_words(original, recognized)
+        word_errors = PronunciationEvaluator.find_word_errors(original, recognized)
+        missing = PronunciationEvaluator._missing_words(word_errors)
         feedback = PronunciationEvaluator.generate_feedback(
             accuracy, missing, original, recognized
         )
-        return accuracy, missing, feedback
+        return accuracy, missing, feedback, word_errors
+
+    @staticmethod
+    def evaluate_batch(
+        originals: Sequence[str], recognized: Sequence[str]
+    ) -> List[Tuple[float, List[str], str, List[WordError]]]:
+        """
+        여러 (원본, 인식 결과) 쌍을 evaluate_detailed와 같은 규칙으로 평가합니다.
+
+        정확도는 배치 편집 거리로 한 번에 계산합니다. (재채점 워커에서 사용)
+        """
+        accuracies = PronunciationEvaluator.calculate_accuracy_batch(
+            originals, recognized
+        )
+        results = []
+        for accuracy, original, text in zip(accuracies, originals, recognized):
+            word_errors = PronunciationEvaluator.find_word_errors(original, text)
+            missing = PronunciationEvaluator._missing_words(word_errors)
+            feedback = PronunciationEvaluator.generate_feedback(
+                accuracy, missing, original, text
+            )
+            results.append((accuracy, missing, feedback, word_errors))
+        return results
@@ -0,0 +1,74 @@
+from typing import Iterable
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+
+class BodySizeLimitMiddleware:
+    """
+    지정한 경로의 요청 본문 크기를 ASGI 수준에서 제한합니다.
+
+    Starlette는 핸들러가 실행되기 전에 multipart 본문 전체를 임시 파일로 받아
+    두므로, 핸들러 안의 크기 검사는 이미 받은 뒤에야 동작합니다. 이 미들웨어는
+    Content-Length가 한도를 넘으면 본문을 읽지 않고 413을 반환하고, 길이를 알 수
+    없는(chunked) 요청은 받는 동안 누적 크기가 한도를 넘는 즉시 413으로 중단합니다.
+
+    Args:
+        app: 감쌀 ASGI 앱
+        max_body_size: 허용할 최대 본문 바이트 수
+        paths: 제한을 적용할 요청 경로
+    """
+
+    def __init__(self, app, max_body_size: int, paths: Iterable[str]):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.paths = set(paths)
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"Request body exceeds maximum size of {self.max_body_size} bytes",
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and int(content_length) > self.max_body_size:
+            error = self._too_large()
+            response = JSONResponse(
+                status_code=error.status_code, content={"detail": error.detail}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # 라우트 안에서 발생하면 FastAPI 예외 처리기가 413 응답을 만듦
+                    raise self._too_large()
+            return message
+
+        async def tracked_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except HTTPException as error:
+            if response_started or error.status_code != 413:
+                raise
+            response = JSONResponse(
+                status_code=error.status_code, content={"detail": error.detail}
+            )
+            await response(scope, receive, send)
@@ -0,0 +1,174 @@
+from typing import List, NamedTuple, Tuple
+
+import numpy as np
+
+from app.core.audio import SAMPLE_RATE
+
+# 에너지가 임계값보다 이만큼 낮아도 영교차율이 높으면 무성음(s, f 등)으로 판단
+_UNVOICED_MARGIN_DB = 10.0
+
+
+class TrimResult(NamedTuple):
+    audio: np.ndarray
+    # 제거된 오디오 길이 (초)
+    removed_seconds: float
+
+
+def frame_size(frame_ms: int, sample_rate: int = SAMPLE_RATE) -> int:
+    return max(1, sample_rate * frame_ms // 1000)
+
+
+def detect_speech(
+    audio: np.ndarray,
+    frame: int,
+    energy_threshold_db: float = -40.0,
+    zcr_threshold: float = 0.3,
+) -> np.ndarray:
+    """
+    겹치지 않는 프레임마다 음성 여부를 판단합니다.
+
+    프레임 에너지(dBFS)가 임계값을 넘거나, 임계값보다 조금 낮더라도 영교차율이
+    높으면(에너지가 작은 무성 자음) 음성으로 봅니다. 모든 프레임을 한 번의
+    NumPy 연산으로 계산합니다.
+
+    Args:
+        audio: 1차원 float32 오디오
+        frame: 프레임 길이 (샘플 수)
+        energy_threshold_db: 음성으로 볼 최소 프레임 에너지 (dBFS)
+        zcr_threshold: 무성음으로 볼 최소 영교차율 (샘플당 부호 변화 비율)
+
+    Returns:
+        (len(audio) // frame,) bool 배열
+    """
+    n_frames = len(audio) // frame
+    frames = audio[: n_frames * frame].reshape(n_frames, frame)
+
+    energy_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+    voiced = energy_db > energy_threshold_db
+    unvoiced = (energy_db > energy_threshold_db - _UNVOICED_MARGIN_DB) & (
+        zcr > zcr_threshold
+    )
+    return voiced | unvoiced
+
+
+def trim_silence(
+    audio: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    frame_ms: int = 30,
+    energy_threshold_db: float = -40.0,
+    zcr_threshold: float = 0.3,
+    padding_ms: int = 200,
+    max_pause_ms: int = 700,
+) -> TrimResult:
+    """
+    앞뒤 무음을 잘라내고 발화 사이의 긴 무음을 max_pause_ms로 줄입니다.
+
+    단어 앞뒤가 잘리지 않도록 음성 프레임 주변 padding_ms는 유지하며, 줄인
+    무음도 max_pause_ms만큼 남기므로 단어 경계는 그대로 유지됩니다.
+    음성을 찾지 못하면 원본을 그대로 반환합니다.
+
+    Args:
+        audio: 1차원 float32 오디오
+        sample_rate: 샘플링 레이트
+        frame_ms: 분석 프레임 길이
+        energy_threshold_db: 음성으로 볼 최소 프레임 에너지 (dBFS)
+        zcr_threshold: 무성음으로 볼 최소 영교차율
+        padding_ms: 음성 앞뒤로 남길 길이
+        max_pause_ms: 발화 사이 무음의 최대 길이
+
+    Returns:
+        잘라낸 오디오와 제거된 길이(초)
+    """
+    frame = frame_size(frame_ms, sample_rate)
+    speech = detect_speech(audio, frame, energy_threshold_db, zcr_threshold)
+    if not speech.any():
+        return TrimResult(audio, 0.0)
+
+    # 음성 프레임 주변 padding만큼 확장
+    pad = padding_ms // frame_ms
+    if pad > 0:
+        speech = np.convolve(speech, np.ones(2 * pad + 1), mode="same") > 0
+
+    # 무음 구간마다 시작 위치를 구해 max_pause 이후 프레임만 제거
+    n_frames = len(speech)
+    index = np.arange(n_frames)
+    silent = ~speech
+    run_starts = silent & np.concatenate(([True], speech[:-1]))
+    run_start = np.maximum.accumulate(np.where(run_starts, index, 0))
+    keep = speech | (index - run_start < max(max_pause_ms // frame_ms, 1))
+
+    # 앞뒤 무음은 모두 제거
+    voiced = np.flatnonzero(speech)
+    first, last = voiced[0], voiced[-1]
+    keep[:first] = False
+    keep[last + 1 :] = False
+
+    # 마지막 프레임이 음성이면 프레임에 들어가지 않은 나머지 샘플도 유지
+    tail = len(audio) - n_frames * frame
+    mask = np.concatenate((np.repeat(keep, frame), np.full(tail, keep[-1])))
+
+    trimmed = audio[mask]
+    return TrimResult(trimmed, (len(audio) - len(trimmed)) / sample_rate)
+
+
+def split_on_silence(
+    audio: np.ndarray,
+    max_samples: int,
+    frame: int,
+    energy_threshold_db: float = -40.0,
+    zcr_threshold: float = 0.3,
+) -> List[Tuple[int, int]]:
+    """
+    긴 오디오를 max_samples 이하의 구간으로 무음 위치에서 나눕니다.
+
+    자를 때마다 남은 길이를 n = ceil(남은 길이 / max_samples)개 구간으로 나누는
+    것을 목표로, 남은 부분을 n - 1개 구간에 담을 수 있는 무음 중 남은 길이 / n
+    지점에 가장 가까운 곳에서 자릅니다. 그런 무음이 없으면(예: 90초를 30초
+    이하로 자르는데 정확히 30초에 무음이 없으면) 구간을 하나 늘려 n + 1개로
+    고르게 나눕니다. 단어 중간에서 자르지 않으므로 구간별 인식 결과를 이어
+    붙여도 단어 경계가 유지됩니다. 허용 범위 안에 무음이 없으면 max_samples
+    위치에서 자릅니다.
+
+    Args:
+        audio: 1차원 float32 오디오
+        max_samples: 구간의 최대 길이 (샘플 수)
+        frame: VAD 프레임 길이 (샘플 수)
+        energy_threshold_db: 음성으로 볼 최소 프레임 에너지 (dBFS)
+        zcr_threshold: 무성음으로 볼 최소 영교차율
+
+    Returns:
+        순서대로 정렬된 (시작, 끝) 샘플 위치 리스트
+    """
+    if len(audio) <= max_samples:
+        return [(0, len(audio))]
+
+    silent = np.flatnonzero(
+        ~detect_speech(audio, frame, energy_threshold_db, zcr_threshold)
+    )
+    # 자르는 위치는 무음 프레임의 가운데
+    cuts = silent * frame + frame // 2
+
+    bounds = []
+    start = 0
+    while len(audio) - start > max_samples:
+        remaining = len(audio) - start
+        segments = -(-remaining // max_samples)
+        allowed = cuts[(cuts > start) & (cuts <= start + max_samples)]
+        # 남은 부분을 segments - 1개 구간에 담을 수 있는 위치
+        feasible = allowed[len(audio) - allowed <= (segments - 1) * max_samples]
+        if len(feasible):
+            allowed = feasible
+        else:
+            segments += 1
+        if len(allowed):
+            target = start + remaining // segments
+            end = int(allowed[np.argmin(np.abs(allowed - target))])
+        else:
+            end = start + max_samples
+        bounds.append((start, end))
+        start = end
+    bounds.append((start, len(audio)))
+    return bounds
@@ -1,14 +1,58 @@
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from app.api.v1 import api_router
-from app.core.database import init_db
+from app.api.v1 import build_api_router
+from app.core.config import settings
+from app.core.database import ReadSessionLocal, init_db
+from app.core.middleware import BodySizeLimitMiddleware
+from app.repositories.script_repository import ScriptRepository
 from app.services.embedding_service import embedding_service
+from app.services.stt_service import stt_service
+from app.services.submission_job_service import fail_interrupted_jobs
+from app.services.transcription_cache import transcription_cache
+
+MULTIPART_OVERHEAD = 64 * 1024
+
+# 시작 시 미리 로드에서 실패한 구성 요소와 오류 메시지
+_warmup_errors: dict = {}
+
+
+async def _prepare_index():
+    async with ReadSessionLocal() as db:
+        await embedding_service.prepare_index(ScriptRepository(db))
+
+
+async def warm_up():
+    """
+    STT/임베딩 모델 로드와 더미 추론, FAISS 인덱스 로드를 동시에 수행합니다.
+
+    실패한 구성 요소는 /ready에 표시되며, 해당 모델은 첫 요청 시 다시 로드됩니다.
+    api 역할은 모델과 인덱스를 사용하지 않으므로 아무것도 로드하지 않습니다.
+    """
+    if not settings.serves_inference:
+        return
+
+    steps = {
+        "stt_model": stt_service.warm_up,
+        "embedding_model": embedding_service.warm_up,
+        "faiss_index": _prepare_index,
+    }
+    if not settings.warmup_on_startup:
+        # 모델은 첫 요청 시 로드하고 인덱스만 준비
+        steps = {"faiss_index": _prepare_index}
+
+    results = await asyncio.gather(
+        *(step() for step in steps.values()), return_exceptions=True
+    )
+    for name, result in zip(steps, results):
+        if isinstance(result, Exception):
+            _warmup_errors[name] = str(result)
 
 
 @asynccontextmanager
@@ -18,14 +62,22 @@ async def lifespan(app: FastAPI):
     """
     # 시작
     await init_db()
+    if settings.serves_inference:
+        # 이전 프로세스가 처리하던 비동기 제출 작업은 이어서 처리할 수 없음
+        await fail_interrupted_jobs()
 
-    # FAISS 인덱스가 있으면 로드
-    embedding_service.load_index()
+    # 모델/인덱스 로드 (백그라운드이면 로드 중에도 요청을 받음)
+    warmup_task = asyncio.create_task(warm_up())
+    if not settings.warmup_in_background:
+        await warmup_task
 
     yield
 
-    # 종료 (필요시)
-    pass
+    # 종료: STT 워커 풀 및 캐시 연결 정리, 저장 대기 중인 인덱스 저장
+    warmup_task.cancel()
+    stt_service.shutdown()
+    embedding_service.flush()
+    transcription_cache.close()
 
 
 app = FastAPI(
@@ -44,12 +96,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 업로드 크기 제한 (multipart 경계와 폼 필드 몫으로 여유를 둠)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_size=settings.max_file_size + MULTIPART_OVERHEAD,
+    paths={"/api/v1/submit"},
+)
+
 # 정적 파일 마운트
 static_path = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
 # 라우터 포함
-app.include_router(api_router, prefix="/api/v1")
+app.include_router(build_api_router(settings.server_role), prefix="/api/v1")
 
 
 @app.get("/")
@@ -69,6 +128,26 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def ready():
+    """
+    모델과 FAISS 인덱스가 메모리에 올라와 요청을 바로 처리할 수 있으면 200,
+    아니면 503을 반환합니다. api 역할은 DB 초기화가 끝나면 바로 준비 상태입니다.
+    """
+    checks = {}
+    if settings.serves_inference:
+        checks = {
+            "stt_model": stt_service.ready,
+            "embedding_model": embedding_service.model is not None,
+            "faiss_index": embedding_service.index_loaded,
+        }
+    is_ready = all(checks.values())
+    content = {"status": "ready" if is_ready else "not_ready", "checks": checks}
+    if _warmup_errors and not is_ready:
+        content["errors"] = _warmup_errors
+    return JSONResponse(status_code=200 if is_ready else 503, content=content)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,5 +1,21 @@
 from .base import Base
-from .feedback import Feedback
+from .feedback import Feedback, ScoringMode
+from .rescore_run import RescoreRun, RescoreStatus
 from .script import Script
+from .submission_job import JobStatus, SubmissionJob
+from .word_error import FeedbackWordError, WordErrorType
+from .word_mistake import WordMistakeCount
 
-__all__ = ["Script", "Feedback", "Base"]
+__all__ = [
+    "Script",
+    "Feedback",
+    "ScoringMode",
+    "SubmissionJob",
+    "JobStatus",
+    "WordMistakeCount",
+    "FeedbackWordError",
+    "WordErrorType",
+    "RescoreRun",
+    "RescoreStatus",
+    "Base",
+]
@@ -1,10 +1,30 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+import enum
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import false, func
 
 from app.models.base import Base
 
 
+class ScoringMode(str, enum.Enum):
+    # STT로 받아쓴 문장을 원본과 비교
+    TRANSCRIPTION = "transcription"
+    # 원본 스크립트를 디코더에 강제 입력하여 단어별 로그 우도로 채점
+    FORCED_ALIGNMENT = "forced_alignment"
+
+
 class Feedback(Base):
     __tablename__ = "feedbacks"
 
@@ -15,6 +35,16 @@ class Feedback(Base):
     accuracy_score = Column(Float, nullable=False)
     missing_words = Column(Text)
     feedback_text = Column(Text)
+    scoring_mode = Column(
+        String, nullable=False, server_default=ScoringMode.TRANSCRIPTION.value
+    )
+    # forced_alignment 모드의 단어별 평균 토큰 로그 우도 [{"word", "log_prob"}, ...]
+    word_scores = Column(JSON, nullable=True)
+    # 단어별 오류 행(feedback_word_errors)이 생성되었는지 여부 (오류가 없어도 True)
+    word_errors_recorded = Column(Boolean, nullable=False, server_default=false())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     script = relationship("Script")
+
+    # 스크립트별 피드백 목록의 키셋 페이지네이션용
+    __table_args__ = (Index("ix_feedbacks_script_id_id", "script_id", "id"),)
@@ -0,0 +1,33 @@
+import enum
+
+from sqlalchemy import Column, DateTime, Float, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class RescoreStatus(str, enum.Enum):
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class RescoreRun(Base):
+    """피드백 재채점 실행 기록이자 재개용 체크포인트입니다."""
+
+    __tablename__ = "rescore_runs"
+
+    id = Column(String(32), primary_key=True)
+    status = Column(String, nullable=False, default=RescoreStatus.RUNNING.value)
+    # 실행 시작 시점의 마지막 피드백 ID (이후 제출은 이미 새 규칙으로 채점됨)
+    max_feedback_id = Column(Integer, nullable=False)
+    # 마지막으로 커밋된 청크의 마지막 피드백 ID
+    last_feedback_id = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=False)
+    rows_per_second = Column(Float, nullable=False, default=0.0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,30 @@
+import enum
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    TRANSCRIBING = "transcribing"
+    EVALUATING = "evaluating"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class SubmissionJob(Base):
+    __tablename__ = "submission_jobs"
+
+    id = Column(String(32), primary_key=True)
+    script_id = Column(Integer, ForeignKey("scripts.id"), nullable=False)
+    audio_path = Column(String, nullable=False)
+    status = Column(String, nullable=False, default=JobStatus.QUEUED.value, index=True)
+    feedback_id = Column(Integer, ForeignKey("feedbacks.id"), nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,32 @@
+import enum
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class WordErrorType(str, enum.Enum):
+    MISSING = "missing"
+    EXTRA = "extra"
+    SUBSTITUTED = "substituted"
+    # forced_alignment 채점에서 로그 우도가 낮은 원본 단어
+    WEAK = "weak"
+
+
+class FeedbackWordError(Base):
+    __tablename__ = "feedback_word_errors"
+
+    id = Column(Integer, primary_key=True)
+    feedback_id = Column(
+        Integer, ForeignKey("feedbacks.id"), nullable=False, index=True
+    )
+    script_id = Column(Integer, ForeignKey("scripts.id"), nullable=False, index=True)
+    # missing/substituted는 원본 단어, extra는 인식된 단어
+    word = Column(String, nullable=False, index=True)
+    error_type = Column(String, nullable=False)
+    # substituted일 때 대신 인식된 단어
+    recognized_word = Column(String, nullable=True)
+    # 원본 문장에서의 단어 위치 (extra는 삽입된 위치)
+    position = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
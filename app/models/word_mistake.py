@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class WordMistakeCount(Base):
+    __tablename__ = "word_mistake_counts"
+
+    word = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0, index=True)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -1,4 +1,11 @@
 from .feedback_repository import FeedbackRepository
+from .rescore_run_repository import RescoreRunRepository
 from .script_repository import ScriptRepository
+from .submission_job_repository import SubmissionJobRepository
 
-__all__ = ["ScriptRepository", "FeedbackRepository"]
+__all__ = [
+    "ScriptRepository",
+    "FeedbackRepository",
+    "SubmissionJobRepository",
+    "RescoreRunRepository",
+]
@@ -1,9 +1,46 @@
-from typing import List, Optional
+from collections import Counter
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.feedback import Feedback
+from app.core.config import settings
+from app.core.evaluator import PronunciationEvaluator, WordError
+from app.models.feedback import Feedback, ScoringMode
+from app.models.script import Script
+from app.models.word_error import FeedbackWordError
+from app.models.word_mistake import WordMistakeCount
+
+# 누락 단어 집계 백필 시 한 번에 읽는 행 수
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def split_missing_words(missing_words: Optional[str]) -> List[str]:
+    """쉼표로 연결된 누락 단어 문자열을 단어 리스트로 나눕니다."""
+    if not missing_words:
+        return []
+    return [word.strip() for word in missing_words.split(",") if word.strip()]
+
+
+class FeedbackScore(NamedTuple):
+    """재채점된 피드백 하나의 새 평가 결과입니다."""
+
+    feedback_id: int
+    script_id: int
+    created_at: Optional[datetime]
+    accuracy_score: float
+    missing_words: Optional[str]
+    feedback_text: str
+    word_errors: Sequence[WordError]
 
 
 class FeedbackRepository:
@@ -18,6 +55,9 @@ class FeedbackRepository:
         accuracy_score: float,
         missing_words: Optional[str] = None,
         feedback_text: Optional[str] = None,
+        word_errors: Sequence[WordError] = (),
+        scoring_mode: str = ScoringMode.TRANSCRIPTION.value,
+        word_scores: Optional[List[dict]] = None,
     ) -> Feedback:
         feedback = Feedback(
             script_id=script_id,
@@ -26,18 +66,129 @@ class FeedbackRepository:
             accuracy_score=accuracy_score,
             missing_words=missing_words,
             feedback_text=feedback_text,
+            scoring_mode=scoring_mode,
+            word_scores=word_scores,
+            word_errors_recorded=True,
         )
         self.db.add(feedback)
+        # 단어별 오류 행이 feedback.id를 참조하므로 먼저 flush
+        await self.db.flush()
+        self.db.add_all(
+            FeedbackWordError(**row)
+            for row in self._word_error_rows(
+                feedback.id, feedback.script_id, feedback.created_at, word_errors
+            )
+        )
+        # 피드백과 같은 트랜잭션에서 누락 단어 집계 갱신
+        await self._add_mistake_counts(Counter(split_missing_words(missing_words)))
+        # 커밋 후 refresh하면 새 트랜잭션이 단일 쓰기 연결을 계속 점유하므로 하지 않음
+        # (id는 flush에서 채워짐)
         await self.db.commit()
-        await self.db.refresh(feedback)
         return feedback
 
+    @staticmethod
+    def _word_error_rows(
+        feedback_id: int,
+        script_id: int,
+        created_at: Optional[datetime],
+        word_errors: Sequence[WordError],
+    ) -> List[dict]:
+        """
+        단어별 오류를 feedback_word_errors 행으로 변환합니다.
+
+        created_at이 없으면(새 피드백) DB 기본값인 현재 시각을 사용합니다.
+        """
+        rows = []
+        for error in word_errors:
+            row = {
+                "feedback_id": feedback_id,
+                "script_id": script_id,
+                "word": error.word,
+                "error_type": error.error_type,
+                "recognized_word": error.recognized_word,
+                "position": error.position,
+            }
+            if created_at is not None:
+                row["created_at"] = created_at
+            rows.append(row)
+        return rows
+
+    async def _add_mistake_counts(self, counts: Counter):
+        """
+        단어별 누락 횟수에 counts를 upsert로 더합니다. (커밋하지 않음)
+
+        재채점에서는 음수도 더하며, 0 이하가 된 단어는 집계에서 지웁니다.
+        """
+        counts = {word: count for word, count in counts.items() if count}
+        if not counts:
+            return
+
+        stmt = sqlite_insert(WordMistakeCount).values(
+            [{"word": word, "count": count} for word, count in counts.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WordMistakeCount.word],
+            set_={
+                "count": WordMistakeCount.count + stmt.excluded.count,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+        if any(count < 0 for count in counts.values()):
+            await self.db.execute(
+                delete(WordMistakeCount).where(
+                    WordMistakeCount.word.in_(list(counts)),
+                    WordMistakeCount.count <= 0,
+                )
+            )
+
     async def get_by_id(self, feedback_id: int) -> Optional[Feedback]:
         result = await self.db.execute(
             select(Feedback).where(Feedback.id == feedback_id)
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def _list_query(script_id: Optional[int], after_id: Optional[int]):
+        stmt = select(Feedback).order_by(Feedback.id)
+        if script_id is not None:
+            stmt = stmt.where(Feedback.script_id == script_id)
+        if after_id is not None:
+            stmt = stmt.where(Feedback.id > after_id)
+        return stmt
+
+    async def get_page(
+        self, script_id: Optional[int], after_id: Optional[int], limit: int
+    ) -> List[Feedback]:
+        """after_id 다음부터 최대 limit개의 피드백을 가져옵니다. (키셋 페이지네이션)"""
+        result = await self.db.execute(
+            self._list_query(script_id, after_id).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def stream(
+        self, script_id: Optional[int] = None, after_id: Optional[int] = None
+    ) -> AsyncIterator[Feedback]:
+        """after_id 다음의 모든 피드백을 청크 단위로 읽으며 반환합니다."""
+        result = await self.db.stream(
+            self._list_query(script_id, after_id).execution_options(
+                yield_per=settings.stream_chunk_size
+            )
+        )
+        async for feedback in result.scalars():
+            yield feedback
+
+    async def get_recent_recordings(self, limit: int) -> List[Tuple[str, str]]:
+        """최근 피드백 limit개의 (오디오 경로, 스크립트 문장)을 가져옵니다."""
+        result = await self.db.execute(
+            select(Feedback.audio_path, Script.text)
+            .join(Script, Script.id == Feedback.script_id)
+            .order_by(Feedback.id.desc())
+            .limit(limit)
+        )
+        return [(audio_path, text) for audio_path, text in result.all()]
+
     async def get_all(self) -> List[Feedback]:
         result = await self.db.execute(select(Feedback))
         return list(result.scalars().all())
@@ -50,3 +201,254 @@ class FeedbackRepository:
     async def get_total_submissions(self) -> int:
         result = await self.db.execute(select(func.count(Feedback.id)))
         return result.scalar() or 0
+
+    async def get_top_mistakes(self, limit: int = 10) -> List[str]:
+        """누락 횟수가 가장 많은 단어를 가져옵니다."""
+        result = await self.db.execute(
+            select(WordMistakeCount.word)
+            .order_by(WordMistakeCount.count.desc(), WordMistakeCount.word)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def count_missing_words(
+        self, after_id: int = 0, max_id: Optional[int] = None
+    ) -> Counter:
+        """
+        after_id < id <= max_id 범위 피드백의 누락 단어 수를 셉니다.
+
+        피드백을 청크 단위로 스트리밍하므로 메모리에는 단어별 카운트만 유지됩니다.
+        """
+        stmt = select(Feedback.missing_words).where(
+            Feedback.missing_words.isnot(None), Feedback.id > after_id
+        )
+        if max_id is not None:
+            stmt = stmt.where(Feedback.id <= max_id)
+
+        counts: Counter = Counter()
+        result = await self.db.stream(
+            stmt.execution_options(yield_per=BACKFILL_CHUNK_SIZE)
+        )
+        async for missing_words in result.scalars():
+            counts.update(split_missing_words(missing_words))
+        return counts
+
+    async def replace_mistake_counts(self, counts: Counter, max_id: int) -> int:
+        """
+        누락 단어 집계 테이블을 교체합니다.
+
+        counts는 max_id까지의 피드백으로 센 값이며, 그 뒤에 제출된 피드백은 같은
+        트랜잭션 안에서 세어 더하므로 집계 사이에 커밋된 제출이 빠지지 않습니다.
+
+        Returns:
+            집계된 고유 단어 수
+        """
+        # 먼저 지워 쓰기 잠금을 잡아야 나머지를 세는 동안 다른 제출이 커밋되지 않음
+        await self.db.execute(delete(WordMistakeCount))
+        counts = counts + await self.count_missing_words(after_id=max_id)
+        words = list(counts.items())
+        for start in range(0, len(words), BACKFILL_CHUNK_SIZE):
+            await self.db.execute(
+                sqlite_insert(WordMistakeCount),
+                [
+                    {"word": word, "count": count}
+                    for word, count in words[start : start + BACKFILL_CHUNK_SIZE]
+                ],
+            )
+        await self.db.commit()
+        return len(words)
+
+    async def get_top_error_words(
+        self,
+        script_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        error_type: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[Tuple[str, int]]:
+        """
+        조건에 맞는 단어별 오류 횟수를 많은 순으로 가져옵니다.
+
+        예: 스크립트 X에서 지난주에 가장 많이 누락된 단어
+
+        Args:
+            script_id: 특정 스크립트로 제한
+            since: 이 시각 이후의 제출로 제한
+            error_type: missing, extra, substituted 중 하나로 제한
+            limit: 최대 단어 수
+
+        Returns:
+            (단어, 횟수) 리스트
+        """
+        count = func.count(FeedbackWordError.id).label("count")
+        stmt = select(FeedbackWordError.word, count)
+        if script_id is not None:
+            stmt = stmt.where(FeedbackWordError.script_id == script_id)
+        if since is not None:
+            stmt = stmt.where(FeedbackWordError.created_at >= since)
+        if error_type is not None:
+            stmt = stmt.where(FeedbackWordError.error_type == error_type)
+
+        result = await self.db.execute(
+            stmt.group_by(FeedbackWordError.word)
+            .order_by(count.desc(), FeedbackWordError.word)
+            .limit(limit)
+        )
+        return [(word, count) for word, count in result.all()]
+
+    async def migrate_word_errors(self) -> int:
+        """
+        단어별 오류 행이 없는 기존 피드백에 대해 오류 행을 생성합니다. (마이그레이션용)
+
+        쉼표로 연결된 missing_words는 누락 단어만 담고 있으므로, 원본 스크립트와
+        인식 텍스트를 다시 정렬하여 누락/추가/대체를 모두 복원합니다.
+        피드백 ID 순서로 BACKFILL_CHUNK_SIZE개씩 처리하고 청크마다 커밋하며,
+        처리한 피드백은 오류가 없어도 word_errors_recorded로 표시하므로 다시
+        실행하면 남은 피드백만 처리합니다.
+
+        Returns:
+            생성된 오류 행 수
+        """
+        # 표시 컬럼 추가 전에 이미 오류 행이 만들어진 피드백
+        has_errors = exists().where(FeedbackWordError.feedback_id == Feedback.id)
+
+        created = 0
+        after_id = 0
+        while True:
+            result = await self.db.execute(
+                select(
+                    Feedback.id,
+                    Feedback.script_id,
+                    Feedback.created_at,
+                    Feedback.recognized_text,
+                    Script.text,
+                    has_errors,
+                )
+                .join(Script, Script.id == Feedback.script_id)
+                .where(
+                    Feedback.id > after_id,
+                    ~Feedback.word_errors_recorded,
+                    self._transcribed,
+                )
+                .order_by(Feedback.id)
+                .limit(BACKFILL_CHUNK_SIZE)
+            )
+            chunk = result.all()
+            if not chunk:
+                return created
+
+            rows = []
+            for feedback_id, script_id, created_at, recognized, text, done in chunk:
+                if done:
+                    continue
+                word_errors = PronunciationEvaluator.find_word_errors(
+                    text, recognized or ""
+                )
+                rows.extend(
+                    self._word_error_rows(
+                        feedback_id, script_id, created_at, word_errors
+                    )
+                )
+
+            if rows:
+                await self.db.execute(sqlite_insert(FeedbackWordError), rows)
+            await self.db.execute(
+                update(Feedback)
+                .where(Feedback.id.in_([row[0] for row in chunk]))
+                .values(word_errors_recorded=True)
+            )
+            await self.db.commit()
+
+            created += len(rows)
+            after_id = chunk[-1][0]
+
+    async def get_max_id(self) -> int:
+        result = await self.db.execute(select(func.max(Feedback.id)))
+        return result.scalar() or 0
+
+    # 인식 텍스트로 다시 채점할 수 있는 피드백 (forced_alignment 결과는 인식 텍스트가 없음)
+    _transcribed = Feedback.scoring_mode == ScoringMode.TRANSCRIPTION.value
+
+    async def count_between(self, after_id: int, max_id: int) -> int:
+        """after_id < id <= max_id 범위의 재채점 대상 피드백 수를 셉니다."""
+        result = await self.db.execute(
+            select(func.count(Feedback.id)).where(
+                Feedback.id > after_id, Feedback.id <= max_id, self._transcribed
+            )
+        )
+        return result.scalar() or 0
+
+    async def get_rescore_chunk(
+        self, after_id: int, max_id: int, limit: int
+    ) -> List[Tuple[int, int, Optional[datetime], str, str]]:
+        """
+        재채점할 피드백을 스크립트 텍스트와 함께 ID 순서로 가져옵니다.
+
+        Returns:
+            (피드백 ID, 스크립트 ID, 생성 시각, 인식 텍스트, 스크립트 텍스트) 리스트
+        """
+        result = await self.db.execute(
+            select(
+                Feedback.id,
+                Feedback.script_id,
+                Feedback.created_at,
+                Feedback.recognized_text,
+                Script.text,
+            )
+            .join(Script, Script.id == Feedback.script_id)
+            .where(Feedback.id > after_id, Feedback.id <= max_id, self._transcribed)
+            .order_by(Feedback.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def update_scores(self, scores: Sequence[FeedbackScore]):
+        """
+        재채점 결과를 한 번의 executemany UPDATE로 반영하고 단어별 오류와 누락 단어
+        집계를 갱신합니다. (커밋하지 않음)
+        """
+        if not scores:
+            return
+
+        # 누락 단어 집계를 같은 트랜잭션에서 바뀐 만큼만 갱신
+        deltas: Counter = Counter()
+        result = await self.db.execute(
+            select(Feedback.missing_words).where(
+                Feedback.id.in_([score.feedback_id for score in scores])
+            )
+        )
+        for missing_words in result.scalars():
+            deltas.subtract(split_missing_words(missing_words))
+        for score in scores:
+            deltas.update(split_missing_words(score.missing_words))
+        await self._add_mistake_counts(deltas)
+
+        await self.db.execute(
+            update(Feedback),
+            [
+                {
+                    "id": score.feedback_id,
+                    "accuracy_score": score.accuracy_score,
+                    "missing_words": score.missing_words,
+                    "feedback_text": score.feedback_text,
+                    "word_errors_recorded": True,
+                }
+                for score in scores
+            ],
+        )
+
+        await self.db.execute(
+            delete(FeedbackWordError).where(
+                FeedbackWordError.feedback_id.in_(
+                    [score.feedback_id for score in scores]
+                )
+            )
+        )
+        rows = [
+            row
+            for score in scores
+            for row in self._word_error_rows(
+                score.feedback_id, score.script_id, score.created_at, score.word_errors
+            )
+        ]
+        if rows:
+            await self.db.execute(sqlite_insert(FeedbackWordError), rows)
@@ -0,0 +1,69 @@
+import uuid
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rescore_run import RescoreRun, RescoreStatus
+
+
+class RescoreRunRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, max_feedback_id: int, total: int) -> RescoreRun:
+        run = RescoreRun(
+            id=uuid.uuid4().hex,
+            status=RescoreStatus.RUNNING.value,
+            max_feedback_id=max_feedback_id,
+            last_feedback_id=0,
+            processed=0,
+            total=total,
+            rows_per_second=0.0,
+        )
+        self.db.add(run)
+        await self.db.commit()
+        await self.db.refresh(run)
+        return run
+
+    async def get_by_id(self, run_id: str) -> Optional[RescoreRun]:
+        result = await self.db.execute(
+            select(RescoreRun)
+            .where(RescoreRun.id == run_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def update_progress(
+        self,
+        run_id: str,
+        last_feedback_id: int,
+        processed: int,
+        rows_per_second: float,
+    ):
+        """
+        체크포인트를 갱신하고 커밋합니다.
+
+        같은 세션에서 반영한 재채점 결과도 이 커밋으로 함께 저장됩니다.
+        """
+        await self.db.execute(
+            update(RescoreRun)
+            .where(RescoreRun.id == run_id)
+            .values(
+                last_feedback_id=last_feedback_id,
+                processed=processed,
+                rows_per_second=rows_per_second,
+            )
+        )
+        await self.db.commit()
+
+    async def update_status(
+        self, run_id: str, status: RescoreStatus, error: Optional[str] = None
+    ):
+        # 재개된 실행에서는 이전 오류를 지움
+        await self.db.execute(
+            update(RescoreRun)
+            .where(RescoreRun.id == run_id)
+            .values(status=status.value, error=error)
+        )
+        await self.db.commit()
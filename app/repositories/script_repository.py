@@ -1,10 +1,16 @@
-from typing import List, Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
+from app.core.cache import LRUCache
+from app.core.config import settings
 from app.models.script import Script
 
+# 유사 스크립트 결과에 쓰이는 script id → text 캐시 (프로세스 단위)
+script_text_cache = LRUCache(settings.script_text_cache_size)
+
 
 class ScriptRepository:
     def __init__(self, db: AsyncSession):
@@ -15,8 +21,34 @@ class ScriptRepository:
         self.db.add(script)
         await self.db.commit()
         await self.db.refresh(script)
+        # SQLite는 삭제된 최대 rowid를 재사용할 수 있으므로 새 ID도 무효화
+        self._invalidate([script.id])
         return script
 
+    async def bulk_create(
+        self, texts: List[str], embeddings: List[Optional[bytes]]
+    ) -> List[int]:
+        """
+        여러 스크립트를 한 번의 executemany INSERT로 생성합니다.
+
+        Returns:
+            입력 순서와 같은 순서의 생성된 스크립트 ID 리스트
+        """
+        if not texts:
+            return []
+
+        result = await self.db.execute(
+            insert(Script).returning(Script.id, sort_by_parameter_order=True),
+            [
+                {"text": text, "embedding": embedding}
+                for text, embedding in zip(texts, embeddings)
+            ],
+        )
+        script_ids = list(result.scalars().all())
+        await self.db.commit()
+        self._invalidate(script_ids)
+        return script_ids
+
     async def update_embedding(
         self, script_id: int, embedding: bytes
     ) -> Optional[Script]:
@@ -25,16 +57,78 @@ class ScriptRepository:
             script.embedding = embedding
             await self.db.commit()
             await self.db.refresh(script)
+            self._invalidate([script_id])
         return script
 
+    @staticmethod
+    def _invalidate(script_ids: Iterable[int]):
+        """변경된 스크립트를 텍스트 캐시에서 제거합니다."""
+        for script_id in script_ids:
+            script_text_cache.delete(script_id)
+
+    @staticmethod
+    def _list_query(after_id: Optional[int]):
+        """
+        ID 오름차순 목록 쿼리를 만듭니다.
+
+        ID는 생성 순서대로 증가하므로 created_at 순서와 같습니다.
+        목록에는 필요 없는 임베딩 BLOB은 읽지 않습니다.
+        """
+        stmt = select(Script).options(defer(Script.embedding)).order_by(Script.id)
+        if after_id is not None:
+            stmt = stmt.where(Script.id > after_id)
+        return stmt
+
     async def get_all(self) -> List[Script]:
-        result = await self.db.execute(select(Script))
+        """모든 스크립트를 ID 순서로 가져옵니다. (임베딩 제외)"""
+        result = await self.db.execute(self._list_query(None))
+        return list(result.scalars().all())
+
+    async def get_page(self, after_id: Optional[int], limit: int) -> List[Script]:
+        """after_id 다음부터 최대 limit개의 스크립트를 가져옵니다. (키셋 페이지네이션)"""
+        result = await self.db.execute(self._list_query(after_id).limit(limit))
         return list(result.scalars().all())
 
+    async def stream(self, after_id: Optional[int] = None) -> AsyncIterator[Script]:
+        """after_id 다음의 모든 스크립트를 청크 단위로 읽으며 반환합니다."""
+        result = await self.db.stream(
+            self._list_query(after_id).execution_options(
+                yield_per=settings.stream_chunk_size
+            )
+        )
+        async for script in result.scalars():
+            yield script
+
     async def get_by_id(self, script_id: int) -> Optional[Script]:
         result = await self.db.execute(select(Script).where(Script.id == script_id))
         return result.scalar_one_or_none()
 
+    async def get_texts(self, script_ids: List[int]) -> Dict[int, str]:
+        """
+        스크립트 텍스트를 캐시에서 가져오고, 없는 것만 한 번의 쿼리로 조회합니다.
+
+        Returns:
+            script id → text 딕셔너리 (존재하지 않는 ID는 제외)
+        """
+        texts = {}
+        missing = []
+        for script_id in script_ids:
+            text = script_text_cache.get(script_id)
+            if text is None:
+                missing.append(script_id)
+            else:
+                texts[script_id] = text
+
+        if missing:
+            result = await self.db.execute(
+                select(Script.id, Script.text).where(Script.id.in_(set(missing)))
+            )
+            for script_id, text in result.all():
+                script_text_cache.set(script_id, text)
+                texts[script_id] = text
+
+        return texts
+
     async def get_all_with_embeddings(self) -> List[Script]:
         result = await self.db.execute(
             select(Script).where(Script.embedding.isnot(None))
@@ -0,0 +1,72 @@
+import uuid
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.submission_job import JobStatus, SubmissionJob
+
+
+class SubmissionJobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, script_id: int, audio_path: str) -> SubmissionJob:
+        job = SubmissionJob(
+            id=uuid.uuid4().hex,
+            script_id=script_id,
+            audio_path=audio_path,
+            status=JobStatus.QUEUED.value,
+        )
+        self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+        return job
+
+    async def get_by_id(self, job_id: str) -> Optional[SubmissionJob]:
+        result = await self.db.execute(
+            select(SubmissionJob)
+            .where(SubmissionJob.id == job_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def update_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        feedback_id: Optional[int] = None,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ):
+        values = {"status": status.value}
+        if feedback_id is not None:
+            values["feedback_id"] = feedback_id
+        if result is not None:
+            values["result"] = result
+        if error is not None:
+            values["error"] = error
+
+        await self.db.execute(
+            update(SubmissionJob).where(SubmissionJob.id == job_id).values(**values)
+        )
+        await self.db.commit()
+
+    async def fail_unfinished(self, error: str) -> int:
+        """
+        끝나지 않은(queued/transcribing/evaluating) 작업을 모두 실패로 표시합니다.
+
+        Returns:
+            실패로 바뀐 작업 수
+        """
+        result = await self.db.execute(
+            update(SubmissionJob)
+            .where(
+                SubmissionJob.status.notin_(
+                    [JobStatus.DONE.value, JobStatus.FAILED.value]
+                )
+            )
+            .values(status=JobStatus.FAILED.value, error=error)
+        )
+        await self.db.commit()
+        return result.rowcount
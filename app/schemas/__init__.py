@@ -1,20 +1,42 @@
-from .dashboard import DashboardStats
+from .dashboard import (
+    DashboardStats,
+    SilenceTrimStats,
+    TranscriptionCacheStats,
+    WordErrorCount,
+)
 from .feedback import (
     FeedbackCreate,
+    FeedbackPage,
     FeedbackResponse,
     SimilarScript,
+    StreamPartialResponse,
     SubmitRequest,
     SubmitResponse,
+    WordScore,
 )
-from .script import ScriptCreate, ScriptResponse
+from .job import SubmissionJobResponse
+from .maintenance import IndexRebuildResult, IndexReport, RescoreRunResponse
+from .script import ScriptBulkResult, ScriptCreate, ScriptPage, ScriptResponse
 
 __all__ = [
     "ScriptCreate",
     "ScriptResponse",
+    "ScriptBulkResult",
+    "ScriptPage",
     "FeedbackCreate",
     "FeedbackResponse",
+    "FeedbackPage",
     "SimilarScript",
     "SubmitRequest",
     "SubmitResponse",
+    "StreamPartialResponse",
+    "WordScore",
     "DashboardStats",
+    "TranscriptionCacheStats",
+    "SilenceTrimStats",
+    "WordErrorCount",
+    "SubmissionJobResponse",
+    "IndexRebuildResult",
+    "IndexReport",
+    "RescoreRunResponse",
 ]
@@ -7,3 +7,25 @@ class DashboardStats(BaseModel):
     total_submissions: int
     average_score: float
     top_mistakes: List[str]
+
+
+class WordErrorCount(BaseModel):
+    word: str
+    count: int
+
+
+class TranscriptionCacheStats(BaseModel):
+    enabled: bool
+    memory_entries: int
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    hit_rate: float
+
+
+class SilenceTrimStats(BaseModel):
+    enabled: bool
+    recordings: int
+    input_seconds: float
+    removed_seconds: float
+    removed_ratio: float
@@ -4,6 +4,12 @@ from typing import List, Optional
 from pydantic import BaseModel
 
 
+class WordScore(BaseModel):
+    word: str
+    # 단어를 이루는 토큰들의 평균 로그 우도 (forced_alignment 채점)
+    log_prob: float
+
+
 class FeedbackCreate(BaseModel):
     script_id: int
     audio_path: str
@@ -21,12 +27,20 @@ class FeedbackResponse(BaseModel):
     accuracy_score: float
     missing_words: Optional[str]
     feedback_text: Optional[str]
+    scoring_mode: str = "transcription"
+    word_scores: Optional[List[WordScore]] = None
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class FeedbackPage(BaseModel):
+    items: List[FeedbackResponse]
+    # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지이면 None)
+    next_cursor: Optional[int] = None
+
+
 class SubmitRequest(BaseModel):
     script_id: int
 
@@ -43,4 +57,16 @@ class SubmitResponse(BaseModel):
     accuracy_score: float
     missing_words: Optional[str]
     feedback_text: Optional[str]
+    scoring_mode: str = "transcription"
+    word_scores: Optional[List[WordScore]] = None
     similar_scripts: List[SimilarScript] = []
+
+
+class StreamPartialResponse(BaseModel):
+    recognized_text: str
+    # 지금까지 읽은 원본 앞부분에 대한 정확도
+    accuracy_score: float
+    words_read: int
+    total_words: int
+    missing_words: List[str] = []
+    duration: float
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.schemas.feedback import SubmitResponse
+
+
+class SubmissionJobResponse(BaseModel):
+    id: str
+    script_id: int
+    status: str
+    feedback_id: Optional[int] = None
+    result: Optional[SubmitResponse] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class IndexRebuildResult(BaseModel):
+    indexed_scripts: int
+
+
+class IndexReport(BaseModel):
+    index_type: str
+    ntotal: int
+    k: int
+    queries: int
+    recall: float
+    exact_ms_per_query: float
+    ann_ms_per_query: float
+
+
+class RescoreRunResponse(BaseModel):
+    id: str
+    status: str
+    processed: int
+    total: int
+    last_feedback_id: int
+    rows_per_second: float
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -7,6 +8,10 @@ class ScriptCreate(BaseModel):
     text: str
 
 
+class ScriptBulkResult(BaseModel):
+    created: int
+
+
 class ScriptResponse(BaseModel):
     id: int
     text: str
@@ -14,3 +19,9 @@ class ScriptResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ScriptPage(BaseModel):
+    items: List[ScriptResponse]
+    # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지이면 None)
+    next_cursor: Optional[int] = None
@@ -1,5 +1,15 @@
 from .embedding_service import embedding_service
 from .feedback_service import FeedbackService
+from .silence_trimmer import silence_trimmer
+from .speech_recognizer import SpeechRecognizer
 from .stt_service import stt_service
+from .transcription_cache import transcription_cache
 
-__all__ = ["stt_service", "embedding_service", "FeedbackService"]
+__all__ = [
+    "stt_service",
+    "embedding_service",
+    "transcription_cache",
+    "silence_trimmer",
+    "FeedbackService",
+    "SpeechRecognizer",
+]
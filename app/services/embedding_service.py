@@ -1,13 +1,73 @@
+import asyncio
+import os
 import pickle
+import threading
+import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-import faiss
 import numpy as np
-import torch
-from transformers import AutoModel, AutoTokenizer
 
 from app.core.config import settings
+from app.repositories.script_repository import ScriptRepository
+from app.services import vector_index
+
+QUANTIZATION_MODES = ("none", "int8")
+
+
+def _quantize_int8(model):
+    """
+    Linear 레이어를 동적 int8 양자화한 모델 복사본을 반환합니다.
+
+    가중치는 int8로 저장하고 활성값은 실행 시 배치마다 양자화하므로, CPU에서
+    행렬 곱이 빨라지고 모델 메모리가 줄어듭니다. 출력은 float32 그대로입니다.
+    """
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def _load_model(quantization: str = "none"):
+    """토크나이저와 (필요하면 양자화한) 임베딩 모델을 로드합니다."""
+    from transformers import AutoModel, AutoTokenizer
+
+    if quantization not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown embedding quantization: {quantization}")
+
+    tokenizer = AutoTokenizer.from_pretrained(
+        settings.embedding_model, cache_dir=settings.huggingface_cache_dir
+    )
+    model = AutoModel.from_pretrained(
+        settings.embedding_model, cache_dir=settings.huggingface_cache_dir
+    )
+    model.eval()
+    if quantization == "int8":
+        model = _quantize_int8(model)
+    return tokenizer, model
+
+
+def _embed_batch(tokenizer, model, input_ids: List[List[int]]) -> np.ndarray:
+    """
+    길이가 비슷한 토큰 시퀀스 묶음을 한 번의 forward pass로 임베딩합니다.
+
+    배치 내 최대 길이까지만 패딩하고, 패딩 토큰을 제외한 평균 풀링을 사용하므로
+    generate_embedding의 단건 결과와 같은 벡터를 얻습니다.
+    """
+    import torch
+
+    inputs = tokenizer.pad({"input_ids": input_ids}, return_tensors="pt")
+
+    with torch.no_grad():
+        outputs = model(**inputs)
+        mask = (
+            inputs["attention_mask"].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+        )
+        summed = (outputs.last_hidden_state * mask).sum(dim=1)
+        embeddings = summed / mask.sum(dim=1).clamp(min=1)
+
+    return embeddings.numpy()
 
 
 class EmbeddingService:
@@ -15,18 +75,108 @@ class EmbeddingService:
         self.model = None
         self.tokenizer = None
         self.index = None
-        self.script_ids = []
+        # 검색/짧은 변경용 잠금과, 인덱스를 바꾸는 작업을 직렬화하는 잠금
+        # (학습/재구축은 _write_lock만 잡고 수행하므로 그동안 검색은 이전 인덱스로 처리)
+        # 저장/평가처럼 인덱스를 읽기만 하는 긴 작업은 _write_lock만 잡아 검색을 막지 않음
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # add/remove가 인덱스를 바꿀 때마다 증가 (시작 시 로드한 인덱스 교체 여부 판단)
+        self._generation = 0
+        self._dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._load_lock = asyncio.Lock()
+        # 시작 시 인덱스 로드(또는 DB로부터 구축)가 끝났는지 여부
+        self.index_loaded = False
+
+    def _load_model_sync(self):
+        import torch
+
+        if settings.embedding_threads > 0:
+            # 임베딩은 메인 프로세스의 스레드에서 실행되므로 프로세스 전체에 적용됨
+            torch.set_num_threads(settings.embedding_threads)
+        self.tokenizer, self.model = _load_model(settings.embedding_quantization)
 
     async def load_model(self):
-        """임베딩 모델을 지연 로딩합니다."""
+        """
+        임베딩 모델을 로딩합니다. (보통 시작 시 warm_up에서 미리 호출됨)
+
+        로딩은 스레드에서 수행하여 이벤트 루프를 막지 않으며, 동시에 호출되어도
+        한 번만 로드합니다.
+        """
         if self.model is None:
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                settings.embedding_model, cache_dir=settings.huggingface_cache_dir
-            )
-            self.model = AutoModel.from_pretrained(
-                settings.embedding_model, cache_dir=settings.huggingface_cache_dir
+            async with self._load_lock:
+                if self.model is None:
+                    await asyncio.to_thread(self._load_model_sync)
+
+    async def warm_up(self):
+        """모델을 로드하고 더미 임베딩을 생성하여 커널 초기화를 미리 수행합니다."""
+        await self.load_model()
+        await self.generate_embedding("warm up")
+
+    async def prepare_index(self, script_repo: ScriptRepository) -> int:
+        """
+        저장된 인덱스를 로드해 DB와 맞추고, 파일이 없으면 DB의 임베딩으로 구축합니다.
+
+        파일 저장 이후 DB에 추가된 스크립트는 인덱스에 넣고, DB에 없는 ID는 뺍니다.
+        DB를 읽는 동안 add/remove가 인덱스를 바꾸면 그 변경이 읽은 DB에 없을 수
+        있으므로, 바뀐 인덱스를 덮어쓰지 않고 DB를 다시 읽어 맞춥니다.
+
+        Returns:
+            인덱스에 포함된 스크립트 수
+        """
+        loaded = await asyncio.to_thread(self._read_index)
+        while True:
+            generation = self._generation
+            vectors, script_ids = await self._load_embeddings(script_repo)
+            # 다시 읽을 때 새 스냅샷을 보도록 읽기 트랜잭션 종료
+            await script_repo.db.commit()
+            changed = await asyncio.to_thread(
+                self._install_index, loaded, vectors, script_ids, generation
             )
-            self.model.eval()
+            if changed is not None:
+                break
+
+        if changed:
+            await asyncio.to_thread(self.save_index)
+        self.index_loaded = True
+        return self.index.ntotal if self.index is not None else 0
+
+    def _install_index(
+        self, loaded, vectors: np.ndarray, script_ids: np.ndarray, generation: int
+    ) -> Optional[bool]:
+        """
+        로드한 인덱스(없으면 DB 임베딩으로 만든 인덱스)를 DB와 맞춰 교체합니다.
+
+        Returns:
+            인덱스를 DB에 맞게 바꿨으면 True, 그대로 썼으면 False,
+            DB를 읽은 뒤 add/remove가 있었으면 교체하지 않고 None
+        """
+        with self._write_lock:
+            if self._generation != generation:
+                return None
+
+            if loaded is None:
+                if len(script_ids) == 0:
+                    index = None
+                else:
+                    index = vector_index.create_index(
+                        vector_index.target_index_type(len(script_ids)),
+                        vectors,
+                        script_ids,
+                    )
+                changed = index is not None
+            else:
+                indexed = vector_index.get_ids(loaded)
+                stale = indexed[~np.isin(indexed, script_ids)]
+                missing = ~np.isin(script_ids, indexed)
+                index = vector_index.remove(loaded, stale)
+                index = vector_index.upsert(
+                    index, vectors[missing], script_ids[missing]
+                )
+                changed = bool(len(stale) or missing.any())
+
+            self._swap_index(index)
+            return changed
 
     async def generate_embedding(self, text: str) -> np.ndarray:
         """
@@ -38,6 +188,8 @@ class EmbeddingService:
         Returns:
             numpy 배열로 된 임베딩 벡터
         """
+        import torch
+
         await self.load_model()
 
         inputs = self.tokenizer(
@@ -51,52 +203,359 @@ class EmbeddingService:
 
         return embeddings.squeeze().numpy()
 
+    def _embed_batch(self, input_ids: List[List[int]]) -> np.ndarray:
+        return _embed_batch(self.tokenizer, self.model, input_ids)
+
+    async def generate_embeddings(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        여러 텍스트의 임베딩을 길이별로 묶어 일괄 생성합니다.
+
+        토큰 길이로 정렬한 뒤 배치를 나누므로 패딩 낭비가 적습니다.
+
+        Args:
+            texts: 입력 텍스트 리스트
+            batch_size: 한 번의 forward pass에 넣을 텍스트 수
+
+        Returns:
+            입력 순서와 같은 (len(texts), dim) 임베딩 행렬
+        """
+        await self.load_model()
+
+        if batch_size is None:
+            batch_size = settings.embedding_batch_size
+
+        encoded = self.tokenizer(texts, truncation=True, max_length=512)["input_ids"]
+        order = sorted(range(len(texts)), key=lambda i: len(encoded[i]))
+
+        result = None
+        for start in range(0, len(order), batch_size):
+            positions = order[start : start + batch_size]
+            batch = await asyncio.to_thread(
+                self._embed_batch, [encoded[i] for i in positions]
+            )
+            if result is None:
+                result = np.empty((len(texts), batch.shape[1]), dtype=np.float32)
+            result[positions] = batch
+
+        if result is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return result
+
     def build_index(self, embeddings: List[np.ndarray], script_ids: List[int]):
         """
-        임베딩으로부터 FAISS 인덱스를 구축합니다.
+        임베딩으로부터 FAISS 인덱스를 처음부터 구축합니다.
+
+        인덱스 타입은 faiss_index_type 설정과 벡터 수로 결정됩니다.
+
+        Args:
+            embeddings: 임베딩 벡터 리스트
+            script_ids: 대응하는 스크립트 ID들
+        """
+        if len(embeddings) == 0:
+            return
+
+        vectors = np.asarray(embeddings, dtype="float32")
+        ids = np.array(script_ids, dtype="int64")
+        index = vector_index.create_index(
+            vector_index.target_index_type(len(vectors)), vectors, ids
+        )
+
+        self._swap_index(index)
+
+    def _swap_index(self, index):
+        with self._lock:
+            self.index = index
+
+    async def add(self, embeddings: List[np.ndarray], script_ids: List[int]):
+        """
+        인덱스에 임베딩을 추가합니다. 이미 있는 스크립트 ID는 교체합니다.
+
+        auto 모드에서 벡터 수가 faiss_ann_threshold를 넘으면 ANN 인덱스로 전환합니다.
+        학습/재구축이 필요할 수 있으므로 스레드에서 실행합니다.
 
         Args:
             embeddings: 임베딩 벡터 리스트
             script_ids: 대응하는 스크립트 ID들
         """
+        if len(embeddings) == 0:
+            return
+
+        vectors = np.asarray(embeddings, dtype="float32")
+        ids = np.array(script_ids, dtype="int64")
+        await asyncio.to_thread(self._add_sync, vectors, ids)
+        self.schedule_save()
+
+    def _add_sync(self, vectors: np.ndarray, ids: np.ndarray):
+        with self._write_lock:
+            self._generation += 1
+            if self.index is None:
+                self._swap_index(
+                    vector_index.create_index(
+                        vector_index.target_index_type(len(vectors)), vectors, ids
+                    )
+                )
+                return
+
+            if not vector_index.supports_removal(self.index):
+                if vector_index.contains_any(self.index, ids):
+                    # HNSW는 제거를 지원하지 않으므로 교체되는 벡터를 뺀 그래프를 새로 만듦
+                    self._swap_index(vector_index.upsert(self.index, vectors, ids))
+                    return
+            else:
+                with self._lock:
+                    self.index.remove_ids(ids)
+
+            with self._lock:
+                self.index.add_with_ids(vectors, ids)
+                current_type = vector_index.index_type_of(self.index)
+                target_type = vector_index.target_index_type(self.index.ntotal)
+                snapshot = None
+                if current_type == "flat" and target_type != "flat":
+                    snapshot = vector_index.get_vectors(self.index)
+
+            if snapshot is not None:
+                # 학습은 검색 잠금 밖에서 수행하고 끝나면 교체
+                self._swap_index(vector_index.create_index(target_type, *snapshot))
+
+    async def remove(self, script_ids: List[int]):
+        """
+        인덱스에서 스크립트 임베딩을 제거합니다.
+
+        Args:
+            script_ids: 제거할 스크립트 ID들
+        """
+        if self.index is None or not script_ids:
+            return
+
+        await asyncio.to_thread(self._remove_sync, np.array(script_ids, dtype="int64"))
+        self.schedule_save()
+
+    def _remove_sync(self, ids: np.ndarray):
+        """
+        인덱스에서 ID를 제거합니다.
+
+        HNSW는 제거를 지원하지 않으므로, 있는 ID일 때만 남은 벡터로 그래프를
+        다시 만듭니다.
+        """
+        with self._write_lock:
+            self._generation += 1
+            if vector_index.supports_removal(self.index):
+                with self._lock:
+                    self.index.remove_ids(ids)
+                return
+
+            self._swap_index(vector_index.remove(self.index, ids))
+
+    @staticmethod
+    async def _load_embeddings(
+        script_repo: ScriptRepository,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """DB에 저장된 모든 스크립트 임베딩을 (벡터, ID)로 가져옵니다."""
+        scripts = await script_repo.get_all_with_embeddings()
+
+        embeddings = []
+        script_ids = []
+        for script in scripts:
+            if script.embedding:
+                embeddings.append(np.frombuffer(script.embedding, dtype=np.float32))
+                script_ids.append(script.id)
+
         if not embeddings:
+            return np.empty((0, 0), dtype="float32"), np.empty(0, dtype="int64")
+        return np.vstack(embeddings), np.array(script_ids, dtype="int64")
+
+    async def rebuild_index(self, script_repo: ScriptRepository) -> int:
+        """
+        저장된 모든 임베딩으로 인덱스를 다시 만들고 즉시 저장합니다.
+
+        삽입 시에는 add를 사용하며, 이 메서드는 유지보수용 전체 재구축입니다.
+        IVF 계열은 이때 저장된 임베딩의 샘플로 다시 학습합니다.
+
+        Returns:
+            인덱스에 포함된 스크립트 수
+        """
+        vectors, script_ids = await self._load_embeddings(script_repo)
+
+        if len(script_ids) == 0:
+            self._swap_index(None)
+            return 0
+
+        await asyncio.to_thread(self.build_index, vectors, script_ids)
+        await asyncio.to_thread(self.save_index)
+        return len(script_ids)
+
+    async def index_report(
+        self, script_repo: ScriptRepository, k: int = 10, num_queries: int = 200
+    ) -> dict:
+        """
+        현재 인덱스의 recall@k와 검색 지연을 정확한 flat 인덱스와 비교합니다.
+
+        Returns:
+            recall과 쿼리당 평균 지연(ms)을 담은 딕셔너리
+        """
+        vectors, script_ids = await self._load_embeddings(script_repo)
+        if self.index is None or len(script_ids) == 0:
+            raise ValueError("FAISS index is empty")
+
+        def evaluate():
+            with self._write_lock:
+                return vector_index.evaluate_recall(
+                    self.index, vectors, script_ids, k, num_queries
+                )
+
+        return await asyncio.to_thread(evaluate)
+
+    async def quantization_report(
+        self, script_repo: ScriptRepository, k: int = 10, num_queries: int = 200
+    ) -> dict:
+        """
+        int8 양자화 모델의 속도와 정확도를 fp32 모델과 비교합니다.
+
+        저장된 스크립트 중 num_queries개를 두 모델로 한 건씩 임베딩하여 텍스트당
+        시간을 재고, 각 임베딩으로 저장된 임베딩을 검색했을 때 상위 k개 이웃이
+        얼마나 겹치는지(neighbour overlap)와 두 벡터의 코사인 유사도를 계산합니다.
+
+        Returns:
+            overlap, 코사인 유사도, 텍스트당 지연(ms)을 담은 딕셔너리
+        """
+        vectors, script_ids = await self._load_embeddings(script_repo)
+        if len(script_ids) == 0:
+            raise ValueError("No stored script embeddings")
+
+        rng = np.random.default_rng(0)
+        sample = rng.choice(
+            script_ids, min(num_queries, len(script_ids)), replace=False
+        )
+        texts = list((await script_repo.get_texts(sample.tolist())).values())
+
+        return await asyncio.to_thread(self._compare_quantization, texts, vectors, k)
+
+    def _compare_quantization(
+        self, texts: List[str], vectors: np.ndarray, k: int
+    ) -> dict:
+        import torch
+
+        if settings.embedding_threads > 0:
+            torch.set_num_threads(settings.embedding_threads)
+
+        tokenizer, fp32 = _load_model("none")
+        models = {"fp32": fp32, "int8": _quantize_int8(fp32)}
+        encoded = tokenizer(texts, truncation=True, max_length=512)["input_ids"]
+
+        embeddings = {}
+        ms_per_text = {}
+        for name, model in models.items():
+            # 요청 경로와 같이 한 건씩 임베딩 (첫 실행은 커널 초기화로 제외)
+            _embed_batch(tokenizer, model, encoded[:1])
+            start = time.perf_counter()
+            embeddings[name] = np.vstack(
+                [_embed_batch(tokenizer, model, [ids]) for ids in encoded]
+            ).astype("float32")
+            ms_per_text[name] = (time.perf_counter() - start) * 1000 / len(encoded)
+
+        overlap = vector_index.neighbour_overlap(
+            vectors, embeddings["fp32"], embeddings["int8"], k
+        )
+        reference, candidate = embeddings["fp32"], embeddings["int8"]
+        cosine = (reference * candidate).sum(axis=1) / np.maximum(
+            np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1),
+            1e-12,
+        )
+
+        return {
+            "queries": len(encoded),
+            "k": min(k, len(vectors)),
+            "threads": torch.get_num_threads(),
+            "neighbour_overlap": round(float(overlap.mean()), 4),
+            "min_neighbour_overlap": round(float(overlap.min()), 4),
+            "mean_cosine": round(float(cosine.mean()), 6),
+            "fp32_ms_per_text": round(ms_per_text["fp32"], 3),
+            "int8_ms_per_text": round(ms_per_text["int8"], 3),
+            "speedup": round(ms_per_text["fp32"] / max(ms_per_text["int8"], 1e-9), 2),
+        }
+
+    def schedule_save(self):
+        """
+        인덱스를 디스크에 저장하도록 예약합니다.
+
+        짧은 시간 안의 여러 변경은 faiss_save_delay 후 한 번의 저장으로 묶입니다.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖(관리 스크립트 등)에서는 바로 저장
+            self.save_index()
             return
 
-        dimension = embeddings[0].shape[0]
-        self.index = faiss.IndexFlatL2(dimension)
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._save_later())
 
-        embeddings_matrix = np.array(embeddings).astype("float32")
-        self.index.add(embeddings_matrix)
-        self.script_ids = script_ids
+    async def _save_later(self):
+        await asyncio.sleep(settings.faiss_save_delay)
+        while self._dirty:
+            self._dirty = False
+            await asyncio.to_thread(self.save_index)
+
+    def flush(self):
+        """예약된 저장이 있으면 즉시 저장합니다. (종료 시 호출)"""
+        if self._save_task is not None and not self._save_task.done():
+            self._save_task.cancel()
+        if self._dirty:
+            self._dirty = False
+            self.save_index()
 
     def save_index(self):
-        """FAISS 인덱스를 디스크에 저장합니다."""
-        if self.index is None:
-            return
+        """
+        FAISS 인덱스를 디스크에 원자적으로 저장합니다.
+
+        쓰는 동안 add/remove만 기다리게 하고 검색은 계속 처리합니다.
+        """
+        faiss = vector_index.load_faiss()
 
         index_path = Path(settings.faiss_index_path)
-        faiss.write_index(self.index, str(index_path))
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(".tmp")
+
+        with self._write_lock:
+            if self.index is None:
+                return
+            faiss.write_index(self.index, str(tmp_path))
+        os.replace(tmp_path, index_path)
+
+    def load_index(self) -> bool:
+        """디스크로부터 FAISS 인덱스를 로드합니다. 파일이 없으면 False"""
+        index = self._read_index()
+        if index is None:
+            return False
 
-        # 스크립트 ID 매핑 저장
-        ids_path = index_path.with_suffix(".pkl")
-        with open(ids_path, "wb") as f:
-            pickle.dump(self.script_ids, f)
+        self._swap_index(index)
+        return True
+
+    def _read_index(self):
+        """저장된 FAISS 인덱스 파일을 읽습니다. 파일이 없으면 None"""
+        faiss = vector_index.load_faiss()
 
-    def load_index(self):
-        """디스크로부터 FAISS 인덱스를 로드합니다."""
         index_path = Path(settings.faiss_index_path)
         if not index_path.exists():
-            return False
+            return None
 
-        self.index = faiss.read_index(str(index_path))
+        index = faiss.read_index(str(index_path))
 
-        # 스크립트 ID 매핑 로드
+        # 이전 형식: 위치 기반 인덱스 + 스크립트 ID 목록 pickle
         ids_path = index_path.with_suffix(".pkl")
-        if ids_path.exists():
+        if not isinstance(index, faiss.IndexIDMap) and ids_path.exists():
             with open(ids_path, "rb") as f:
-                self.script_ids = pickle.load(f)
+                script_ids = pickle.load(f)
+            vectors = index.reconstruct_n(0, index.ntotal)
+            index = vector_index.create_index(
+                "flat", vectors, np.array(script_ids, dtype="int64")
+            )
 
-        return True
+        vector_index.apply_search_params(index)
+        return index
 
     async def find_similar(
         self, text: str, top_k: int = None
@@ -120,15 +579,17 @@ class EmbeddingService:
         query_embedding = await self.generate_embedding(text)
         query_embedding = query_embedding.reshape(1, -1).astype("float32")
 
-        distances, indices = self.index.search(query_embedding, top_k + 1)
+        with self._lock:
+            distances, ids = self.index.search(query_embedding, top_k + 1)
 
         results = []
-        for idx, distance in zip(indices[0], distances[0]):
-            if idx < len(self.script_ids):
-                script_id = self.script_ids[idx]
-                # L2 거리를 유사도 점수로 변환 (0-100)
-                similarity = max(0, 100 - float(distance))
-                results.append((script_id, round(similarity, 2)))
+        for script_id, distance in zip(ids[0], distances[0]):
+            # 결과가 top_k보다 적으면 -1로 채워짐
+            if script_id < 0:
+                continue
+            # L2 거리를 유사도 점수로 변환 (0-100)
+            similarity = max(0, 100 - float(distance))
+            results.append((int(script_id), round(similarity, 2)))
 
         return results
 
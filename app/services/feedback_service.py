@@ -1,16 +1,34 @@
+import hashlib
+import os
+import re
+import uuid
 from pathlib import Path
-from typing import List
+from typing import Awaitable, Callable, List, Optional
 
 import aiofiles
+import numpy as np
 from fastapi import UploadFile
 
+from app.core.audio import encode_wav
 from app.core.config import settings
-from app.core.evaluator import PronunciationEvaluator
+from app.core.evaluator import PronunciationEvaluator, WordScore
+from app.models.feedback import ScoringMode
+from app.models.script import Script
+from app.models.submission_job import JobStatus
 from app.repositories.feedback_repository import FeedbackRepository
 from app.repositories.script_repository import ScriptRepository
 from app.schemas.feedback import SimilarScript
 from app.services.embedding_service import embedding_service
+from app.services.silence_trimmer import silence_trimmer
+from app.services.speech_recognizer import SpeechRecognizer
 from app.services.stt_service import stt_service
+from app.services.transcription_cache import transcription_cache
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class FileTooLargeError(Exception):
+    """업로드 파일이 허용 크기를 넘을 때 발생합니다."""
 
 
 class FeedbackService:
@@ -18,29 +36,96 @@ class FeedbackService:
         self,
         script_repo: ScriptRepository,
         feedback_repo: FeedbackRepository,
+        recognizer: Optional[SpeechRecognizer] = None,
     ):
         self.script_repo = script_repo
         self.feedback_repo = feedback_repo
+        # 기본값은 settings.stt_engine으로 선택된 엔진
+        self.recognizer = recognizer or stt_service
         self.evaluator = PronunciationEvaluator()
 
-    async def save_audio_file(self, file: UploadFile) -> str:
+    async def save_audio_file(
+        self, file: UploadFile, chunks: Optional[List[bytes]] = None
+    ) -> str:
         """
-        업로드된 오디오 파일을 디스크에 저장합니다.
+        업로드된 오디오 파일을 청크 단위로 디스크에 저장합니다.
+
+        내용의 SHA-256 해시를 계산하면서 임시 파일에 기록한 뒤, 해시 기반
+        파일명으로 원자적으로 이동합니다. 같은 이름의 업로드가 서로 덮어쓰지
+        않고, chunks를 넘기지 않으면 업로드당 메모리 사용량이 일정하게 유지됩니다.
 
         Args:
             file: 업로드된 오디오 파일
+            chunks: 주어지면 받은 청크를 여기에도 모아, 저장한 파일을 다시 읽지
+                않고 메모리에서 디코딩할 수 있게 함
 
         Returns:
             저장된 파일 경로
+
+        Raises:
+            FileTooLargeError: 파일 크기가 max_file_size를 넘을 때
         """
+        if file.size is not None and file.size > settings.max_file_size:
+            raise FileTooLargeError(
+                f"File exceeds maximum size of {settings.max_file_size} bytes"
+            )
+
         upload_dir = Path(settings.upload_dir)
         upload_dir.mkdir(parents=True, exist_ok=True)
 
-        file_path = upload_dir / f"{file.filename}"
+        # 클라이언트 파일명은 확장자만 사용
+        suffix = Path(file.filename or "").suffix.lower()
+        if not re.fullmatch(r"\.[a-z0-9]{1,8}", suffix):
+            suffix = ""
+
+        tmp_path = upload_dir / f".{uuid.uuid4().hex}.part"
+        digest = hashlib.sha256()
+        size = 0
+
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > settings.max_file_size:
+                        raise FileTooLargeError(
+                            f"File exceeds maximum size of {settings.max_file_size} bytes"
+                        )
+                    digest.update(chunk)
+                    await f.write(chunk)
+                    if chunks is not None:
+                        chunks.append(chunk)
+
+            file_path = upload_dir / f"{digest.hexdigest()}{suffix}"
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return str(file_path)
+
+    async def save_recording(self, audio: np.ndarray) -> str:
+        """
+        스트리밍으로 받은 16kHz 오디오를 WAV로 저장합니다.
+
+        save_audio_file과 같이 내용 해시를 파일명으로 사용합니다.
 
-        async with aiofiles.open(file_path, "wb") as f:
-            content = await file.read()
-            await f.write(content)
+        Returns:
+            저장된 파일 경로
+        """
+        data = encode_wav(audio)
+
+        upload_dir = Path(settings.upload_dir)
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        file_path = upload_dir / f"{hashlib.sha256(data).hexdigest()}.wav"
+        tmp_path = upload_dir / f".{uuid.uuid4().hex}.part"
+
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return str(file_path)
 
@@ -56,34 +141,165 @@ class FeedbackService:
             피드백 데이터와 유사 스크립트가 담긴 딕셔너리
         """
         # 원본 스크립트 가져오기
+        script = await self.get_script(script_id)
+
+        # 오디오 파일 저장 (받은 바이트는 디스크에서 다시 읽지 않고 바로 디코딩)
+        chunks: List[bytes] = []
+        audio_path = await self.save_audio_file(audio_file, chunks)
+
+        return await self.evaluate_submission(
+            script, audio_path, audio_data=b"".join(chunks)
+        )
+
+    @staticmethod
+    def audio_content_hash(audio_path: str) -> str:
+        """
+        저장된 오디오의 내용 해시를 반환합니다.
+
+        save_audio_file은 파일을 SHA-256 이름으로 저장하므로 파일명에서 얻습니다.
+        """
+        return Path(audio_path).stem
+
+    def decoding_options(self, prompt: Optional[str] = None) -> dict:
+        """인식 엔진과 전처리(VAD) 옵션을 합친 STT 결과 캐시 키 옵션입니다."""
+        options = {**self.recognizer.decoding_options(), **silence_trimmer.options()}
+        if prompt is not None:
+            options["prompt"] = {
+                "text": prompt,
+                "token_margin": settings.stt_prompt_token_margin,
+            }
+        return options
+
+    @staticmethod
+    def script_prompt(script: Script) -> Optional[str]:
+        """stt_script_prompt가 켜져 있으면 스크립트 문장을 디코딩 프롬프트로 반환합니다."""
+        return script.text if settings.stt_script_prompt else None
+
+    async def transcribe(
+        self,
+        audio_path: str,
+        prompt: Optional[str] = None,
+        audio_data: Optional[bytes] = None,
+    ) -> str:
+        """
+        STT 결과 캐시를 먼저 확인하고, 없을 때만 무음 제거 후 STT를 수행합니다.
+
+        Args:
+            audio_path: 저장된 오디오 파일 경로
+            prompt: 스크립트 조건부 디코딩에 사용할 기대 문장
+            audio_data: 저장한 파일의 내용 (주어지면 파일 대신 이 바이트를 디코딩)
+
+        Returns:
+            변환된 텍스트
+        """
+        cache_key = transcription_cache.make_key(
+            self.audio_content_hash(audio_path), self.decoding_options(prompt)
+        )
+        recognized_text = await transcription_cache.get(cache_key)
+        if recognized_text is not None:
+            return recognized_text
+
+        audio = await silence_trimmer.process(
+            audio_path if audio_data is None else audio_data
+        )
+        recognized_text = await self.recognizer.transcribe(audio, prompt)
+        await transcription_cache.set(cache_key, recognized_text)
+        return recognized_text
+
+    async def get_script(self, script_id: int) -> Script:
+        """
+        제출 대상 스크립트를 가져옵니다.
+
+        Raises:
+            ValueError: 스크립트가 존재하지 않을 때
+        """
         script = await self.script_repo.get_by_id(script_id)
+        # 업로드 저장/STT 동안 단일 쓰기 연결을 점유하지 않도록 읽기 트랜잭션 종료
+        await self.script_repo.db.commit()
         if not script:
             raise ValueError(f"Script with id {script_id} not found")
+        return script
 
-        # 오디오 파일 저장
-        audio_path = await self.save_audio_file(audio_file)
+    async def evaluate_submission(
+        self,
+        script: Script,
+        audio_path: str,
+        on_progress: Optional[Callable[[JobStatus], Awaitable[None]]] = None,
+        audio_data: Optional[bytes] = None,
+    ) -> dict:
+        """
+        저장된 오디오에 대해 STT, 평가, 피드백 저장, 유사 스크립트 검색을 수행합니다.
 
-        # STT 수행
-        recognized_text = await stt_service.transcribe(audio_path)
+        Args:
+            script: 대상 스크립트
+            audio_path: 저장된 오디오 파일 경로
+            on_progress: 단계가 바뀔 때 호출되는 콜백 (비동기 작업 모드에서 사용)
+            audio_data: 저장한 파일의 내용 (주어지면 파일 대신 이 바이트를 디코딩)
 
-        # 발음 평가
-        accuracy_score, missing_words, feedback_text = self.evaluator.evaluate(
-            script.text, recognized_text
+        Returns:
+            피드백 데이터와 유사 스크립트가 담긴 딕셔너리
+        """
+        if settings.scoring_mode == ScoringMode.FORCED_ALIGNMENT:
+            if on_progress:
+                await on_progress(JobStatus.TRANSCRIBING)
+            audio = await silence_trimmer.process(
+                audio_path if audio_data is None else audio_data
+            )
+            word_scores = await self.recognizer.score_script(audio, script.text)
+            if word_scores is not None:
+                if on_progress:
+                    await on_progress(JobStatus.EVALUATING)
+                return await self.save_alignment(script, audio_path, word_scores)
+
+        # STT 수행 (같은 오디오/옵션의 결과가 캐시에 있으면 재사용)
+        if on_progress:
+            await on_progress(JobStatus.TRANSCRIBING)
+        recognized_text = await self.transcribe(
+            audio_path, self.script_prompt(script), audio_data
         )
 
+        if on_progress:
+            await on_progress(JobStatus.EVALUATING)
+        return await self.save_evaluation(script, audio_path, recognized_text)
+
+    async def save_evaluation(
+        self, script: Script, audio_path: str, recognized_text: str
+    ) -> dict:
+        """
+        인식 결과를 평가하고 피드백을 저장한 뒤 유사 스크립트를 찾습니다.
+
+        /submit과 스트리밍 평가가 같은 경로로 결과를 저장합니다.
+
+        Args:
+            script: 대상 스크립트
+            audio_path: 저장된 오디오 파일 경로
+            recognized_text: 인식된 텍스트
+
+        Returns:
+            피드백 데이터와 유사 스크립트가 담긴 딕셔너리
+        """
+        # 발음 평가
+        (
+            accuracy_score,
+            missing_words,
+            feedback_text,
+            word_errors,
+        ) = self.evaluator.evaluate_detailed(script.text, recognized_text)
+
         # 피드백 레코드 생성
         feedback = await self.feedback_repo.create(
-            script_id=script_id,
+            script_id=script.id,
             audio_path=audio_path,
             recognized_text=recognized_text,
             accuracy_score=accuracy_score,
             missing_words=", ".join(missing_words) if missing_words else None,
             feedback_text=feedback_text,
+            word_errors=word_errors,
         )
 
         # 인식된 텍스트를 기반으로 유사 스크립트 찾기
         similar_scripts = await self.get_similar_scripts(
-            recognized_text, exclude_id=script_id
+            recognized_text, exclude_id=script.id
         )
 
         return {
@@ -95,6 +311,51 @@ class FeedbackService:
             "similar_scripts": similar_scripts,
         }
 
+    async def save_alignment(
+        self, script: Script, audio_path: str, word_scores: List[WordScore]
+    ) -> dict:
+        """
+        forced alignment 단어 점수로 평가하고 피드백을 저장한 뒤 유사 스크립트를 찾습니다.
+
+        받아쓰기를 하지 않으므로 인식 텍스트는 비워 두고, 약한 단어를 누락 단어
+        자리에 저장합니다. 유사 스크립트는 원본 문장으로 찾습니다.
+
+        Returns:
+            피드백 데이터와 유사 스크립트가 담긴 딕셔너리
+        """
+        evaluation = self.evaluator.evaluate_alignment(
+            word_scores, settings.forced_alignment_weak_log_prob
+        )
+        weak_words = ", ".join(evaluation.weak_words) if evaluation.weak_words else None
+        stored_scores = [score._asdict() for score in evaluation.word_scores]
+
+        feedback = await self.feedback_repo.create(
+            script_id=script.id,
+            audio_path=audio_path,
+            recognized_text="",
+            accuracy_score=evaluation.accuracy_score,
+            missing_words=weak_words,
+            feedback_text=evaluation.feedback_text,
+            word_errors=evaluation.word_errors,
+            scoring_mode=ScoringMode.FORCED_ALIGNMENT.value,
+            word_scores=stored_scores,
+        )
+
+        similar_scripts = await self.get_similar_scripts(
+            script.text, exclude_id=script.id
+        )
+
+        return {
+            "feedback_id": feedback.id,
+            "recognized_text": "",
+            "accuracy_score": evaluation.accuracy_score,
+            "missing_words": weak_words,
+            "feedback_text": evaluation.feedback_text,
+            "scoring_mode": ScoringMode.FORCED_ALIGNMENT.value,
+            "word_scores": stored_scores,
+            "similar_scripts": similar_scripts,
+        }
+
     async def get_similar_scripts(
         self, text: str, exclude_id: int = None
     ) -> List[SimilarScript]:
@@ -109,20 +370,27 @@ class FeedbackService:
             유사 스크립트 리스트
         """
         similar = await embedding_service.find_similar(text)
+        similar = [
+            (script_id, similarity_score)
+            for script_id, similarity_score in similar
+            if not (exclude_id and script_id == exclude_id)
+        ]
+
+        # 캐시에 없는 스크립트만 한 번의 IN 쿼리로 조회
+        texts = await self.script_repo.get_texts(
+            [script_id for script_id, _ in similar]
+        )
+        # 조회 트랜잭션이 단일 쓰기 연결을 점유하지 않도록 종료
+        await self.script_repo.db.commit()
 
-        results = []
-        for script_id, similarity_score in similar:
-            if exclude_id and script_id == exclude_id:
-                continue
-
-            script = await self.script_repo.get_by_id(script_id)
-            if script:
-                results.append(
-                    SimilarScript(
-                        id=script.id,
-                        text=script.text,
-                        similarity_score=similarity_score,
-                    )
-                )
+        results = [
+            SimilarScript(
+                id=script_id,
+                text=texts[script_id],
+                similarity_score=similarity_score,
+            )
+            for script_id, similarity_score in similar
+            if script_id in texts
+        ]
 
         return results[: settings.similar_scripts_count]
@@ -0,0 +1,225 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, ReadSessionLocal
+from app.core.evaluator import PronunciationEvaluator
+from app.models.rescore_run import RescoreRun, RescoreStatus
+from app.repositories.feedback_repository import FeedbackRepository, FeedbackScore
+from app.repositories.rescore_run_repository import RescoreRunRepository
+
+# (처리 수, 전체 수, 초당 처리 수)를 받는 진행 상황 콜백
+ProgressCallback = Callable[[int, int, float], None]
+
+# 이 프로세스에서 실행 중인 재채점 ID와 백그라운드 태스크
+_active_runs: Set[str] = set()
+_tasks: Set[asyncio.Task] = set()
+
+
+class RescoreInProgressError(Exception):
+    """같은 재채점이 이미 실행 중일 때 발생합니다."""
+
+
+async def create_rescore_run(db: AsyncSession) -> RescoreRun:
+    """
+    현재까지의 모든 피드백을 대상으로 하는 재채점 실행을 생성합니다.
+
+    이후 제출되는 피드백은 이미 새 규칙으로 채점되므로 대상에서 제외됩니다.
+    """
+    feedback_repo = FeedbackRepository(db)
+    max_id = await feedback_repo.get_max_id()
+    total = await feedback_repo.count_between(0, max_id)
+    return await RescoreRunRepository(db).create(max_feedback_id=max_id, total=total)
+
+
+def _to_scores(
+    rows: List[Tuple[int, int, object, str, str]], results: List[tuple]
+) -> List[FeedbackScore]:
+    return [
+        FeedbackScore(
+            feedback_id=feedback_id,
+            script_id=script_id,
+            created_at=created_at,
+            accuracy_score=accuracy,
+            missing_words=", ".join(missing) if missing else None,
+            feedback_text=feedback_text,
+            word_errors=word_errors,
+        )
+        for (feedback_id, script_id, created_at, _, _), (
+            accuracy,
+            missing,
+            feedback_text,
+            word_errors,
+        ) in zip(rows, results)
+    ]
+
+
+async def run_rescore(
+    run_id: str,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Optional[RescoreRun]:
+    """
+    저장된 인식 텍스트를 현재 평가 규칙으로 다시 채점합니다.
+
+    피드백을 스크립트 텍스트와 함께 ID 순서의 청크로 읽어 프로세스 풀에서
+    평가하고, 청크마다 결과와 체크포인트를 한 트랜잭션으로 커밋합니다.
+    중단되면 같은 run_id로 다시 실행하여 마지막 체크포인트부터 재개합니다.
+
+    Args:
+        run_id: create_rescore_run으로 만든 실행 ID
+        workers: 평가 프로세스 수 (기본 rescore_workers, 0이면 CPU 코어 수)
+        chunk_size: 한 번에 읽고 커밋할 피드백 수 (기본 rescore_chunk_size)
+        on_progress: 청크가 커밋될 때마다 호출되는 콜백
+
+    Returns:
+        최종 상태의 실행 기록 (없는 ID이면 None)
+
+    Raises:
+        RescoreInProgressError: 같은 실행이 이 프로세스에서 이미 진행 중일 때
+    """
+    _claim(run_id)
+    return await _run_claimed(run_id, workers, chunk_size, on_progress)
+
+
+def _claim(run_id: str):
+    """같은 실행이 동시에 두 번 진행되지 않도록 실행 ID를 선점합니다."""
+    if run_id in _active_runs:
+        raise RescoreInProgressError(f"Rescore run {run_id} is already running")
+    _active_runs.add(run_id)
+
+
+async def _run_claimed(
+    run_id: str,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> Optional[RescoreRun]:
+    try:
+        async with AsyncSessionLocal() as db:
+            run_repo = RescoreRunRepository(db)
+            run = await run_repo.get_by_id(run_id)
+            if run is None:
+                return None
+
+            try:
+                await _rescore(db, run, workers, chunk_size, on_progress)
+            except Exception as e:
+                await db.rollback()
+                await run_repo.update_status(run_id, RescoreStatus.FAILED, str(e))
+            else:
+                await run_repo.update_status(run_id, RescoreStatus.DONE)
+
+            return await run_repo.get_by_id(run_id)
+    finally:
+        _active_runs.discard(run_id)
+
+
+async def _rescore(
+    db: AsyncSession,
+    run: RescoreRun,
+    workers: Optional[int],
+    chunk_size: Optional[int],
+    on_progress: Optional[ProgressCallback],
+):
+    workers = workers or settings.rescore_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or settings.rescore_chunk_size
+
+    run_repo = RescoreRunRepository(db)
+    feedback_repo = FeedbackRepository(db)
+    await run_repo.update_status(run.id, RescoreStatus.RUNNING)
+
+    after_id = run.last_feedback_id
+    processed = run.processed
+    processed_now = 0
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        async with ReadSessionLocal() as read_db:
+            read_repo = FeedbackRepository(read_db)
+            # 워커가 쉬지 않도록 워커 수의 두 배만큼 청크를 미리 보냄
+            pending = deque()
+            exhausted = False
+
+            while pending or not exhausted:
+                while not exhausted and len(pending) < workers * 2:
+                    rows = await read_repo.get_rescore_chunk(
+                        after_id, run.max_feedback_id, chunk_size
+                    )
+                    # 긴 읽기 트랜잭션이 WAL 체크포인트를 막지 않도록 종료
+                    await read_db.commit()
+                    if not rows:
+                        exhausted = True
+                        break
+
+                    after_id = rows[-1][0]
+                    future = loop.run_in_executor(
+                        executor,
+                        PronunciationEvaluator.evaluate_batch,
+                        [row[4] for row in rows],
+                        [row[3] for row in rows],
+                    )
+                    pending.append((rows, future))
+
+                if not pending:
+                    break
+
+                # 체크포인트가 연속되도록 보낸 순서대로 커밋
+                rows, future = pending.popleft()
+                scores = _to_scores(rows, await future)
+                await feedback_repo.update_scores(scores)
+
+                processed += len(scores)
+                processed_now += len(scores)
+                rate = processed_now / (time.perf_counter() - started)
+                await run_repo.update_progress(
+                    run.id, rows[-1][0], processed, round(rate, 2)
+                )
+                if on_progress:
+                    on_progress(processed, run.total, rate)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def rebuild_mistake_counts() -> int:
+    """
+    기존 피드백 전체로부터 누락 단어 집계를 다시 계산합니다.
+
+    대부분의 피드백은 읽기 전용 연결에서 세고, 단일 쓰기 연결은 그 뒤에 제출된
+    피드백만 더 세어 집계 테이블을 교체하는 짧은 트랜잭션에서만 사용합니다.
+
+    Returns:
+        집계된 고유 단어 수
+    """
+    async with ReadSessionLocal() as read_db:
+        read_repo = FeedbackRepository(read_db)
+        max_id = await read_repo.get_max_id()
+        counts = await read_repo.count_missing_words(max_id=max_id)
+    async with AsyncSessionLocal() as db:
+        return await FeedbackRepository(db).replace_mistake_counts(counts, max_id)
+
+
+def start_rescore(run_id: str) -> asyncio.Task:
+    """
+    재채점을 백그라운드 태스크로 시작합니다.
+
+    Raises:
+        RescoreInProgressError: 같은 실행이 이미 진행 중일 때
+    """
+    _claim(run_id)
+    task = asyncio.create_task(_run_claimed(run_id))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Tuple
+
+from app.core.audio import SAMPLE_RATE, load_audio
+from app.core.config import settings
+from app.core.vad import TrimResult, trim_silence
+from app.services.speech_recognizer import AudioInput
+
+
+class SilenceTrimmer:
+    """
+    STT 전에 녹음의 앞뒤 무음과 긴 쉼을 제거하는 전처리 단계입니다.
+
+    오디오를 한 번 디코딩해 VAD를 적용한 배열을 음성 인식 엔진에 넘기며,
+    제거한 길이를 누적하여 절약된 연산량을 확인할 수 있게 합니다.
+    """
+
+    def __init__(self):
+        self.recordings = 0
+        self.input_seconds = 0.0
+        self.removed_seconds = 0.0
+
+    def options(self) -> dict:
+        """인식 결과에 영향을 주는 VAD 설정을 반환합니다. (STT 결과 캐시 키에 포함)"""
+        if not settings.vad_enabled:
+            return {}
+        return {
+            "vad": {
+                "frame_ms": settings.vad_frame_ms,
+                "energy_threshold_db": settings.vad_energy_threshold_db,
+                "zcr_threshold": settings.vad_zcr_threshold,
+                "padding_ms": settings.vad_padding_ms,
+                "max_pause_ms": settings.vad_max_pause_ms,
+            }
+        }
+
+    def _trim(self, source: AudioInput) -> Tuple[float, TrimResult]:
+        audio = load_audio(source)
+        result = trim_silence(
+            audio,
+            frame_ms=settings.vad_frame_ms,
+            energy_threshold_db=settings.vad_energy_threshold_db,
+            zcr_threshold=settings.vad_zcr_threshold,
+            padding_ms=settings.vad_padding_ms,
+            max_pause_ms=settings.vad_max_pause_ms,
+        )
+        return len(audio) / SAMPLE_RATE, result
+
+    async def process(self, source: AudioInput) -> AudioInput:
+        """
+        오디오를 디코딩하고 무음을 제거한 16kHz 모노 배열을 반환합니다.
+
+        VAD가 꺼져 있으면 입력을 그대로 반환합니다.
+        """
+        if not settings.vad_enabled:
+            return source
+
+        input_seconds, result = await asyncio.to_thread(self._trim, source)
+
+        # 카운터는 이벤트 루프에서만 갱신
+        self.recordings += 1
+        self.input_seconds += input_seconds
+        self.removed_seconds += result.removed_seconds
+        return result.audio
+
+    def stats(self) -> dict:
+        """처리한 녹음 수와 제거된 길이를 반환합니다."""
+        return {
+            "enabled": settings.vad_enabled,
+            "recordings": self.recordings,
+            "input_seconds": round(self.input_seconds, 3),
+            "removed_seconds": round(self.removed_seconds, 3),
+            "removed_ratio": (
+                round(self.removed_seconds / self.input_seconds, 4)
+                if self.input_seconds
+                else 0.0
+            ),
+        }
+
+
+silence_trimmer = SilenceTrimmer()
@@ -0,0 +1,107 @@
+import asyncio
+from typing import List, Optional, Protocol, Union
+
+import numpy as np
+
+from app.core.evaluator import PronunciationEvaluator, WordScore
+
+# 파일 경로, 오디오 파일 바이트 또는 16kHz 모노 float32 배열
+AudioInput = Union[str, bytes, np.ndarray]
+
+
+class STTBusyError(Exception):
+    """STT 작업 대기열이 가득 찼을 때 발생합니다."""
+
+
+class STTTimeoutError(Exception):
+    """STT 작업이 제한 시간 안에 끝나지 않았을 때 발생합니다."""
+
+
+class SpeechRecognizer(Protocol):
+    """
+    음성 인식 엔진 인터페이스입니다.
+
+    API와 FeedbackService는 이 인터페이스에만 의존하며, 실제 엔진은
+    settings.stt_engine으로 선택합니다. (stt_service.create_speech_recognizer)
+    """
+
+    # 모델이 로드되어 추론을 처리할 수 있는지 여부 (/ready에서 확인)
+    ready: bool
+
+    async def warm_up(self) -> None:
+        """모델을 미리 로드하고 더미 추론을 실행합니다."""
+        ...
+
+    def decoding_options(self) -> dict:
+        """변환 결과에 영향을 주는 옵션을 반환합니다. (STT 결과 캐시 키에 포함)"""
+        ...
+
+    async def transcribe(self, audio: AudioInput, prompt: Optional[str] = None) -> str:
+        """
+        오디오를 텍스트로 변환합니다.
+
+        prompt(기대 문장)를 지원하는 엔진은 이를 디코딩 조건으로 사용합니다.
+
+        Raises:
+            STTBusyError: 대기열이 가득 찼을 때
+            STTTimeoutError: 제한 시간 안에 끝나지 않았을 때
+        """
+        ...
+
+    async def score_script(
+        self, audio: AudioInput, text: str
+    ) -> Optional[List[WordScore]]:
+        """
+        인식 없이 원본 문장을 강제로 정렬하여 단어별 로그 우도를 계산합니다.
+
+        엔진이 지원하지 않거나 입력이 한 번에 채점할 수 있는 길이를 넘으면 None을
+        반환하며, 이때는 일반 변환(transcribe)으로 채점합니다.
+
+        Raises:
+            STTBusyError: 대기열이 가득 찼을 때
+            STTTimeoutError: 제한 시간 안에 끝나지 않았을 때
+        """
+        ...
+
+    def shutdown(self) -> None:
+        """워커 등 엔진이 사용하는 자원을 정리합니다."""
+        ...
+
+
+class FakeSpeechRecognizer:
+    """
+    설정된 지연 후 항상 같은 텍스트를 반환하는 엔진입니다.
+
+    모델 없이 서버 전체 경로를 부하 테스트하거나 CI에서 사용합니다.
+    """
+
+    def __init__(self, text: str, delay: float = 0.0):
+        self.text = text
+        self.delay = delay
+        self.ready = True
+
+    async def warm_up(self):
+        pass
+
+    def decoding_options(self) -> dict:
+        return {"engine": "fake", "text": self.text}
+
+    async def transcribe(self, audio: AudioInput, prompt: Optional[str] = None) -> str:
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        return self.text
+
+    async def score_script(
+        self, audio: AudioInput, text: str
+    ) -> Optional[List[WordScore]]:
+        # 모든 단어를 확률 1로 읽은 것으로 채점
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        return [
+            WordScore(word, 0.0)
+            for _, word in PronunciationEvaluator.script_words(text)
+            if word
+        ]
+
+    def shutdown(self):
+        pass
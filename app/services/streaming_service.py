@@ -0,0 +1,151 @@
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.audio import PCM_ENCODINGS, SAMPLE_RATE, decode_pcm, resample
+from app.core.config import settings
+from app.core.evaluator import PronunciationEvaluator
+from app.core.vad import frame_size, split_on_silence
+from app.models.script import Script
+from app.services.speech_recognizer import SpeechRecognizer, STTBusyError
+
+
+class RecordingTooLongError(Exception):
+    """스트리밍 녹음이 stream_max_seconds를 넘었을 때 발생합니다."""
+
+
+def _join(*texts: str) -> str:
+    # 구두점은 평가 시 제거되므로 공백으로 이어 단어가 붙지 않게 함
+    return " ".join(text for text in texts if text)
+
+
+class StreamingEvaluation:
+    """
+    말하는 동안 오디오 조각을 받아 부분 인식 결과와 중간 평가를 만드는 상태입니다.
+
+    마지막 stream_window_seconds 이하의 창만 다시 인식하고, 창이 길어지면
+    앞부분을 무음 위치에서 잘라 인식 결과를 확정합니다. 따라서 녹음이 길어져도
+    부분 결과마다 인식하는 길이가 일정합니다.
+    """
+
+    def __init__(
+        self,
+        script: Script,
+        recognizer: SpeechRecognizer,
+        sample_rate: int = SAMPLE_RATE,
+        encoding: str = "s16le",
+    ):
+        if encoding not in PCM_ENCODINGS:
+            raise ValueError(f"Unsupported PCM encoding: {encoding}")
+        if sample_rate <= 0:
+            raise ValueError(f"Invalid sample rate: {sample_rate}")
+
+        self.script = script
+        self.recognizer = recognizer
+        self.sample_rate = sample_rate
+        self.encoding = encoding
+        self.evaluator = PronunciationEvaluator()
+
+        self._chunks: List[np.ndarray] = []
+        self._samples = 0
+        # 샘플 경계에 맞지 않아 다음 조각으로 넘길 바이트
+        self._remainder = b""
+        # 확정된 인식 결과와 아직 확정되지 않은 창의 시작 위치
+        self.committed_text = ""
+        self._window_start = 0
+        self._last_partial = 0
+
+    @property
+    def audio(self) -> np.ndarray:
+        """지금까지 받은 16kHz 모노 오디오"""
+        if len(self._chunks) != 1:
+            self._chunks = [
+                np.concatenate(self._chunks) if self._chunks else np.empty(0, "float32")
+            ]
+        return self._chunks[0]
+
+    @property
+    def duration(self) -> float:
+        return self._samples / SAMPLE_RATE
+
+    def add_chunk(self, data: bytes):
+        """
+        PCM 조각을 16kHz로 변환해 버퍼에 추가합니다.
+
+        Raises:
+            RecordingTooLongError: 누적 길이가 stream_max_seconds를 넘을 때
+        """
+        data = self._remainder + data
+        width = np.dtype(PCM_ENCODINGS[self.encoding][0]).itemsize
+        usable = len(data) // width * width
+        self._remainder = data[usable:]
+
+        audio = decode_pcm(data[:usable], self.encoding)
+        if self.sample_rate != SAMPLE_RATE:
+            audio = resample(audio, self.sample_rate, SAMPLE_RATE)
+
+        if (self._samples + len(audio)) / SAMPLE_RATE > settings.stream_max_seconds:
+            raise RecordingTooLongError(
+                f"Recording exceeds {settings.stream_max_seconds} seconds"
+            )
+
+        self._chunks.append(audio)
+        self._samples += len(audio)
+
+    def has_new_audio(self) -> bool:
+        """마지막 부분 결과 이후 stream_partial_interval 이상 오디오가 쌓였는지 여부"""
+        new_samples = self._samples - self._last_partial
+        return new_samples >= settings.stream_partial_interval * SAMPLE_RATE
+
+    async def _commit(self, audio: np.ndarray):
+        """창이 stream_window_seconds를 넘으면 앞부분을 무음 위치에서 확정합니다."""
+        max_samples = int(settings.stream_window_seconds * SAMPLE_RATE)
+        while len(audio) - self._window_start > max_samples:
+            window = audio[self._window_start :]
+            [(_, end), *_] = split_on_silence(
+                window,
+                max_samples,
+                frame_size(settings.vad_frame_ms),
+                settings.vad_energy_threshold_db,
+                settings.vad_zcr_threshold,
+            )
+            text = await self.recognizer.transcribe(window[:end])
+            self.committed_text = _join(self.committed_text, text)
+            self._window_start += end
+
+    async def partial(self) -> Optional[dict]:
+        """
+        현재까지의 오디오로 부분 인식 결과와 읽은 부분의 중간 평가를 만듭니다.
+
+        STT 대기열이 가득 차면 이번 부분 결과는 건너뛰고 None을 반환합니다.
+        """
+        audio = self.audio
+        self._last_partial = len(audio)
+
+        try:
+            await self._commit(audio)
+            window_text = await self.recognizer.transcribe(audio[self._window_start :])
+        except STTBusyError:
+            return None
+
+        recognized_text = _join(self.committed_text, window_text)
+        evaluation = self.evaluator.evaluate_partial(self.script.text, recognized_text)
+        return {
+            "recognized_text": recognized_text,
+            **evaluation._asdict(),
+            "duration": round(len(audio) / SAMPLE_RATE, 2),
+        }
+
+    def finish(self) -> np.ndarray:
+        """
+        받은 전체 녹음을 반환합니다.
+
+        최종 평가는 저장한 녹음을 /submit과 같은 경로(무음 제거, STT 결과 캐시,
+        scoring_mode)로 다시 평가하므로, 부분 결과용 창 인식 결과는 사용하지 않습니다.
+
+        Raises:
+            ValueError: 받은 오디오가 없을 때
+        """
+        if self._samples == 0:
+            raise ValueError("No audio received")
+        return self.audio
@@ -1,33 +1,756 @@
-import whisper
+import asyncio
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
+
+from app.core.audio import SAMPLE_RATE, load_audio
 from app.core.config import settings
+from app.core.evaluator import PronunciationEvaluator, WordScore
+from app.core.vad import frame_size, split_on_silence
+from app.services.silence_trimmer import silence_trimmer
+from app.services.speech_recognizer import (
+    AudioInput,
+    FakeSpeechRecognizer,
+    SpeechRecognizer,
+    STTBusyError,
+    STTTimeoutError,
+)
+
+
+def _load_whisper(model_name: str, download_root: str, quantize: bool = False):
+    """
+    Whisper 모델을 로드합니다.
+
+    quantize이면 CPU에 로드한 뒤 Linear 레이어를 동적 int8 양자화합니다.
+    Whisper의 Linear는 입력 dtype으로 가중치를 변환하는 nn.Linear 하위 클래스라
+    양자화 대상 타입과 일치하지 않으므로, fp32 CPU에서 동작이 같은 nn.Linear로
+    바꾼 뒤 양자화합니다.
+
+    Raises:
+        RuntimeError: whisper.model.Linear가 forward 외의 동작을 정의할 때
+    """
+    import torch
+    import whisper
+
+    if not quantize:
+        return whisper.load_model(model_name, download_root=download_root)
+
+    # openai-whisper 20250625(requirements.txt)까지의 whisper.model.Linear는 forward에서
+    # dtype 변환만 하므로 fp32에서 nn.Linear와 같음. 다른 동작이 추가되면 클래스를
+    # 바꿀 수 없으므로 양자화하지 않고 실패
+    whisper_linear = whisper.model.Linear
+    overrides = {name for name in vars(whisper_linear) if not name.startswith("__")}
+    if overrides != {"forward"}:
+        raise RuntimeError(
+            f"Unsupported whisper {whisper.__version__}: whisper.model.Linear "
+            f"overrides {sorted(overrides)}, cannot quantize"
+        )
+
+    model = whisper.load_model(model_name, device="cpu", download_root=download_root)
+    for module in model.modules():
+        if type(module) is whisper_linear:
+            module.__class__ = torch.nn.Linear
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+# 영어 낭독에서 나올 수 있는 초당 최대 토큰 수 (짧은 녹음의 생성 길이 제한)
+_MAX_TOKENS_PER_SECOND = 8
+
+
+def _prompt_options(model, prompt: Optional[str], num_samples: int) -> dict:
+    """
+    스크립트 조건부 디코딩 옵션을 만듭니다.
+
+    기대 문장을 프롬프트로 주고, 온도 0의 greedy 디코딩만 사용하며(fallback 없음),
+    생성 토큰 수를 스크립트 토큰 수와 녹음 길이로 말할 수 있는 토큰 수 중 작은
+    값 + stt_prompt_token_margin으로 제한합니다. 프롬프트는 녹음 전체가 한 창으로
+    디코딩될 때만 사용해야 하며, 없으면 기본 디코딩 옵션(빈 딕셔너리)을 반환합니다.
+    """
+    if prompt is None:
+        return {}
+
+    import whisper
+
+    tokenizer = whisper.tokenizer.get_tokenizer(
+        model.is_multilingual,
+        num_languages=model.num_languages,
+        language="en",
+        task="transcribe",
+    )
+    expected = len(tokenizer.encode(" " + prompt.strip()))
+    spoken = math.ceil(num_samples / SAMPLE_RATE * _MAX_TOKENS_PER_SECOND)
+    return {
+        "temperature": 0.0,
+        "sample_len": min(
+            min(expected, spoken) + settings.stt_prompt_token_margin,
+            model.dims.n_text_ctx // 2,
+        ),
+    }
+
+
+# model.transcribe의 기본 fallback 기준 (이 값을 넘으면 더 높은 온도로 재시도)
+_COMPRESSION_RATIO_THRESHOLD = 2.4
+_LOGPROB_THRESHOLD = -1.0
+
+
+def _transcribe_one(model, audio: np.ndarray, prompt: Optional[str]) -> dict:
+    """
+    model.transcribe로 오디오 하나를 변환합니다.
+
+    온도 fallback과 무음 판정을 그대로 사용하며, 프롬프트는 녹음 전체가 한 창에
+    들어갈 때만 스크립트 조건부 디코딩 옵션과 함께 적용합니다.
+    """
+    import whisper
+
+    options = {}
+    if prompt is not None and len(audio) <= whisper.audio.N_SAMPLES:
+        options = {
+            "initial_prompt": prompt,
+            **_prompt_options(model, prompt, len(audio)),
+        }
+    return model.transcribe(audio, language="en", **options)
+
+
+def _transcribe_batch(
+    model, audios: List[AudioInput], prompts: Optional[List[Optional[str]]] = None
+) -> List[Union[str, Exception]]:
+    """
+    여러 오디오를 한 번의 인코더/디코더 패스로 변환합니다.
+
+    30초 이하 오디오는 log-mel 스펙트로그램을 패딩해 쌓은 뒤 일괄 디코딩하고,
+    더 긴 오디오는 슬라이딩 윈도우가 필요하므로 개별적으로 변환합니다.
+    디코딩 옵션은 배치 전체에 적용되므로 프롬프트가 같은 오디오끼리 묶어 디코딩합니다.
+    창마다 말한 부분이 다르므로 긴 오디오에는 프롬프트를 적용하지 않습니다.
+
+    일괄 디코딩은 온도 0 한 번만 수행하므로, 오디오가 하나뿐이면 처음부터
+    model.transcribe로 변환하고, 압축률/평균 로그 확률이 model.transcribe의 fallback
+    기준을 넘은 항목은 model.transcribe로 다시 변환합니다(온도 fallback과 무음 판정).
+    실패한 항목은 예외 객체로 반환하여 같은 배치의 다른 요청에 영향을 주지 않습니다.
+
+    Args:
+        model: 로드된 Whisper 모델
+        audios: 오디오 파일 경로, 파일 바이트 또는 디코딩된 배열 리스트
+        prompts: 오디오별 스크립트 프롬프트 (None이면 기본 디코딩)
+
+    Returns:
+        입력 순서와 같은 순서의 변환 텍스트(또는 예외) 리스트
+    """
+    import torch
+    import whisper
+
+    if prompts is None:
+        prompts = [None] * len(audios)
+
+    results: List[Union[str, Exception]] = [None] * len(audios)
+    # (프롬프트, 길이)별 (mel 리스트, (입력 위치, 오디오) 리스트)
+    groups: Dict[
+        Tuple[Optional[str], int], Tuple[list, List[Tuple[int, np.ndarray]]]
+    ] = {}
+
+    for i, (source, prompt) in enumerate(zip(audios, prompts)):
+        try:
+            # WAV는 ffmpeg 서브프로세스 없이 프로세스 내에서 디코딩
+            audio = load_audio(source)
+            if len(audios) == 1 or audio.shape[0] > whisper.audio.N_SAMPLES:
+                results[i] = _transcribe_one(model, audio, prompt)["text"].strip()
+                continue
+
+            mel = whisper.log_mel_spectrogram(
+                whisper.pad_or_trim(audio), n_mels=model.dims.n_mels
+            )
+            # 생성 길이 제한이 녹음 길이에 따라 다르므로 (프롬프트, 길이)별로 묶음
+            key = (prompt, len(audio) if prompt is not None else 0)
+            mels, positions = groups.setdefault(key, ([], []))
+            mels.append(mel)
+            positions.append((i, audio))
+        except Exception as e:
+            results[i] = e
+
+    for (prompt, num_samples), (mels, positions) in groups.items():
+        options = whisper.DecodingOptions(
+            language="en",
+            fp16=model.device.type != "cpu",
+            prompt=prompt,
+            **_prompt_options(model, prompt, num_samples),
+        )
+        batch = torch.stack(mels).to(model.device)
+        decoded = whisper.decode(model, batch, options)
+        for (i, audio), result in zip(positions, decoded):
+            if (
+                result.compression_ratio > _COMPRESSION_RATIO_THRESHOLD
+                or result.avg_logprob < _LOGPROB_THRESHOLD
+            ):
+                results[i] = _transcribe_one(model, audio, prompt)["text"].strip()
+            else:
+                results[i] = result.text.strip()
+
+    return results
+
+
+# 워커 프로세스마다 한 번만 로드되는 Whisper 모델
+_worker_model = None
+
+
+def _score_script(model, source: AudioInput, text: str) -> Optional[List[WordScore]]:
+    """
+    원본 문장을 디코더에 강제 입력(teacher forcing)하여 단어별 로그 우도를 계산합니다.
+
+    인코더를 한 번, 디코더를 원본 토큰 전체에 대해 한 번 실행하므로 자기회귀
+    디코딩 루프가 없습니다. 각 위치에서 다음 원본 토큰의 로그 확률을 구하고,
+    원본 조각(공백 기준)마다 토큰 로그 확률의 평균을 단어 점수로 사용합니다.
+
+    Returns:
+        평가용 단어별 로그 우도 (오디오가 30초보다 길거나 문장이 디코더 문맥보다
+        길면 None)
+    """
+    import torch
+    import whisper
+
+    audio = load_audio(source)
+    if audio.shape[0] > whisper.audio.N_SAMPLES:
+        return None
+
+    tokenizer = whisper.tokenizer.get_tokenizer(
+        model.is_multilingual,
+        num_languages=model.num_languages,
+        language="en",
+        task="transcribe",
+    )
+    prefix = list(tokenizer.sot_sequence_including_notimestamps)
+
+    # 모델 출력과 같이 단어 앞에 공백을 붙여 조각별로 토큰화
+    pieces = PronunciationEvaluator.script_words(text)
+    piece_tokens = [tokenizer.encode(" " + piece) for piece, _ in pieces]
+    content = [token for tokens in piece_tokens for token in tokens]
+    if not content or len(prefix) + len(content) > model.dims.n_text_ctx:
+        return None
+
+    mel = whisper.log_mel_spectrogram(
+        whisper.pad_or_trim(audio), n_mels=model.dims.n_mels
+    ).to(model.device)
+    tokens = torch.tensor([prefix + content], device=model.device)
+
+    with torch.no_grad():
+        audio_features = model.embed_audio(mel[None])
+        logits = model.logits(tokens, audio_features)
+        # 위치 i의 출력은 토큰 i+1의 분포
+        log_probs = torch.log_softmax(logits[0, :-1].float(), dim=-1)
+        token_log_probs = log_probs.gather(1, tokens[0, 1:, None])[:, 0].cpu().numpy()
+
+    content_log_probs = token_log_probs[len(prefix) - 1 :]
+    scores = []
+    offset = 0
+    for (_, word), tokens_of_piece in zip(pieces, piece_tokens):
+        piece_log_probs = content_log_probs[offset : offset + len(tokens_of_piece)]
+        offset += len(tokens_of_piece)
+        if word:
+            scores.append(WordScore(word, round(float(piece_log_probs.mean()), 4)))
+    return scores
+
+
+# model.transcribe의 기본 fallback 온도 간격
+_FALLBACK_TEMPERATURE_STEP = 0.2
+
+
+def _compare_script_prompt(
+    model, samples: List[Tuple[np.ndarray, str]]
+) -> Dict[str, dict]:
+    """
+    같은 오디오를 기본 디코딩과 스크립트 조건부 디코딩으로 각각 변환해 비교합니다.
+
+    두 모드 모두 model.transcribe로 변환하여, 창마다 최종 온도에서 fallback 재시도
+    횟수를, 구간 토큰 수에서 생성 토큰 수(디코딩 단계 수)를 구합니다. 서비스와
+    같이 30초를 넘는 녹음에는 프롬프트를 적용하지 않습니다.
+
+    Returns:
+        모드별 {"scores": 녹음별 정확도, "tokens": 생성 토큰 수,
+        "fallbacks": fallback 재시도 수, "seconds": 총 변환 시간}
+    """
+    # 첫 실행은 커널 초기화로 제외
+    model.transcribe(samples[0][0], language="en")
+
+    results = {}
+    for mode in ("default", "script_prompt"):
+        scores, tokens, fallbacks = [], 0, 0
+        start = time.perf_counter()
+        for audio, text in samples:
+            prompt = text if mode == "script_prompt" else None
+            result = _transcribe_one(model, audio, prompt)
+
+            windows = {}
+            for segment in result["segments"]:
+                tokens += len(segment["tokens"])
+                windows[segment["seek"]] = segment["temperature"]
+            fallbacks += sum(
+                round(temperature / _FALLBACK_TEMPERATURE_STEP)
+                for temperature in windows.values()
+            )
+            scores.append(
+                PronunciationEvaluator.calculate_accuracy(text, result["text"])
+            )
+        results[mode] = {
+            "scores": scores,
+            "tokens": tokens,
+            "fallbacks": fallbacks,
+            "seconds": time.perf_counter() - start,
+        }
+    return results
+
+
+def _init_worker(
+    model_name: str, download_root: str, num_threads: int, quantize: bool = False
+):
+    """워커 프로세스 시작 시 Whisper 모델을 한 번 로드합니다."""
+    global _worker_model
+
+    import torch
+
+    if num_threads > 0:
+        torch.set_num_threads(num_threads)
+
+    _worker_model = _load_whisper(model_name, download_root, quantize)
+
+
+def _score_script_in_worker(audio: AudioInput, text: str) -> Optional[List[WordScore]]:
+    """워커 프로세스에서 원본 문장의 단어별 로그 우도를 계산합니다."""
+    return _score_script(_worker_model, audio, text)
+
+
+def _transcribe_batch_in_worker(
+    audios: List[AudioInput], prompts: Optional[List[Optional[str]]] = None
+) -> List[Union[str, Exception]]:
+    """워커 프로세스에서 오디오 배치를 텍스트로 변환합니다."""
+    return _transcribe_batch(_worker_model, audios, prompts)
+
+
+class _BatchScheduler:
+    """
+    짧은 시간 안에 들어온 STT 요청을 모아 하나의 배치로 실행합니다.
+
+    배치가 최대 크기에 도달하거나 첫 요청 이후 최대 대기 시간이 지나면
+    즉시 실행하므로, 추가 지연은 최대 대기 시간으로 제한됩니다.
+    """
+
+    def __init__(self, run_batch):
+        self._run_batch = run_batch
+        self._waiting: List[Tuple[AudioInput, Optional[str], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, audio: AudioInput, prompt: Optional[str] = None) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiting.append((audio, prompt, future))
+
+        if len(self._waiting) >= settings.stt_max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(
+                settings.stt_max_batch_wait_ms / 1000, self._flush
+            )
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._waiting = self._waiting, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self, batch: List[Tuple[AudioInput, Optional[str], asyncio.Future]]
+    ):
+        try:
+            results = await self._run_batch(
+                [audio for audio, _, _ in batch], [prompt for _, prompt, _ in batch]
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            # 대기 중인 요청이 취소되었을 수 있음
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 
 class STTService:
-    def __init__(self):
+    """
+    Whisper 엔진입니다. (SpeechRecognizer 구현)
+
+    워커 프로세스 풀에서 모델을 실행하고, 짧은 시간 안에 들어온 요청을 배치로
+    묶습니다. quantize이면 CPU용 int8 동적 양자화 모델을 사용합니다.
+    """
+
+    def __init__(self, quantize: bool = False):
+        self.quantize = quantize
         self.model = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._batcher = _BatchScheduler(self._run_batch)
+        # 실행 중이거나 대기 중인 오디오 수 (긴 오디오는 구간 수만큼)
+        self._pending = 0
+        # 풀에 넣은 작업이 바로 빈 워커에서 시작되도록 동시 작업 수를 워커 수로 제한
+        self._slots = asyncio.Semaphore(max(settings.stt_workers, 1))
+        # 모델이 로드되어 추론을 처리할 수 있는지 여부 (/ready에서 확인)
+        self.ready = False
 
     async def load_model(self):
-        """Whisper 모델을 지연 로딩합니다."""
+        """Whisper 모델을 지연 로딩합니다. (워커 풀을 사용하지 않을 때)"""
         if self.model is None:
-            self.model = whisper.load_model(
-                settings.whisper_model, download_root=settings.whisper_cache_dir
+            self.model = await asyncio.to_thread(
+                _load_whisper,
+                settings.whisper_model,
+                settings.whisper_cache_dir,
+                self.quantize,
+            )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """STT 워커 풀을 지연 생성합니다."""
+        if self._executor is None:
+            # fork는 torch 스레드와 이벤트 루프 상태를 복제하므로 spawn을 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.stt_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    settings.whisper_model,
+                    settings.whisper_cache_dir,
+                    settings.stt_worker_threads,
+                    self.quantize,
+                ),
+            )
+        return self._executor
+
+    def _restart_pool(self, executor: ProcessPoolExecutor):
+        """
+        멈추거나 죽은 워커 풀을 정리하고 다음 작업에서 새로 만들도록 합니다.
+
+        ProcessPoolExecutor는 워커 하나만 종료할 수 없으므로 모든 워커를 종료합니다.
+        다른 워커에서 실행 중이던 작업은 BrokenProcessPool로 끝나 새 풀에서 한 번
+        다시 실행되며, 새 워커마다 모델을 다시 로드합니다.
+        """
+        if self._executor is not executor:
+            # 다른 작업이 이미 풀을 교체함
+            return
+        self._executor = None
+
+        # shutdown만으로는 실행 중인 작업이 중단되지 않으므로 워커를 직접 종료
+        # 새 워커는 모델을 다시 로드해야 함
+        self.ready = False
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    async def _run_job(self, fn, *args, timeout: Optional[float] = None):
+        """
+        워커 풀에서 작업을 실행하고 결과를 기다립니다.
+
+        동시에 풀에 넣는 작업을 워커 수로 제한하므로 작업은 풀 안에서 기다리지 않고
+        바로 실행되며, 제한 시간은 대기열에서 기다린 시간을 빼고 실행 시간에만
+        적용됩니다. 작업 시간이 제한을 넘으면 풀을 재시작하고(다른 워커의 작업도
+        중단됨), 워커가 비정상 종료되면 새 풀에서 한 번 더 시도합니다.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = timeout or settings.stt_job_timeout
+
+        async with self._slots:
+            for attempt in range(2):
+                executor = self._get_executor()
+                future = loop.run_in_executor(executor, fn, *args)
+                try:
+                    return await asyncio.wait_for(future, timeout=timeout)
+                except asyncio.TimeoutError:
+                    self._restart_pool(executor)
+                    raise STTTimeoutError(f"Transcription timed out after {timeout}s")
+                except BrokenProcessPool:
+                    self._restart_pool(executor)
+                    if attempt:
+                        raise
+
+    async def _run_batch(
+        self, audios: List[AudioInput], prompts: Optional[List[Optional[str]]] = None
+    ) -> List[Union[str, Exception]]:
+        """오디오 배치를 워커 풀(또는 워커가 없으면 스레드)에서 변환합니다."""
+        if settings.stt_workers <= 0:
+            await self.load_model()
+            results = await asyncio.to_thread(
+                _transcribe_batch, self.model, audios, prompts
+            )
+        else:
+            results = await self._run_job(_transcribe_batch_in_worker, audios, prompts)
+
+        self.ready = True
+        return results
+
+    async def warm_up(self):
+        """
+        Whisper 모델을 미리 로드하고 무음으로 더미 추론을 실행합니다.
+
+        워커 풀을 사용하면 워커 수만큼 작업을 동시에 보내 모든 워커 프로세스를
+        띄우고 각 워커의 모델 로드와 커널 초기화를 끝냅니다. 모델 다운로드가
+        포함될 수 있으므로 warmup_timeout을 적용합니다.
+        """
+        silence = [np.zeros(SAMPLE_RATE, dtype=np.float32)]
+
+        if settings.stt_workers <= 0:
+            await self.load_model()
+            await asyncio.to_thread(_transcribe_batch, self.model, silence)
+        else:
+            await asyncio.gather(
+                *(
+                    self._run_job(
+                        _transcribe_batch_in_worker,
+                        silence,
+                        timeout=settings.warmup_timeout,
+                    )
+                    for _ in range(settings.stt_workers)
+                )
             )
 
-    async def transcribe(self, audio_path: str) -> str:
+        self.ready = True
+
+    def decoding_options(self) -> dict:
+        """
+        변환 결과에 영향을 주는 모델/디코딩 옵션을 반환합니다.
+
+        STT 결과 캐시 키에 포함됩니다.
+        """
+        options = {
+            "model": settings.whisper_model,
+            "language": "en",
+            "batched": settings.stt_max_batch_size > 1,
+        }
+        if self.quantize:
+            options["quantization"] = "int8"
+        if settings.stt_split_long_audio:
+            options["segment_max_seconds"] = settings.stt_segment_max_seconds
+        return options
+
+    @staticmethod
+    def _capacity() -> int:
+        """동시에 실행 중이거나 대기할 수 있는 오디오 수 (워커 수 + 대기열 크기)"""
+        return max(settings.stt_workers, 1) + settings.stt_queue_size
+
+    def _reserve(self, count: int):
+        """
+        STT 대기열에 오디오 count개의 자리를 잡습니다.
+
+        Raises:
+            STTBusyError: 실행 중 + 대기 중 오디오 수가 한도를 넘을 때
+        """
+        if self._pending + count > self._capacity():
+            raise STTBusyError("STT queue is full")
+        self._pending += count
+
+    async def _split_long_audio(self, audio: AudioInput) -> List[AudioInput]:
+        """
+        stt_segment_max_seconds보다 긴 오디오를 무음 위치에서 구간으로 나눕니다.
+
+        파일 경로는 길이를 알기 위해 스레드에서 디코딩하며, 디코딩된 배열은
+        워커에 그대로 전달되므로 워커에서 다시 디코딩하지 않습니다.
+        """
+        if not settings.stt_split_long_audio:
+            return [audio]
+
+        audio = await asyncio.to_thread(load_audio, audio)
+        bounds = split_on_silence(
+            audio,
+            int(settings.stt_segment_max_seconds * SAMPLE_RATE),
+            frame_size(settings.vad_frame_ms),
+            settings.vad_energy_threshold_db,
+            settings.vad_zcr_threshold,
+        )
+        return [audio[start:end] for start, end in bounds]
+
+    async def _transcribe_segments(self, segments: List[AudioInput]) -> str:
+        """
+        구간들을 워커 수만큼의 연속된 묶음으로 나눠 동시에 변환하고 순서대로 잇습니다.
+
+        묶음마다 한 워커에서 배치로 디코딩하므로, 구간이 워커 수 이상이면
+        변환 시간이 대략 워커 수에 반비례합니다. 기본값인 워커 1개에서는 병렬
+        변환 없이 한 워커가 배치 크기 단위로 차례로 변환합니다.
+        """
+        groups = max(
+            settings.stt_workers,
+            -(-len(segments) // max(settings.stt_max_batch_size, 1)),
+            1,
+        )
+        batches = [
+            segments[i * len(segments) // groups : (i + 1) * len(segments) // groups]
+            for i in range(groups)
+        ]
+        results = await asyncio.gather(
+            *(self._run_batch(batch) for batch in batches if batch)
+        )
+
+        texts = []
+        for result in (text for batch in results for text in batch):
+            if isinstance(result, Exception):
+                raise result
+            texts.append(result)
+        # 구두점은 평가 시 제거되므로 구간 사이에 공백을 넣어 단어가 붙지 않게 함
+        return " ".join(text for text in texts if text)
+
+    async def transcribe(self, audio: AudioInput, prompt: Optional[str] = None) -> str:
         """
         Whisper를 사용하여 오디오 파일을 텍스트로 변환합니다.
 
+        stt_segment_max_seconds보다 긴 오디오는 무음 위치에서 나눠 여러 워커에서
+        동시에 변환한 뒤 순서대로 이어 붙입니다.
+
         Args:
-            audio_path: 오디오 파일 경로
+            audio: 오디오 파일 경로, 파일 바이트 또는 16kHz 모노 float32 배열
+            prompt: 기대 문장 (주어지면 녹음이 한 창으로 디코딩될 때 스크립트 조건부
+                디코딩)
 
         Returns:
             변환된 텍스트
         """
+        self._reserve(1)
+        reserved = 1
+        try:
+            segments = await self._split_long_audio(audio)
+            if len(segments) > 1:
+                # 구간도 워커에서 변환되는 오디오이므로 구간 수만큼 자리를 차지
+                # (한 요청이 한도 전체보다 많이 차지하면 비어 있어도 실행할 수 없음)
+                extra = min(len(segments), self._capacity()) - reserved
+                self._reserve(extra)
+                reserved += extra
+                # 구간마다 말한 부분이 다르므로 스크립트 프롬프트를 적용하지 않음
+                return await self._transcribe_segments(segments)
+            [audio] = segments
+
+            if settings.stt_max_batch_size > 1:
+                return await self._batcher.submit(audio, prompt)
+
+            [result] = await self._run_batch([audio], [prompt])
+            if isinstance(result, Exception):
+                raise result
+            return result
+        finally:
+            self._pending -= reserved
+
+    async def score_script(
+        self, audio: AudioInput, text: str
+    ) -> Optional[List[WordScore]]:
+        """
+        원본 문장을 강제 정렬하여 단어별 로그 우도를 계산합니다.
+
+        인코더/디코더를 각각 한 번만 실행하므로 배칭하지 않고 바로 워커에 보냅니다.
+        30초보다 긴 오디오는 None을 반환합니다.
+
+        Args:
+            audio: 오디오 파일 경로, 파일 바이트 또는 16kHz 모노 float32 배열
+            text: 원본 스크립트 문장
+
+        Returns:
+            평가용 단어별 로그 우도 또는 None
+        """
+        self._reserve(1)
+        try:
+            if settings.stt_workers <= 0:
+                await self.load_model()
+                return await asyncio.to_thread(_score_script, self.model, audio, text)
+            return await self._run_job(_score_script_in_worker, audio, text)
+        finally:
+            self._pending -= 1
+
+    async def script_prompt_report(self, samples: List[Tuple[AudioInput, str]]) -> dict:
+        """
+        스크립트 조건부 디코딩이 점수와 속도에 주는 영향을 기본 디코딩과 비교합니다.
+
+        저장된 (녹음, 스크립트 문장)을 서비스와 같이 무음 제거한 뒤, 현재 프로세스에
+        로드한 모델로 두 모드 모두 한 건씩 변환하여 정확도 점수, 녹음당 생성 토큰
+        수와 fallback 재시도 수, 녹음당 지연을 잽니다.
+        조건부 디코딩은 기대 문장 쪽으로 인식을 끌어당기므로 점수 상승 폭이
+        클수록 실제 오류를 가릴 가능성도 커집니다.
+
+        Returns:
+            모드별 평균 점수/지연과 점수 변화를 담은 딕셔너리
+        """
+        if not samples:
+            raise ValueError("No recordings to compare")
+
         await self.load_model()
+        trimmed = [
+            (load_audio(await silence_trimmer.process(audio)), text)
+            for audio, text in samples
+        ]
+        results = await asyncio.to_thread(_compare_script_prompt, self.model, trimmed)
+
+        default = np.array(results["default"]["scores"])
+        prompted = np.array(results["script_prompt"]["scores"])
+        change = prompted - default
+        return {
+            "recordings": len(samples),
+            "token_margin": settings.stt_prompt_token_margin,
+            "default_mean_score": round(float(default.mean()), 2),
+            "script_prompt_mean_score": round(float(prompted.mean()), 2),
+            "mean_score_change": round(float(change.mean()), 2),
+            "max_score_increase": round(float(change.max()), 2),
+            "max_score_decrease": round(float(-change.min()), 2),
+            "changed_recordings": int(np.count_nonzero(change)),
+            "default_tokens_per_recording": round(
+                results["default"]["tokens"] / len(samples), 1
+            ),
+            "script_prompt_tokens_per_recording": round(
+                results["script_prompt"]["tokens"] / len(samples), 1
+            ),
+            "default_fallbacks": results["default"]["fallbacks"],
+            "script_prompt_fallbacks": results["script_prompt"]["fallbacks"],
+            "default_ms_per_recording": round(
+                results["default"]["seconds"] * 1000 / len(samples), 1
+            ),
+            "script_prompt_ms_per_recording": round(
+                results["script_prompt"]["seconds"] * 1000 / len(samples), 1
+            ),
+        }
+
+    def shutdown(self):
+        """워커 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def create_speech_recognizer(engine: Optional[str] = None) -> SpeechRecognizer:
+    """
+    설정(stt_engine)에 맞는 음성 인식 엔진을 만듭니다.
 
-        result = self.model.transcribe(audio_path, language="en")
-        return result["text"].strip()
+    - whisper: Whisper 모델 (GPU가 있으면 GPU 사용)
+    - whisper_int8: CPU용 int8 동적 양자화 Whisper 모델
+    - fake: stt_fake_delay초 후 stt_fake_text를 반환 (부하 테스트/CI용)
+    """
+    engine = engine or settings.stt_engine
+    if engine == "whisper":
+        return STTService()
+    if engine == "whisper_int8":
+        return STTService(quantize=True)
+    if engine == "fake":
+        return FakeSpeechRecognizer(settings.stt_fake_text, settings.stt_fake_delay)
+    raise ValueError(f"Unknown STT engine: {engine}")
 
 
-stt_service = STTService()
+stt_service: SpeechRecognizer = create_speech_recognizer()
@@ -0,0 +1,133 @@
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, ReadSessionLocal
+from app.models.submission_job import JobStatus, SubmissionJob
+from app.repositories.feedback_repository import FeedbackRepository
+from app.repositories.script_repository import ScriptRepository
+from app.repositories.submission_job_repository import SubmissionJobRepository
+from app.schemas.feedback import SubmitResponse
+from app.schemas.job import SubmissionJobResponse
+from app.services.feedback_service import FeedbackService
+
+FINISHED_STATUSES = {JobStatus.DONE.value, JobStatus.FAILED.value}
+KEEP_ALIVE_INTERVAL = 15.0
+
+
+class SubmissionJobService:
+    def __init__(
+        self,
+        job_repo: SubmissionJobRepository,
+        feedback_service: FeedbackService,
+    ):
+        self.job_repo = job_repo
+        self.feedback_service = feedback_service
+
+    async def create_job(self, script_id: int, audio_file: UploadFile) -> SubmissionJob:
+        """
+        오디오를 저장하고 대기 상태의 제출 작업을 생성합니다.
+
+        Args:
+            script_id: 대상 스크립트 ID
+            audio_file: 업로드된 오디오 파일
+
+        Returns:
+            생성된 제출 작업
+        """
+        script = await self.feedback_service.get_script(script_id)
+        audio_path = await self.feedback_service.save_audio_file(audio_file)
+        return await self.job_repo.create(script_id=script.id, audio_path=audio_path)
+
+
+async def run_submission_job(job_id: str):
+    """
+    백그라운드에서 제출 작업을 실행하고 단계별 상태를 기록합니다.
+
+    요청 세션은 응답과 함께 닫히므로 작업 전용 세션을 엽니다.
+    """
+    async with AsyncSessionLocal() as db:
+        job_repo = SubmissionJobRepository(db)
+        job = await job_repo.get_by_id(job_id)
+        if not job:
+            return
+
+        feedback_service = FeedbackService(ScriptRepository(db), FeedbackRepository(db))
+
+        async def on_progress(status: JobStatus):
+            await job_repo.update_status(job_id, status)
+
+        try:
+            script = await feedback_service.get_script(job.script_id)
+            result = await feedback_service.evaluate_submission(
+                script, job.audio_path, on_progress=on_progress
+            )
+        except Exception as e:
+            await db.rollback()
+            await job_repo.update_status(job_id, JobStatus.FAILED, error=str(e))
+            return
+
+        await job_repo.update_status(
+            job_id,
+            JobStatus.DONE,
+            feedback_id=result["feedback_id"],
+            result=SubmitResponse(**result).model_dump(mode="json"),
+        )
+
+
+async def fail_interrupted_jobs() -> int:
+    """
+    이전 프로세스에서 끝나지 않은 제출 작업을 실패로 표시합니다. (시작 시 호출)
+
+    작업은 프로세스 안의 백그라운드 태스크로만 실행되므로, 서버가 중단되면
+    queued/transcribing 상태로 남은 작업을 이어서 처리할 곳이 없습니다.
+    같은 DB를 쓰는 추론 프로세스가 하나라고 가정합니다.
+
+    Returns:
+        실패로 표시한 작업 수
+    """
+    async with AsyncSessionLocal() as db:
+        return await SubmissionJobRepository(db).fail_unfinished(
+            "Interrupted by server restart"
+        )
+
+
+async def stream_job_events(job_id: str) -> AsyncIterator[str]:
+    """
+    작업 상태가 바뀔 때마다 Server-Sent-Events 메시지를 생성합니다.
+
+    작업이 완료되거나 실패하면 스트림을 종료합니다. 다른 워커 프로세스에서
+    실행 중인 작업도 추적할 수 있도록 DB를 주기적으로 조회합니다.
+    """
+    last_status = None
+    loop = asyncio.get_running_loop()
+    last_sent = loop.time()
+
+    async with ReadSessionLocal() as db:
+        job_repo = SubmissionJobRepository(db)
+
+        while True:
+            job = await job_repo.get_by_id(job_id)
+            # 다음 조회에서 새 스냅샷을 보도록 읽기 트랜잭션 종료
+            await db.commit()
+
+            if not job:
+                yield 'event: error\ndata: {"detail": "Job not found"}\n\n'
+                return
+
+            if job.status != last_status:
+                last_status = job.status
+                payload = SubmissionJobResponse.model_validate(job).model_dump_json()
+                yield f"event: status\ndata: {payload}\n\n"
+                last_sent = loop.time()
+            elif loop.time() - last_sent >= KEEP_ALIVE_INTERVAL:
+                # 프록시가 유휴 연결을 끊지 않도록 keep-alive 주석 전송
+                yield ": keep-alive\n\n"
+                last_sent = loop.time()
+
+            if job.status in FINISHED_STATUSES:
+                return
+
+            await asyncio.sleep(settings.job_poll_interval)
@@ -0,0 +1,170 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+# 디스크 계층 정리 주기 (저장 횟수 기준)
+_PRUNE_EVERY = 256
+
+
+class TranscriptionCache:
+    """
+    오디오 내용 해시 기반의 STT 결과 캐시입니다.
+
+    메모리 LRU 계층과 SQLite 영속 계층으로 구성되며, 같은 녹음을 다시 제출하면
+    Whisper를 실행하지 않고 저장된 결과를 반환합니다.
+    """
+
+    def __init__(self):
+        self.memory = LRUCache(
+            settings.transcription_cache_memory_size,
+            ttl=settings.transcription_cache_ttl,
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(audio_hash: str, options: dict) -> str:
+        """
+        오디오 해시와 모델/디코딩 옵션으로 캐시 키를 만듭니다.
+
+        Args:
+            audio_hash: 오디오 내용의 SHA-256
+            options: 결과에 영향을 주는 모델 이름과 디코딩 옵션
+
+        Returns:
+            캐시 키
+        """
+        payload = json.dumps(options, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{audio_hash}:{payload}".encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = Path(settings.transcription_cache_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS transcriptions ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_transcriptions_accessed_at "
+                "ON transcriptions (accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT text, created_at FROM transcriptions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            text, created_at = row
+            ttl = settings.transcription_cache_ttl
+            if ttl > 0 and created_at + ttl < now:
+                conn.execute("DELETE FROM transcriptions WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute(
+                "UPDATE transcriptions SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            conn.commit()
+            return text
+
+    def _disk_set(self, key: str, text: str):
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO transcriptions "
+                "(key, text, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, text, now, now),
+            )
+            self._writes += 1
+            if self._writes % _PRUNE_EVERY == 0:
+                self._prune(conn, now)
+            conn.commit()
+
+    @staticmethod
+    def _prune(conn: sqlite3.Connection, now: float):
+        """만료된 항목과 최대 개수를 넘는 오래된 항목을 삭제합니다."""
+        ttl = settings.transcription_cache_ttl
+        if ttl > 0:
+            conn.execute(
+                "DELETE FROM transcriptions WHERE created_at < ?", (now - ttl,)
+            )
+
+        conn.execute(
+            "DELETE FROM transcriptions WHERE key IN ("
+            "SELECT key FROM transcriptions ORDER BY accessed_at DESC "
+            "LIMIT -1 OFFSET ?)",
+            (settings.transcription_cache_max_entries,),
+        )
+
+    async def get(self, key: str) -> Optional[str]:
+        """캐시된 변환 결과를 가져옵니다. 없으면 None을 반환합니다."""
+        if not settings.transcription_cache_enabled:
+            return None
+
+        text = self.memory.get(key)
+        if text is not None:
+            self.memory_hits += 1
+            return text
+
+        text = await asyncio.to_thread(self._disk_get, key)
+        if text is not None:
+            self.disk_hits += 1
+            self.memory.set(key, text)
+            return text
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, text: str):
+        """변환 결과를 두 계층에 저장합니다."""
+        if not settings.transcription_cache_enabled:
+            return
+
+        self.memory.set(key, text)
+        await asyncio.to_thread(self._disk_set, key, text)
+
+    def stats(self) -> dict:
+        """캐시 적중/실패 카운터를 반환합니다."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "enabled": settings.transcription_cache_enabled,
+            "memory_entries": len(self.memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+transcription_cache = TranscriptionCache()
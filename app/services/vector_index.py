@@ -0,0 +1,332 @@
+import functools
+import importlib
+import math
+import time
+from typing import Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+# IVF 학습에 필요한 최소 벡터 수 (클러스터당 39개 권장)
+_MIN_POINTS_PER_LIST = 39
+_MIN_IVF_POINTS = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def load_faiss():
+    """
+    faiss 모듈을 처음 사용할 때 가져옵니다.
+
+    torch/whisper와 같이 무거운 의존성은 사용하는 곳에서 지연 로딩하여,
+    모델을 쓰지 않는 api 역할 서버가 시작 시 로드하지 않도록 합니다.
+    """
+    return importlib.import_module("faiss")
+
+
+def target_index_type(ntotal: int) -> str:
+    """
+    벡터 수에 맞는 인덱스 타입을 결정합니다.
+
+    auto이면 faiss_ann_threshold 이상에서 ANN 인덱스로 전환하고, IVF 계열은
+    학습할 벡터가 충분하지 않으면 flat을 사용합니다.
+    """
+    index_type = settings.faiss_index_type
+    if index_type == "auto":
+        if ntotal < settings.faiss_ann_threshold:
+            return "flat"
+        index_type = settings.faiss_ann_index_type
+
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown FAISS index type: {index_type}")
+
+    if index_type.startswith("ivf") and ntotal < _MIN_IVF_POINTS:
+        return "flat"
+    return index_type
+
+
+def index_type_of(index) -> str:
+    """인덱스 객체의 타입 이름을 반환합니다."""
+    faiss = load_faiss()
+
+    inner = _unwrap(index)
+    if isinstance(inner, faiss.IndexIVFPQ):
+        return "ivf_pq"
+    if isinstance(inner, faiss.IndexIVF):
+        return "ivf_flat"
+    if isinstance(inner, faiss.IndexHNSW):
+        return "hnsw"
+    return "flat"
+
+
+def _unwrap(index):
+    faiss = load_faiss()
+
+    if isinstance(index, faiss.IndexIDMap):
+        return faiss.downcast_index(index.index)
+    return index
+
+
+def _nlist(ntotal: int) -> int:
+    if settings.faiss_nlist > 0:
+        return settings.faiss_nlist
+    nlist = int(4 * math.sqrt(ntotal))
+    return max(1, min(nlist, ntotal // _MIN_POINTS_PER_LIST))
+
+
+def create_index(index_type: str, vectors: np.ndarray, ids: np.ndarray):
+    """
+    주어진 타입의 인덱스를 만들고 벡터를 추가합니다.
+
+    IVF 계열은 저장된 벡터 중 faiss_train_sample_size개를 샘플링하여 학습합니다.
+    모든 인덱스는 script.id를 벡터 ID로 사용합니다.
+
+    Args:
+        index_type: flat, ivf_flat, ivf_pq, hnsw 중 하나
+        vectors: (n, dim) float32 벡터
+        ids: (n,) int64 스크립트 ID
+
+    Returns:
+        FAISS 인덱스
+    """
+    faiss = load_faiss()
+
+    dimension = vectors.shape[1]
+
+    if index_type == "flat":
+        index = faiss.IndexIDMap2(faiss.IndexFlatL2(dimension))
+    elif index_type == "hnsw":
+        hnsw = faiss.IndexHNSWFlat(dimension, settings.faiss_hnsw_m)
+        hnsw.hnsw.efConstruction = settings.faiss_hnsw_ef_construction
+        index = faiss.IndexIDMap2(hnsw)
+    elif index_type in ("ivf_flat", "ivf_pq"):
+        nlist = _nlist(len(vectors))
+        quantizer = faiss.IndexFlatL2(dimension)
+        if index_type == "ivf_flat":
+            index = faiss.IndexIVFFlat(quantizer, dimension, nlist)
+        else:
+            index = faiss.IndexIVFPQ(
+                quantizer,
+                dimension,
+                nlist,
+                settings.faiss_pq_m,
+                settings.faiss_pq_nbits,
+            )
+        sample_size = min(len(vectors), settings.faiss_train_sample_size)
+        rng = np.random.default_rng(0)
+        index.train(vectors[rng.choice(len(vectors), sample_size, replace=False)])
+        # ID 기반 제거/복원을 위해 해시 direct map 사용
+        index.set_direct_map_type(faiss.DirectMap.Hashtable)
+    else:
+        raise ValueError(f"Unknown FAISS index type: {index_type}")
+
+    if len(vectors):
+        index.add_with_ids(vectors, ids)
+    apply_search_params(index)
+    return index
+
+
+def apply_search_params(index):
+    """설정의 nprobe/efSearch 값을 인덱스에 적용합니다."""
+    faiss = load_faiss()
+
+    inner = _unwrap(index)
+    if isinstance(inner, faiss.IndexIVF):
+        inner.nprobe = settings.faiss_nprobe
+    elif isinstance(inner, faiss.IndexHNSW):
+        inner.hnsw.efSearch = settings.faiss_ef_search
+
+
+def get_vectors(index) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    flat/HNSW 인덱스에서 (원본 벡터, 스크립트 ID)를 복원합니다.
+
+    flat에서 ANN으로 전환하거나 HNSW를 다시 만들 때 사용합니다.
+    """
+    faiss = load_faiss()
+
+    if not isinstance(index, faiss.IndexIDMap):
+        raise ValueError("Only ID-mapped flat/HNSW indexes can be reconstructed")
+
+    ids = faiss.vector_to_array(index.id_map).astype("int64")
+    vectors = _unwrap(index).reconstruct_n(0, index.ntotal)
+    return np.asarray(vectors, dtype="float32"), ids
+
+
+def get_ids(index) -> np.ndarray:
+    """
+    인덱스에 들어 있는 스크립트 ID를 벡터 복원 없이 가져옵니다.
+
+    flat/HNSW는 ID 매핑에서, IVF 계열은 역색인 리스트에서 읽습니다.
+    """
+    faiss = load_faiss()
+
+    if isinstance(index, faiss.IndexIDMap):
+        return faiss.vector_to_array(index.id_map).astype("int64")
+
+    invlists = faiss.extract_index_ivf(index).invlists
+    ids = [
+        faiss.rev_swig_ptr(invlists.get_ids(i), invlists.list_size(i)).copy()
+        for i in range(invlists.nlist)
+        if invlists.list_size(i) > 0
+    ]
+    return np.concatenate(ids).astype("int64") if ids else np.empty(0, "int64")
+
+
+def contains_any(index, ids: np.ndarray) -> bool:
+    """
+    인덱스에 주어진 ID 중 하나라도 있는지 확인합니다.
+
+    벡터를 복원하지 않고 ID 목록만 확인하므로, HNSW에서 그래프를 다시 만들지
+    판단할 때 사용합니다.
+    """
+    return bool(np.isin(get_ids(index), ids).any())
+
+
+def supports_removal(index) -> bool:
+    """HNSW 그래프는 벡터 제거를 지원하지 않습니다."""
+    return index_type_of(index) != "hnsw"
+
+
+def upsert(index, vectors: np.ndarray, ids: np.ndarray):
+    """
+    인덱스에 벡터를 추가하고, 이미 있는 ID는 교체합니다.
+
+    HNSW에서 교체할 ID가 있으면 그래프를 새로 만들어 반환하며, 그 외에는 주어진
+    인덱스를 직접 바꿉니다. 검색 중인 인덱스에 사용할 때는 호출하는 쪽에서 잠급니다.
+
+    Returns:
+        변경된 인덱스
+    """
+    if len(ids) == 0:
+        return index
+
+    if supports_removal(index):
+        index.remove_ids(ids)
+    elif contains_any(index, ids):
+        all_vectors, all_ids = get_vectors(index)
+        keep = ~np.isin(all_ids, ids)
+        return create_index(
+            "hnsw",
+            np.vstack([all_vectors[keep], vectors]),
+            np.concatenate([all_ids[keep], ids]),
+        )
+
+    index.add_with_ids(vectors, ids)
+    return index
+
+
+def remove(index, ids: np.ndarray):
+    """
+    인덱스에서 ID를 제거합니다.
+
+    HNSW는 제거를 지원하지 않으므로, 있는 ID일 때만 남은 벡터로 그래프를 새로
+    만들어 반환합니다.
+
+    Returns:
+        변경된 인덱스
+    """
+    if len(ids) == 0:
+        return index
+
+    if supports_removal(index):
+        index.remove_ids(ids)
+        return index
+
+    if not contains_any(index, ids):
+        return index
+    vectors, all_ids = get_vectors(index)
+    keep = ~np.isin(all_ids, ids)
+    return create_index("hnsw", vectors[keep], all_ids[keep])
+
+
+def neighbour_overlap(
+    vectors: np.ndarray, reference: np.ndarray, candidate: np.ndarray, k: int = 10
+) -> np.ndarray:
+    """
+    두 쿼리 임베딩 집합의 정확한 상위 k개 이웃이 겹치는 비율을 계산합니다.
+
+    같은 텍스트를 서로 다른 모델(예: fp32와 int8)로 임베딩했을 때 검색 결과가
+    얼마나 유지되는지 비교하는 데 사용합니다.
+
+    Args:
+        vectors: 검색 대상 (n, dim) 벡터
+        reference: 기준 쿼리 (q, dim) 벡터
+        candidate: reference와 같은 순서의 비교 쿼리 (q, dim) 벡터
+        k: 비교할 이웃 수
+
+    Returns:
+        쿼리별 0.0~1.0 겹침 비율 (q,) 배열
+    """
+    faiss = load_faiss()
+
+    exact = faiss.IndexFlatL2(vectors.shape[1])
+    exact.add(vectors)
+
+    k = min(k, len(vectors))
+    _, reference_ids = exact.search(reference, k)
+    _, candidate_ids = exact.search(candidate, k)
+
+    return np.array(
+        [
+            len(set(ref_row.tolist()) & set(cand_row.tolist())) / k
+            for ref_row, cand_row in zip(reference_ids, candidate_ids)
+        ]
+    )
+
+
+def evaluate_recall(
+    index, vectors: np.ndarray, ids: np.ndarray, k: int = 10, num_queries: int = 200
+) -> dict:
+    """
+    현재 인덱스의 recall@k와 검색 지연을 정확한 flat 인덱스와 비교합니다.
+
+    저장된 벡터 중 일부를 쿼리로 사용합니다.
+
+    Args:
+        index: 평가할 인덱스
+        vectors: 인덱스에 들어 있는 전체 원본 벡터
+        ids: vectors와 같은 순서의 스크립트 ID
+        k: 비교할 이웃 수
+        num_queries: 쿼리 수
+
+    Returns:
+        recall과 쿼리당 평균 지연(ms)을 담은 딕셔너리
+    """
+    faiss = load_faiss()
+
+    exact = faiss.IndexFlatL2(vectors.shape[1])
+    exact.add(vectors)
+
+    rng = np.random.default_rng(0)
+    num_queries = min(num_queries, len(vectors))
+    queries = vectors[rng.choice(len(vectors), num_queries, replace=False)]
+    k = min(k, len(vectors))
+
+    start = time.perf_counter()
+    _, exact_positions = exact.search(queries, k)
+    exact_ms = (time.perf_counter() - start) * 1000 / num_queries
+
+    start = time.perf_counter()
+    _, ann_ids = index.search(queries, k)
+    ann_ms = (time.perf_counter() - start) * 1000 / num_queries
+
+    # exact 결과는 위치 기준이므로 스크립트 ID로 변환
+    exact_ids = ids[exact_positions]
+
+    hits = sum(
+        len(set(ann_row.tolist()) & set(exact_row.tolist()))
+        for ann_row, exact_row in zip(ann_ids, exact_ids)
+    )
+
+    return {
+        "index_type": index_type_of(index),
+        "ntotal": int(index.ntotal),
+        "k": k,
+        "queries": num_queries,
+        "recall": round(hits / (num_queries * k), 4),
+        "exact_ms_per_query": round(exact_ms, 4),
+        "ann_ms_per_query": round(ann_ms, 4),
+    }